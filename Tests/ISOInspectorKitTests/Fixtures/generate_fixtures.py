@@ -10,6 +10,9 @@ The script supports two workflows:
   entry is downloaded, verified with SHA-256, and catalogued with an
   accompanying license text so larger regression assets can be staged outside
   of the test bundle.
+* Streaming large stress fixtures (``--stress``) for throughput and memory
+  measurements. These are written as raw binaries plus a JSON sidecar under
+  ``Distribution/Fixtures/stress`` and never enter the test bundle.
 """
 from __future__ import annotations
 
@@ -18,9 +21,14 @@ import base64
 import hashlib
 import json
 import logging
+import random
 import shutil
+import statistics
+import struct
 import sys
 import tempfile
+import time
+import tracemalloc
 import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
@@ -563,14 +571,25 @@ def build_fragmented_no_tfdt() -> bytes:
     return styp + moof + mdat
 
 
+def header_time_width(duration: int) -> int:
+    """Return the byte width of times and durations in ``mvhd``/``tkhd``/``mdhd``.
+
+    Version 0 headers store 32-bit values; version 1 (64-bit) is used only
+    when the duration does not fit, so existing fixtures stay byte-identical.
+    """
+
+    return 4 if duration <= 0xFFFF_FFFF else 8
+
+
 def build_movie_header(timescale: int, duration: int, next_track_id: int) -> bytes:
+    width = header_time_width(duration)
     payload = bytearray()
-    payload.extend((0).to_bytes(1, "big"))  # version
+    payload.extend((0 if width == 4 else 1).to_bytes(1, "big"))  # version
     payload.extend((0).to_bytes(3, "big"))  # flags
-    payload.extend((0).to_bytes(4, "big"))  # creation time
-    payload.extend((0).to_bytes(4, "big"))  # modification time
+    payload.extend((0).to_bytes(width, "big"))  # creation time
+    payload.extend((0).to_bytes(width, "big"))  # modification time
     payload.extend(timescale.to_bytes(4, "big"))
-    payload.extend(duration.to_bytes(4, "big"))
+    payload.extend(duration.to_bytes(width, "big"))
     payload.extend((0x0001_0000).to_bytes(4, "big"))  # rate 1.0
     payload.extend((0x0100).to_bytes(2, "big"))  # volume 1.0
     payload.extend(bytes(10))  # reserved
@@ -592,15 +611,18 @@ def build_movie_header(timescale: int, duration: int, next_track_id: int) -> byt
     return box("mvhd", bytes(payload))
 
 
-def build_track_header(track_id: int, duration: int, width: int = 0, height: int = 0) -> bytes:
+def build_track_header(
+    track_id: int, duration: int, width: int = 0, height: int = 0, *, flags: int = 0x0000_0007
+) -> bytes:
+    time_width = header_time_width(duration)
     payload = bytearray()
-    payload.extend((0).to_bytes(1, "big"))  # version
-    payload.extend((0x0000_0007).to_bytes(3, "big"))  # flags: enabled + in movie + in preview
-    payload.extend((0).to_bytes(4, "big"))  # creation time
-    payload.extend((0).to_bytes(4, "big"))  # modification time
+    payload.extend((0 if time_width == 4 else 1).to_bytes(1, "big"))  # version
+    payload.extend(flags.to_bytes(3, "big"))  # default: enabled + in movie + in preview
+    payload.extend((0).to_bytes(time_width, "big"))  # creation time
+    payload.extend((0).to_bytes(time_width, "big"))  # modification time
     payload.extend(track_id.to_bytes(4, "big"))
     payload.extend((0).to_bytes(4, "big"))  # reserved
-    payload.extend(duration.to_bytes(4, "big"))
+    payload.extend(duration.to_bytes(time_width, "big"))
     payload.extend((0).to_bytes(4, "big"))  # reserved
     payload.extend((0).to_bytes(4, "big"))  # reserved
     payload.extend((0).to_bytes(2, "big", signed=True))  # layer
@@ -634,13 +656,14 @@ def pack_language(code: str) -> bytes:
 
 
 def build_media_header(timescale: int, duration: int, language: str = "eng") -> bytes:
+    width = header_time_width(duration)
     payload = bytearray()
-    payload.extend((0).to_bytes(1, "big"))  # version
+    payload.extend((0 if width == 4 else 1).to_bytes(1, "big"))  # version
     payload.extend((0).to_bytes(3, "big"))  # flags
-    payload.extend((0).to_bytes(4, "big"))  # creation time
-    payload.extend((0).to_bytes(4, "big"))  # modification time
+    payload.extend((0).to_bytes(width, "big"))  # creation time
+    payload.extend((0).to_bytes(width, "big"))  # modification time
     payload.extend(timescale.to_bytes(4, "big"))
-    payload.extend(duration.to_bytes(4, "big"))
+    payload.extend(duration.to_bytes(width, "big"))
     payload.extend(pack_language(language))
     payload.extend((0).to_bytes(2, "big"))  # pre-defined
     return box("mdhd", bytes(payload))
@@ -680,14 +703,33 @@ def build_edit_list_fixture(
 ) -> bytes:
     ftyp = box("ftyp", brand_payload("isom", 0, ["isom", "iso2"]))
     mvhd = build_movie_header(movie_timescale, movie_duration, next_track_id=track_id + 1)
+    trak = build_edit_list_trak(
+        entries=entries,
+        track_id=track_id,
+        track_duration=track_duration,
+        media_timescale=media_timescale,
+        media_duration=media_duration,
+        version=version,
+    )
+    moov = box("moov", mvhd + trak)
+    return ftyp + moov
+
+
+def build_edit_list_trak(
+    *,
+    entries: list[dict],
+    track_id: int,
+    track_duration: int,
+    media_timescale: int,
+    media_duration: int,
+    version: int = 0,
+) -> bytes:
     tkhd = build_track_header(track_id, track_duration)
     mdhd = build_media_header(media_timescale, media_duration)
     elst = build_edit_list_box(entries, version=version)
     edts = box("edts", elst)
     mdia = box("mdia", mdhd)
-    trak = box("trak", tkhd + edts + mdia)
-    moov = box("moov", mvhd + trak)
-    return ftyp + moov
+    return box("trak", tkhd + edts + mdia)
 
 
 def build_edit_list_empty() -> bytes:
@@ -879,20 +921,26 @@ def write_fixture(name: str, data: bytes, media_root: Path = MEDIA) -> Path:
     return path
 
 
+TEXT_FIXTURE_BUILDERS: dict[str, Callable[[], bytes]] = {
+    "fragmented_stream_init": build_fragmented_init,
+    "dash_segment_1": build_dash_segment,
+    "fragmented_multi_trun": build_fragmented_multi_trun,
+    "fragmented_negative_offset": build_fragmented_negative_offset,
+    "fragmented_no_tfdt": build_fragmented_no_tfdt,
+    "large_mdat_placeholder": build_large_mdat,
+    "malformed_truncated": build_malformed_truncated,
+    "edit_list_empty": build_edit_list_empty,
+    "edit_list_single_offset": build_edit_list_single_offset,
+    "edit_list_multi_segment": build_edit_list_multi_segment,
+    "edit_list_rate_adjusted": build_edit_list_rate_adjusted,
+    "sample_encryption_metadata": build_sample_encryption_fragment,
+}
+
+
 def generate_text_fixtures(media_root: Path = MEDIA) -> list[Path]:
     return [
-        write_fixture("fragmented_stream_init", build_fragmented_init(), media_root),
-        write_fixture("dash_segment_1", build_dash_segment(), media_root),
-        write_fixture("fragmented_multi_trun", build_fragmented_multi_trun(), media_root),
-        write_fixture("fragmented_negative_offset", build_fragmented_negative_offset(), media_root),
-        write_fixture("fragmented_no_tfdt", build_fragmented_no_tfdt(), media_root),
-        write_fixture("large_mdat_placeholder", build_large_mdat(), media_root),
-        write_fixture("malformed_truncated", build_malformed_truncated(), media_root),
-        write_fixture("edit_list_empty", build_edit_list_empty(), media_root),
-        write_fixture("edit_list_single_offset", build_edit_list_single_offset(), media_root),
-        write_fixture("edit_list_multi_segment", build_edit_list_multi_segment(), media_root),
-        write_fixture("edit_list_rate_adjusted", build_edit_list_rate_adjusted(), media_root),
-        write_fixture("sample_encryption_metadata", build_sample_encryption_fragment(), media_root),
+        write_fixture(name, builder(), media_root)
+        for name, builder in TEXT_FIXTURE_BUILDERS.items()
     ]
 
 
@@ -977,87 +1025,2831 @@ def write_binary_fixture(name: str, data: bytes, root: Path = DEFAULT_CORRUPT_RO
     return path
 
 
+CORRUPT_FIXTURE_BUILDERS: dict[str, Callable[[], bytes]] = {
+    "empty-file.mp4": build_empty_file,
+    "truncated-size-field.mp4": build_truncated_size_field,
+    "invalid-fourcc.mp4": build_invalid_fourcc,
+    "zero-size-top-level.mp4": build_zero_size_top_level,
+    "oversized-large-size.mp4": build_oversized_large_size,
+    "uuid-invalid-size.mp4": build_uuid_invalid_size,
+    "truncated-moov.mp4": build_truncated_moov_reader,
+    "parent-truncated-child.mp4": build_parent_truncated_child,
+    "zero-length-loop.mp4": build_zero_length_loop,
+    "deep-recursion.mp4": build_deep_recursion_chain,
+}
+
+
 def generate_corrupt_fixtures(root: Path = DEFAULT_CORRUPT_ROOT) -> list[Path]:
-    fixtures: list[tuple[str, bytes]] = [
-        ("empty-file.mp4", build_empty_file()),
-        ("truncated-size-field.mp4", build_truncated_size_field()),
-        ("invalid-fourcc.mp4", build_invalid_fourcc()),
-        ("zero-size-top-level.mp4", build_zero_size_top_level()),
-        ("oversized-large-size.mp4", build_oversized_large_size()),
-        ("uuid-invalid-size.mp4", build_uuid_invalid_size()),
-        ("truncated-moov.mp4", build_truncated_moov_reader()),
-        ("parent-truncated-child.mp4", build_parent_truncated_child()),
-        ("zero-length-loop.mp4", build_zero_length_loop()),
-        ("deep-recursion.mp4", build_deep_recursion_chain()),
+    return [
+        write_binary_fixture(name, builder(), root)
+        for name, builder in CORRUPT_FIXTURE_BUILDERS.items()
     ]
-    return [write_binary_fixture(name, data, root) for name, data in fixtures]
 
 
-def build_argument_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description=(
-            "Generate deterministic fixtures and optionally download external "
-            "assets described by a manifest."
-        )
-    )
-    parser.add_argument(
-        "--manifest",
-        type=Path,
-        default=None,
-        help="Path to manifest describing remote fixtures to download.",
-    )
-    parser.add_argument(
-        "--distribution-root",
-        type=Path,
-        default=DEFAULT_DISTRIBUTION_ROOT,
-        help="Directory root for mirrored fixture binaries.",
+# ---------------------------------------------------------------------------
+# Stress fixtures
+#
+# Stress generators emit large, structurally valid files for throughput and
+# memory measurements. They are never base64-encoded into the test bundle;
+# instead they stream binary output into the distribution cache alongside a
+# JSON sidecar describing how the file was produced.
+# ---------------------------------------------------------------------------
+
+DEFAULT_STRESS_ROOT = DEFAULT_DISTRIBUTION_ROOT / "stress"
+STRESS_EXTENSION = "mp4"
+MAX_UINT32 = 0xFFFFFFFF
+
+
+@dataclass
+class StressGenerator:
+    """Registered stress fixture family."""
+
+    name: str
+    description: str
+    default_scale: int
+    factory: Callable[[int], Iterable[bytes]]
+
+
+STRESS_GENERATORS: dict[str, StressGenerator] = {}
+
+
+def stress_generator(
+    name: str, *, default_scale: int, description: str
+) -> Callable[[Callable[[int], Iterable[bytes]]], Callable[[int], Iterable[bytes]]]:
+    """Register ``factory(scale)`` as a stress fixture family called ``name``."""
+
+    def decorator(factory: Callable[[int], Iterable[bytes]]) -> Callable[[int], Iterable[bytes]]:
+        if name in STRESS_GENERATORS:
+            raise ValueError(f"Stress generator {name!r} already registered")
+        STRESS_GENERATORS[name] = StressGenerator(name, description, default_scale, factory)
+        return factory
+
+    return decorator
+
+
+def box_header(box_type: str, payload_size: int) -> bytes:
+    """Return a box header for a payload that will be streamed separately."""
+
+    if len(box_type) != 4:
+        raise ValueError("Box type must be exactly four characters")
+    if 8 + payload_size <= MAX_UINT32:
+        return (8 + payload_size).to_bytes(4, "big") + box_type.encode("ascii")
+    return (
+        (1).to_bytes(4, "big")
+        + box_type.encode("ascii")
+        + (16 + payload_size).to_bytes(8, "big")
     )
-    parser.add_argument(
-        "--license-root",
-        type=Path,
-        default=DEFAULT_LICENSE_ROOT,
-        help="Directory for mirrored license texts.",
+
+
+def iter_filler(size: int, fill: int) -> Iterator[bytes]:
+    """Yield ``size`` bytes of ``fill`` in ``BUFFER_SIZE`` pieces."""
+
+    block = bytes([fill & 0xFF]) * min(size, BUFFER_SIZE)
+    remaining = size
+    while remaining > 0:
+        piece = block if remaining >= len(block) else block[:remaining]
+        remaining -= len(piece)
+        yield piece
+
+
+def pack_uint32(values: Iterable[int]) -> bytes:
+    values = list(values)
+    return struct.pack(f">{len(values)}I", *values)
+
+
+def pack_uint64(values: Iterable[int]) -> bytes:
+    values = list(values)
+    return struct.pack(f">{len(values)}Q", *values)
+
+
+def run_length(values: Iterable[int]) -> list[tuple[int, int]]:
+    """Collapse ``values`` into ``(count, value)`` runs."""
+
+    runs: list[tuple[int, int]] = []
+    for value in values:
+        if runs and runs[-1][1] == value:
+            runs[-1] = (runs[-1][0] + 1, value)
+        else:
+            runs.append((1, value))
+    return runs
+
+
+def write_stream_fixture(
+    path: Path,
+    chunks: Iterable[bytes],
+    metadata: Optional[dict] = None,
+) -> Path:
+    """Stream ``chunks`` into ``path`` and write a ``<name>.json`` sidecar.
+
+    The sidecar records ``metadata`` together with the byte size and SHA-256 of
+    the written file so stress runs can be tied back to their inputs.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    hasher = hashlib.sha256()
+    byte_size = 0
+    with tempfile.NamedTemporaryFile(delete=False, dir=path.parent) as handle:
+        temp_path = Path(handle.name)
+        try:
+            for chunk in chunks:
+                handle.write(chunk)
+                hasher.update(chunk)
+                byte_size += len(chunk)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+    temp_path.replace(path)
+
+    sidecar = dict(metadata or {})
+    sidecar.update({"byte_size": byte_size, "sha256": hasher.hexdigest()})
+    sidecar_path = path.with_suffix(path.suffix + ".json")
+    sidecar_path.write_text(json.dumps(sidecar, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    logger.info("Wrote %s (%d bytes)", path.name, byte_size)
+    return path
+
+
+def generate_stress_fixtures(
+    names: Iterable[str],
+    root: Path = DEFAULT_STRESS_ROOT,
+    scale: Optional[int] = None,
+) -> list[Path]:
+    paths = []
+    for name in names:
+        generator = STRESS_GENERATORS[name]
+        resolved_scale = scale if scale is not None else generator.default_scale
+        path = root / f"{name}-{resolved_scale}.{STRESS_EXTENSION}"
+        metadata = stress_fixture_metadata(generator, resolved_scale)
+        paths.append(write_stream_fixture(path, generator.factory(resolved_scale), metadata))
+    return paths
+
+
+def stress_fixture_metadata(generator: StressGenerator, scale: int) -> dict:
+    return {"generator": generator.name, "scale": scale, "description": generator.description}
+
+
+# Sample tables -------------------------------------------------------------
+
+
+def build_handler_box(handler_type: str, name: str) -> bytes:
+    payload = bytearray()
+    payload.extend((0).to_bytes(4, "big"))  # pre-defined
+    payload.extend(handler_type.encode("ascii"))
+    payload.extend(bytes(12))  # reserved
+    payload.extend(name.encode("utf-8") + b"\x00")
+    return full_box("hdlr", 0, 0, bytes(payload))
+
+
+def build_video_media_header() -> bytes:
+    return full_box("vmhd", 0, 0x000001, bytes(8))
+
+
+def build_sound_media_header() -> bytes:
+    return full_box("smhd", 0, 0, bytes(4))
+
+
+def build_data_information() -> bytes:
+    url = full_box("url ", 0, 0x000001, b"")
+    dref = full_box("dref", 0, 0, (1).to_bytes(4, "big") + url)
+    return box("dinf", dref)
+
+
+def build_visual_sample_entry(
+    entry_type: str,
+    width: int,
+    height: int,
+    children: bytes = b"",
+    data_reference_index: int = 1,
+) -> bytes:
+    payload = bytearray()
+    payload.extend(bytes(6))  # reserved
+    payload.extend(data_reference_index.to_bytes(2, "big"))
+    payload.extend(bytes(16))  # pre-defined + reserved
+    payload.extend(width.to_bytes(2, "big"))
+    payload.extend(height.to_bytes(2, "big"))
+    payload.extend((0x0048_0000).to_bytes(4, "big"))  # 72 dpi horizontal
+    payload.extend((0x0048_0000).to_bytes(4, "big"))  # 72 dpi vertical
+    payload.extend(bytes(4))  # reserved
+    payload.extend((1).to_bytes(2, "big"))  # frame count
+    payload.extend(bytes(32))  # compressor name
+    payload.extend((0x0018).to_bytes(2, "big"))  # depth
+    payload.extend((0xFFFF).to_bytes(2, "big"))  # pre-defined (-1)
+    payload.extend(children)
+    return box(entry_type, bytes(payload))
+
+
+def visual_sample_entry_size(entry: bytes) -> tuple[int, int]:
+    """Return the width and height declared by a ``build_visual_sample_entry`` box."""
+
+    return struct.unpack_from(">HH", entry, 32)
+
+
+def build_sample_description_box(entries: list[bytes]) -> bytes:
+    return full_box("stsd", 0, 0, len(entries).to_bytes(4, "big") + b"".join(entries))
+
+
+def build_time_to_sample_box(entries: list[tuple[int, int]]) -> bytes:
+    flat = [value for entry in entries for value in entry]
+    return full_box("stts", 0, 0, len(entries).to_bytes(4, "big") + pack_uint32(flat))
+
+
+def build_composition_offset_box(entries: list[tuple[int, int]], version: int = 0) -> bytes:
+    payload = bytearray(len(entries).to_bytes(4, "big"))
+    signed = version == 1
+    for count, offset in entries:
+        payload.extend(count.to_bytes(4, "big"))
+        payload.extend(offset.to_bytes(4, "big", signed=signed))
+    return full_box("ctts", version, 0, bytes(payload))
+
+
+def build_sync_sample_box(sample_numbers: list[int]) -> bytes:
+    return full_box("stss", 0, 0, len(sample_numbers).to_bytes(4, "big") + pack_uint32(sample_numbers))
+
+
+def build_sample_to_chunk_box(entries: list[tuple[int, int, int]]) -> bytes:
+    flat = [value for entry in entries for value in entry]
+    return full_box("stsc", 0, 0, len(entries).to_bytes(4, "big") + pack_uint32(flat))
+
+
+def build_sample_size_box(sample_sizes: list[int]) -> bytes:
+    if sample_sizes and all(size == sample_sizes[0] for size in sample_sizes):
+        payload = sample_sizes[0].to_bytes(4, "big") + len(sample_sizes).to_bytes(4, "big")
+    else:
+        payload = (0).to_bytes(4, "big") + len(sample_sizes).to_bytes(4, "big")
+        payload += pack_uint32(sample_sizes)
+    return full_box("stsz", 0, 0, payload)
+
+
+def build_chunk_offset_box(offsets: list[int], *, use_64_bit: bool = False) -> bytes:
+    count = len(offsets).to_bytes(4, "big")
+    if use_64_bit:
+        return full_box("co64", 0, 0, count + pack_uint64(offsets))
+    return full_box("stco", 0, 0, count + pack_uint32(offsets))
+
+
+@dataclass
+class SampleTableTrack:
+    """Per-sample layout of one progressive track.
+
+    ``chunk_sample_counts`` partitions the samples into chunks in decode order;
+    the movie builder assigns each chunk a real byte range inside ``mdat``.
+    """
+
+    track_id: int
+    handler_type: str
+    timescale: int
+    sample_sizes: list[int]
+    sample_durations: list[int]
+    chunk_sample_counts: list[int]
+    composition_offsets: Optional[list[int]] = None
+    sync_samples: Optional[list[int]] = None
+
+    @property
+    def chunk_sizes(self) -> list[int]:
+        sizes = []
+        cursor = 0
+        for count in self.chunk_sample_counts:
+            sizes.append(sum(self.sample_sizes[cursor : cursor + count]))
+            cursor += count
+        return sizes
+
+    @property
+    def media_duration(self) -> int:
+        return sum(self.sample_durations)
+
+
+def make_video_track(
+    track_id: int,
+    sample_count: int,
+    *,
+    timescale: int = 30_000,
+    sample_delta: int = 1_001,
+    gop_size: int = 30,
+    chunk_pattern: tuple[int, ...] = (15, 15, 10),
+    base_sample_size: int = 48,
+    sample_size_spread: int = 64,
+    b_frames: bool = True,
+) -> SampleTableTrack:
+    """Return a deterministic video-like track with sync samples and B-frames.
+
+    Sample sizes vary per sample (key frames are larger), the chunk pattern
+    cycles so ``stsc`` carries several runs, and the composition offsets
+    follow an ``I P B B`` cadence so ``ctts`` cannot collapse to one entry.
+    """
+
+    if sample_count <= 0:
+        raise ValueError("sample_count must be positive")
+    sizes = [
+        base_sample_size * (4 if index % gop_size == 0 else 1)
+        + (index * 37) % sample_size_spread
+        for index in range(sample_count)
+    ]
+    chunks = []
+    remaining = sample_count
+    index = 0
+    while remaining > 0:
+        count = min(chunk_pattern[index % len(chunk_pattern)], remaining)
+        chunks.append(count)
+        remaining -= count
+        index += 1
+    cadence = (1, 3, 0, 0)
+    offsets = (
+        [cadence[index % len(cadence)] * sample_delta for index in range(sample_count)]
+        if b_frames
+        else None
     )
-    parser.add_argument(
-        "--corrupt-root",
-        type=Path,
-        default=DEFAULT_CORRUPT_ROOT,
-        help="Directory for generated corrupt fixture binaries.",
+    return SampleTableTrack(
+        track_id=track_id,
+        handler_type="vide",
+        timescale=timescale,
+        sample_sizes=sizes,
+        sample_durations=[sample_delta] * sample_count,
+        chunk_sample_counts=chunks,
+        composition_offsets=offsets,
+        sync_samples=list(range(1, sample_count + 1, gop_size)),
     )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Validate manifest metadata without downloading fixtures.",
+
+
+def build_sample_table_box(
+    track: SampleTableTrack,
+    chunk_offsets: list[int],
+    *,
+    use_64_bit: bool = False,
+    sample_entries: Optional[list[bytes]] = None,
+) -> bytes:
+    entries = sample_entries or [build_visual_sample_entry("mp4v", 640, 360)]
+    stsd = build_sample_description_box(entries)
+    stts = build_time_to_sample_box(run_length(track.sample_durations))
+    ctts = (
+        build_composition_offset_box(run_length(track.composition_offsets))
+        if track.composition_offsets
+        else b""
     )
-    parser.add_argument(
-        "--skip-text-fixtures",
-        action="store_true",
-        help="Skip regeneration of base64 text fixtures.",
+    stss = build_sync_sample_box(track.sync_samples) if track.sync_samples is not None else b""
+    first_chunk = 1
+    stsc_entries = []
+    for count, samples_per_chunk in run_length(track.chunk_sample_counts):
+        stsc_entries.append((first_chunk, samples_per_chunk, 1))
+        first_chunk += count
+    stsc = build_sample_to_chunk_box(stsc_entries)
+    stsz = build_sample_size_box(track.sample_sizes)
+    stco = build_chunk_offset_box(chunk_offsets, use_64_bit=use_64_bit)
+    return box("stbl", stsd + stts + ctts + stss + stsc + stsz + stco)
+
+
+def build_sample_table_trak(
+    track: SampleTableTrack,
+    chunk_offsets: list[int],
+    *,
+    movie_timescale: int,
+    use_64_bit: bool = False,
+    sample_entries: Optional[list[bytes]] = None,
+    edit_entries: Optional[list[dict]] = None,
+) -> bytes:
+    media_duration = track.media_duration
+    track_duration = media_duration * movie_timescale // track.timescale
+    if edit_entries:
+        track_duration = sum(entry["segment_duration"] for entry in edit_entries)
+    is_video = track.handler_type == "vide"
+    entries = sample_entries or [build_visual_sample_entry("mp4v", 640, 360)]
+    width, height = visual_sample_entry_size(entries[0]) if is_video else (0, 0)
+    tkhd = build_track_header(track.track_id, track_duration, width, height)
+    edts = b""
+    if edit_entries:
+        needs_64_bit = any(
+            header_time_width(int(entry["segment_duration"])) == 8
+            or not -(2**31) <= int(entry["media_time"]) < 2**31
+            for entry in edit_entries
+        )
+        edts = box("edts", build_edit_list_box(edit_entries, version=1 if needs_64_bit else 0))
+    mdhd = build_media_header(track.timescale, media_duration)
+    hdlr = build_handler_box(track.handler_type, f"Track {track.track_id}")
+    media_header = build_video_media_header() if is_video else build_sound_media_header()
+    stbl = build_sample_table_box(
+        track, chunk_offsets, use_64_bit=use_64_bit, sample_entries=entries
     )
-    parser.add_argument(
-        "--skip-corrupt-fixtures",
-        action="store_true",
-        help="Skip regeneration of corrupt binary fixtures.",
+    minf = box("minf", media_header + build_data_information() + stbl)
+    mdia = box("mdia", mdhd + hdlr + minf)
+    return box("trak", tkhd + edts + mdia)
+
+
+def iter_sample_table_movie(
+    tracks: list[SampleTableTrack],
+    *,
+    movie_timescale: int = 1_000,
+    force_co64: bool = False,
+    sample_entries: Optional[dict[int, list[bytes]]] = None,
+    edit_lists: Optional[dict[int, list[dict]]] = None,
+    movie_extras: bytes = b"",
+    moov_first: bool = True,
+    ftyp: Optional[bytes] = None,
+) -> Iterator[bytes]:
+    """Yield a progressive ``ftyp``/``moov``/``mdat`` movie for ``tracks``.
+
+    Chunks are interleaved round-robin across tracks inside a single ``mdat``
+    and every ``stco``/``co64`` entry points at the chunk's real byte range.
+    ``co64`` is used automatically when offsets exceed 32 bits. Tracks listed
+    in ``edit_lists`` carry an ``edts`` box, ``movie_extras`` is appended to
+    ``moov`` after the tracks, and ``moov_first=False`` places ``mdat`` ahead
+    of ``moov``.
+    """
+
+    ftyp = ftyp or box("ftyp", brand_payload("isom", 0x200, ["isom", "iso2", "mp41"]))
+    chunk_sizes = [track.chunk_sizes for track in tracks]
+    layout: list[tuple[int, int]] = []  # (track index, chunk size) in mdat order
+    for chunk_index in range(max(len(sizes) for sizes in chunk_sizes)):
+        for track_index, sizes in enumerate(chunk_sizes):
+            if chunk_index < len(sizes):
+                layout.append((track_index, sizes[chunk_index]))
+    payload_size = sum(size for _, size in layout)
+    mdat_header = box_header("mdat", payload_size)
+    entries = sample_entries or {}
+    edits = edit_lists or {}
+
+    def presentation_duration(track: SampleTableTrack) -> int:
+        if edits.get(track.track_id):
+            return sum(entry["segment_duration"] for entry in edits[track.track_id])
+        return track.media_duration * movie_timescale // track.timescale
+
+    def build_moov(base: int, use_64_bit: bool) -> bytes:
+        offsets: list[list[int]] = [[] for _ in tracks]
+        cursor = base
+        for track_index, size in layout:
+            offsets[track_index].append(cursor)
+            cursor += size
+        movie_duration = max(presentation_duration(track) for track in tracks)
+        next_track_id = max(track.track_id for track in tracks) + 1
+        mvhd = build_movie_header(movie_timescale, movie_duration, next_track_id)
+        traks = b"".join(
+            build_sample_table_trak(
+                track,
+                offsets[index],
+                movie_timescale=movie_timescale,
+                use_64_bit=use_64_bit,
+                sample_entries=entries.get(track.track_id),
+                edit_entries=edits.get(track.track_id),
+            )
+            for index, track in enumerate(tracks)
+        )
+        return box("moov", mvhd + traks + movie_extras)
+
+    def mdat_base(use_64_bit: bool) -> int:
+        if not moov_first:
+            return len(ftyp) + len(mdat_header)
+        return len(ftyp) + len(build_moov(0, use_64_bit)) + len(mdat_header)
+
+    use_64_bit = force_co64
+    base = mdat_base(use_64_bit)
+    if not use_64_bit and base + payload_size > MAX_UINT32:
+        use_64_bit = True
+        base = mdat_base(use_64_bit)
+
+    yield ftyp
+    if moov_first:
+        yield build_moov(base, use_64_bit)
+    yield mdat_header
+    for track_index, size in layout:
+        yield from iter_filler(size, tracks[track_index].track_id)
+    if not moov_first:
+        yield build_moov(base, use_64_bit)
+
+
+def build_sample_table_fixture(
+    sample_count: int = 1_000,
+    *,
+    track_count: int = 2,
+    force_co64: bool = False,
+) -> bytes:
+    tracks = [make_video_track(track_id, sample_count) for track_id in range(1, track_count + 1)]
+    return b"".join(iter_sample_table_movie(tracks, force_co64=force_co64))
+
+
+@stress_generator(
+    "sample-table",
+    default_scale=100_000,
+    description="Two progressive tracks with correlated stts/ctts/stss/stsc/stsz/stco tables.",
+)
+def stress_sample_table(scale: int) -> Iterator[bytes]:
+    tracks = [make_video_track(track_id, scale) for track_id in (1, 2)]
+    return iter_sample_table_movie(tracks)
+
+
+@stress_generator(
+    "sample-table-co64",
+    default_scale=100_000,
+    description="Sample-table stress movie using 64-bit co64 chunk offsets.",
+)
+def stress_sample_table_co64(scale: int) -> Iterator[bytes]:
+    tracks = [make_video_track(track_id, scale) for track_id in (1, 2)]
+    return iter_sample_table_movie(tracks, force_co64=True)
+
+
+# Edit lists ----------------------------------------------------------------
+
+EDIT_LIST_CADENCE = ("edit", "edit", "empty", "edit", "dwell", "edit", "rate")
+
+
+def make_edit_list_entries(
+    entry_count: int,
+    *,
+    movie_timescale: int = 600,
+    media_timescale: int = 48_000,
+    rate_changes: bool = True,
+) -> list[dict]:
+    """Return ``entry_count`` edits mixing the shapes seen in NLE exports.
+
+    The cadence interleaves regular edits with empty edits (``media_time`` of
+    -1), dwell edits (``media_rate_integer`` of 0) and, when ``rate_changes``
+    is set, 2x and 0.5x rate edits. Media times advance through the media
+    timeline; callers wrap them once the media duration is known.
+    """
+
+    entries: list[dict] = []
+    media_cursor = 0
+    for index in range(entry_count):
+        kind = EDIT_LIST_CADENCE[index % len(EDIT_LIST_CADENCE)]
+        if kind == "rate" and not rate_changes:
+            kind = "edit"
+        segment_duration = 300 + (index % 11) * 30
+        consumed = segment_duration * media_timescale // movie_timescale
+        if kind == "empty":
+            entries.append({"segment_duration": segment_duration, "media_time": -1})
+            continue
+        entry = {"segment_duration": segment_duration, "media_time": media_cursor}
+        if kind == "dwell":
+            entry["media_rate_integer"] = 0
+            consumed = 0
+        elif kind == "rate":
+            half_speed = (index // len(EDIT_LIST_CADENCE)) % 2 == 1
+            entry["media_rate_integer"] = 0 if half_speed else 2
+            entry["media_rate_fraction"] = 0x8000 if half_speed else 0
+            consumed = consumed // 2 if half_speed else consumed * 2
+        entries.append(entry)
+        media_cursor += consumed
+    return entries
+
+
+def build_edit_list_stress_movie(
+    entry_count: int,
+    *,
+    track_count: int = 8,
+    version: int = 0,
+    movie_timescale: int = 600,
+    media_timescale: int = 48_000,
+    rate_changes: bool = True,
+) -> bytes:
+    """Return a movie whose tracks each carry ``entry_count`` edit list entries.
+
+    Movie, track and media header durations are derived from the edits so the
+    only ``EditListValidationRule`` findings are the rate-change warnings.
+    """
+
+    traks = []
+    movie_duration = 0
+    for track_id in range(1, track_count + 1):
+        entries = make_edit_list_entries(
+            entry_count,
+            movie_timescale=movie_timescale,
+            media_timescale=media_timescale,
+            rate_changes=rate_changes,
+        )
+        track_duration = sum(entry["segment_duration"] for entry in entries)
+        played = sum(
+            entry["segment_duration"] for entry in entries if entry["media_time"] != -1
+        )
+        media_duration = (played * media_timescale + movie_timescale // 2) // movie_timescale
+        for entry in entries:
+            if entry["media_time"] != -1:
+                entry["media_time"] %= max(media_duration, 1)
+        movie_duration = max(movie_duration, track_duration)
+        traks.append(
+            build_edit_list_trak(
+                entries=entries,
+                track_id=track_id,
+                track_duration=track_duration,
+                media_timescale=media_timescale,
+                media_duration=media_duration,
+                version=version,
+            )
+        )
+    ftyp = box("ftyp", brand_payload("isom", 0, ["isom", "iso2"]))
+    mvhd = build_movie_header(movie_timescale, movie_duration, next_track_id=track_count + 1)
+    return ftyp + box("moov", mvhd + b"".join(traks))
+
+
+@stress_generator(
+    "edit-list",
+    default_scale=20_000,
+    description="Eight tracks of version 0 elst entries with empty, dwell and rate-change edits.",
+)
+def stress_edit_list(scale: int) -> list[bytes]:
+    return [build_edit_list_stress_movie(scale, version=0)]
+
+
+@stress_generator(
+    "edit-list-v1",
+    default_scale=20_000,
+    description="Eight tracks of version 1 (64-bit) elst entries with empty, dwell and rate edits.",
+)
+def stress_edit_list_v1(scale: int) -> list[bytes]:
+    return [build_edit_list_stress_movie(scale, version=1)]
+
+
+# Common encryption -----------------------------------------------------------
+
+CENC_KEY_IDENTIFIER = bytes(range(0x20, 0x30))
+
+
+@dataclass
+class EncryptedSample:
+    """Per-sample auxiliary information carried by ``senc``."""
+
+    iv: bytes
+    subsamples: list[tuple[int, int]]  # (clear bytes, protected bytes)
+
+    @property
+    def sample_size(self) -> int:
+        return sum(clear + protected for clear, protected in self.subsamples)
+
+    def aux_info_size(self, use_subsamples: bool) -> int:
+        return len(self.iv) + (2 + 6 * len(self.subsamples) if use_subsamples else 0)
+
+
+def make_encrypted_samples(
+    sample_count: int,
+    *,
+    iv_size: int = 8,
+    first_sample: int = 0,
+    max_subsamples: int = 8,
+) -> list[EncryptedSample]:
+    """Return deterministic samples with counter IVs and varying subsample counts."""
+
+    if iv_size not in (8, 16):
+        raise ValueError("Per-sample IV size must be 8 or 16 bytes")
+    samples = []
+    for index in range(first_sample, first_sample + sample_count):
+        subsample_count = 1 + index % max_subsamples
+        subsamples = [
+            (5 + (index + offset) % 11, 16 * (1 + (index + offset) % 8))
+            for offset in range(subsample_count)
+        ]
+        samples.append(EncryptedSample(index.to_bytes(iv_size, "big"), subsamples))
+    return samples
+
+
+def build_sample_encryption_payload(
+    samples: list[EncryptedSample],
+    *,
+    use_subsamples: bool = True,
+    override_iv_size: Optional[int] = None,
+    key_identifier: bytes = CENC_KEY_IDENTIFIER,
+) -> tuple[int, bytes]:
+    """Return ``(flags, payload)`` for a ``senc`` box describing ``samples``."""
+
+    flags = 0
+    payload = bytearray()
+    if override_iv_size is not None:
+        flags |= 0x000001
+        payload.extend((0x000001).to_bytes(3, "big"))  # AES-CTR
+        payload.append(override_iv_size)
+        payload.extend(key_identifier)
+    if use_subsamples:
+        flags |= 0x000002
+    payload.extend(len(samples).to_bytes(4, "big"))
+    for sample in samples:
+        payload.extend(sample.iv)
+        if use_subsamples:
+            payload.extend(len(sample.subsamples).to_bytes(2, "big"))
+            for clear, protected in sample.subsamples:
+                payload.extend(clear.to_bytes(2, "big"))
+                payload.extend(protected.to_bytes(4, "big"))
+    return flags, bytes(payload)
+
+
+def build_sample_aux_info_sizes(sizes: list[int]) -> bytes:
+    payload = bytearray(b"cenc")
+    payload.extend((0).to_bytes(4, "big"))  # aux_info_type_parameter
+    if sizes and all(size == sizes[0] for size in sizes):
+        payload.append(sizes[0])
+        payload.extend(len(sizes).to_bytes(4, "big"))
+    else:
+        payload.append(0)
+        payload.extend(len(sizes).to_bytes(4, "big"))
+        payload.extend(bytes(sizes))
+    return full_box("saiz", 0, 0x000001, bytes(payload))
+
+
+def build_sample_aux_info_offsets(offsets: list[int], *, version: int = 0) -> bytes:
+    payload = bytearray(b"cenc")
+    payload.extend((0).to_bytes(4, "big"))  # aux_info_type_parameter
+    payload.extend(len(offsets).to_bytes(4, "big"))
+    payload.extend(pack_uint64(offsets) if version == 1 else pack_uint32(offsets))
+    return full_box("saio", version, 0x000001, bytes(payload))
+
+
+def build_track_extends_box(track_id: int, default_sample_duration: int = 0) -> bytes:
+    payload = bytearray()
+    payload.extend(track_id.to_bytes(4, "big"))
+    payload.extend((1).to_bytes(4, "big"))  # default sample description index
+    payload.extend(default_sample_duration.to_bytes(4, "big"))
+    payload.extend((0).to_bytes(4, "big"))  # default sample size
+    payload.extend((0).to_bytes(4, "big"))  # default sample flags
+    return full_box("trex", 0, 0, bytes(payload))
+
+
+def build_encrypted_fragment(
+    sequence_number: int,
+    samples: list[EncryptedSample],
+    *,
+    track_id: int = 1,
+    base_decode_time: int = 0,
+    sample_duration: int = 1_024,
+    saio_version: int = 0,
+    use_subsamples: bool = True,
+) -> tuple[bytes, int]:
+    """Return ``(moof, mdat_payload_size)`` for one encrypted fragment.
+
+    ``tfhd`` sets default-base-is-moof, so the ``trun`` data offset and the
+    single ``saio`` offset are both relative to the start of ``moof``. The
+    ``saio`` entry points at the first IV inside ``senc`` and ``saiz`` lists
+    the exact per-sample auxiliary sizes of that ``senc`` layout.
+    """
+
+    iv_size = len(samples[0].iv)
+    mfhd = full_box("mfhd", 0, 0, sequence_number.to_bytes(4, "big"))
+    tfhd = build_track_fragment_header(
+        track_id, 0x020000 | 0x000008, default_sample_duration=sample_duration
     )
-    parser.add_argument(
-        "--log-level",
-        default="INFO",
-        help="Logging level (DEBUG, INFO, WARNING, ...).",
+    tfdt = build_track_fragment_decode_time(base_decode_time, version=1)
+    sizes = [sample.sample_size for sample in samples]
+    senc_flags, senc_payload = build_sample_encryption_payload(
+        samples, use_subsamples=use_subsamples, override_iv_size=iv_size
     )
-    return parser
+    senc = full_box("senc", 0, senc_flags, senc_payload)
+    saiz = build_sample_aux_info_sizes([sample.aux_info_size(use_subsamples) for sample in samples])
+
+    def build_trun(data_offset: int) -> bytes:
+        return build_track_run(
+            sample_count=len(samples),
+            flags=0x000001 | 0x000200,
+            data_offset=data_offset,
+            sample_sizes=sizes,
+        )
 
+    senc_header = 12 + (20 if senc_flags & 0x000001 else 0) + 4
+    aux_offset = 8 + len(mfhd) + 8 + len(tfhd) + len(tfdt) + len(build_trun(0)) + senc_header
+    saio = build_sample_aux_info_offsets([aux_offset], version=saio_version)
 
-def main(argv: Optional[list[str]] = None) -> int:
-    parser = build_argument_parser()
-    args = parser.parse_args(argv)
+    def assemble(data_offset: int) -> bytes:
+        traf = box("traf", tfhd + tfdt + build_trun(data_offset) + senc + saiz + saio)
+        return box("moof", mfhd + traf)
 
-    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
+    payload_size = sum(sizes)
+    data_offset = len(assemble(0)) + len(box_header("mdat", payload_size))
+    return assemble(data_offset), payload_size
 
-    if not args.skip_text_fixtures:
-        generate_text_fixtures()
 
-    if not args.skip_corrupt_fixtures:
-        generate_corrupt_fixtures(args.corrupt_root)
+def iter_encrypted_fragmented_movie(
+    fragment_count: int,
+    samples_per_fragment: int,
+    *,
+    iv_size: int = 8,
+    saio_version: int = 0,
+    sample_duration: int = 1_024,
+    timescale: int = 48_000,
+) -> Iterator[bytes]:
+    """Yield an init segment followed by ``fragment_count`` CENC fragments."""
+
+    ftyp = box("ftyp", brand_payload("iso6", 0, ["iso6", "dash", "cenc"]))
+    mvhd = build_movie_header(1_000, 0, next_track_id=2)
+    tkhd = build_track_header(1, 0)
+    mdhd = build_media_header(timescale, 0)
+    trak = box("trak", tkhd + box("mdia", mdhd))
+    mvex = box("mvex", build_track_extends_box(1, sample_duration))
+    yield ftyp + box("moov", mvhd + trak + mvex)
+
+    for fragment in range(fragment_count):
+        samples = make_encrypted_samples(
+            samples_per_fragment,
+            iv_size=iv_size,
+            first_sample=fragment * samples_per_fragment,
+        )
+        moof, payload_size = build_encrypted_fragment(
+            fragment + 1,
+            samples,
+            base_decode_time=fragment * samples_per_fragment * sample_duration,
+            sample_duration=sample_duration,
+            saio_version=saio_version,
+        )
+        yield moof
+        yield box_header("mdat", payload_size)
+        yield from iter_filler(payload_size, 0xC0 | (fragment & 0x0F))
+
+
+@stress_generator(
+    "cenc",
+    default_scale=2_000,
+    description="32 CENC fragments with 8-byte IVs, variable subsamples and saio v0/saiz tables.",
+)
+def stress_cenc(scale: int) -> Iterator[bytes]:
+    return iter_encrypted_fragmented_movie(32, scale, iv_size=8, saio_version=0)
+
+
+@stress_generator(
+    "cenc-iv16",
+    default_scale=2_000,
+    description="32 CENC fragments with 16-byte IVs, variable subsamples and saio v1/saiz tables.",
+)
+def stress_cenc_iv16(scale: int) -> Iterator[bytes]:
+    return iter_encrypted_fragmented_movie(32, scale, iv_size=16, saio_version=1)
+
+
+# Sample descriptions ---------------------------------------------------------
+
+
+def synthetic_nal_unit(header: bytes, length: int, seed: int) -> bytes:
+    """Return a NAL unit of ``length`` bytes starting with ``header``."""
+
+    if length < len(header):
+        raise ValueError("NAL unit length shorter than its header")
+    body = bytes((seed + index * 29) & 0xFF for index in range(length - len(header)))
+    return header + body
+
+
+def build_avc_configuration_box(
+    sequence_parameter_sets: list[bytes],
+    picture_parameter_sets: list[bytes],
+    *,
+    profile: int = 100,
+    level: int = 0x28,
+    length_size: int = 4,
+) -> bytes:
+    payload = bytearray()
+    payload.append(1)  # configurationVersion
+    payload.append(profile)
+    payload.append(0x00)  # profile compatibility
+    payload.append(level)
+    payload.append(0xFC | (length_size - 1))
+    payload.append(0xE0 | len(sequence_parameter_sets))
+    for nal in sequence_parameter_sets:
+        payload.extend(len(nal).to_bytes(2, "big") + nal)
+    payload.append(len(picture_parameter_sets))
+    for nal in picture_parameter_sets:
+        payload.extend(len(nal).to_bytes(2, "big") + nal)
+    if profile in (100, 110, 122, 144):
+        payload.append(0xFC | 1)  # chroma_format 4:2:0
+        payload.append(0xF8)  # bit_depth_luma_minus8
+        payload.append(0xF8)  # bit_depth_chroma_minus8
+        payload.append(0)  # numOfSequenceParameterSetExt
+    return box("avcC", bytes(payload))
+
+
+def build_hevc_configuration_box(
+    arrays: list[tuple[int, list[bytes]]],
+    *,
+    profile_idc: int = 1,
+    level_idc: int = 120,
+    length_size: int = 4,
+) -> bytes:
+    """Return an ``hvcC`` box whose NAL arrays are ``(nal_unit_type, units)`` pairs."""
+
+    payload = bytearray()
+    payload.append(1)  # configurationVersion
+    payload.append(profile_idc & 0x1F)  # profile space 0, main tier
+    payload.extend((0x6000_0000).to_bytes(4, "big"))  # profile compatibility flags
+    payload.extend((0x9000_0000_0000).to_bytes(6, "big"))  # constraint indicator flags
+    payload.append(level_idc)
+    payload.extend((0xF000).to_bytes(2, "big"))  # min_spatial_segmentation_idc
+    payload.append(0xFC)  # parallelismType
+    payload.append(0xFC | 1)  # chroma_format_idc 4:2:0
+    payload.append(0xF8)  # bit_depth_luma_minus8
+    payload.append(0xF8)  # bit_depth_chroma_minus8
+    payload.extend((0).to_bytes(2, "big"))  # avgFrameRate
+    payload.append(0x0C | (length_size - 1))  # one temporal layer, nested
+    payload.append(len(arrays))
+    for nal_unit_type, units in arrays:
+        payload.append(0x80 | (nal_unit_type & 0x3F))  # array_completeness
+        payload.extend(len(units).to_bytes(2, "big"))
+        for nal in units:
+            payload.extend(len(nal).to_bytes(2, "big") + nal)
+    return box("hvcC", bytes(payload))
+
+
+def encode_descriptor(tag: int, payload: bytes) -> bytes:
+    """Return an MPEG-4 descriptor using the expandable size encoding."""
+
+    length = len(payload)
+    size_bytes = [length & 0x7F]
+    length >>= 7
+    while length:
+        size_bytes.insert(0, 0x80 | (length & 0x7F))
+        length >>= 7
+    return bytes([tag, *size_bytes]) + payload
+
+
+def build_elementary_stream_descriptor_box(
+    audio_specific_config: bytes,
+    *,
+    es_id: int = 1,
+    object_type: int = 0x40,
+    average_bitrate: int = 128_000,
+) -> bytes:
+    decoder_specific = encode_descriptor(0x05, audio_specific_config)
+    decoder_config = encode_descriptor(
+        0x04,
+        bytes([object_type, (0x05 << 2) | 0x01])  # audio stream
+        + (6_144).to_bytes(3, "big")  # bufferSizeDB
+        + average_bitrate.to_bytes(4, "big")  # maxBitrate
+        + average_bitrate.to_bytes(4, "big")
+        + decoder_specific,
+    )
+    sl_config = encode_descriptor(0x06, bytes([0x02]))
+    es_descriptor = encode_descriptor(
+        0x03, es_id.to_bytes(2, "big") + bytes([0]) + decoder_config + sl_config
+    )
+    return full_box("esds", 0, 0, es_descriptor)
+
+
+def build_audio_sample_entry(
+    entry_type: str,
+    *,
+    channel_count: int = 2,
+    sample_rate: int = 48_000,
+    children: bytes = b"",
+    data_reference_index: int = 1,
+) -> bytes:
+    payload = bytearray()
+    payload.extend(bytes(6))  # reserved
+    payload.extend(data_reference_index.to_bytes(2, "big"))
+    payload.extend(bytes(8))  # reserved
+    payload.extend(channel_count.to_bytes(2, "big"))
+    payload.extend((16).to_bytes(2, "big"))  # sample size
+    payload.extend(bytes(4))  # pre-defined + reserved
+    payload.extend((sample_rate << 16).to_bytes(4, "big"))
+    payload.extend(children)
+    return box(entry_type, bytes(payload))
+
+
+def build_track_encryption_box(
+    *,
+    per_sample_iv_size: int = 8,
+    key_identifier: bytes = CENC_KEY_IDENTIFIER,
+) -> bytes:
+    payload = bytes([0, 0, 1, per_sample_iv_size]) + key_identifier
+    return full_box("tenc", 0, 0, payload)
+
+
+def build_protection_scheme_info(
+    original_format: str,
+    *,
+    scheme_type: str = "cenc",
+    per_sample_iv_size: int = 8,
+) -> bytes:
+    frma = box("frma", original_format.encode("ascii"))
+    schm = full_box("schm", 0, 0, scheme_type.encode("ascii") + (0x0001_0000).to_bytes(4, "big"))
+    schi = box("schi", build_track_encryption_box(per_sample_iv_size=per_sample_iv_size))
+    return box("sinf", frma + schm + schi)
+
+
+def _avc_configuration(index: int) -> bytes:
+    sps = [synthetic_nal_unit(b"\x67\x64\x00\x28", 24 + index % 16, index)]
+    pps = [synthetic_nal_unit(b"\x68", 4 + index % 4, index + 1)]
+    return build_avc_configuration_box(sps, pps)
+
+
+def _aac_configuration(index: int) -> tuple[int, bytes]:
+    channel_count = 1 + index % 6
+    # AudioSpecificConfig: AAC-LC (2), 48 kHz (index 3), channel configuration.
+    audio_specific_config = ((2 << 11) | (3 << 7) | (channel_count << 3)).to_bytes(2, "big")
+    esds = build_elementary_stream_descriptor_box(audio_specific_config, es_id=index + 1)
+    return channel_count, esds
+
+
+def build_avc_sample_entry(index: int, *, width: int = 1920, height: int = 1080) -> bytes:
+    return build_visual_sample_entry("avc1", width, height, _avc_configuration(index))
+
+
+def build_hevc_sample_entry(
+    index: int,
+    *,
+    nal_units_per_array: int = 4,
+    width: int = 3840,
+    height: int = 2160,
+) -> bytes:
+    arrays = [
+        (
+            nal_unit_type,
+            [
+                synthetic_nal_unit(bytes([nal_unit_type << 1, 0x01]), 16 + (index + unit) % 48, unit)
+                for unit in range(nal_units_per_array)
+            ],
+        )
+        for nal_unit_type in (32, 33, 34, 39)  # VPS, SPS, PPS, prefix SEI
+    ]
+    return build_visual_sample_entry("hvc1", width, height, build_hevc_configuration_box(arrays))
+
+
+def build_mp4a_sample_entry(index: int) -> bytes:
+    channel_count, esds = _aac_configuration(index)
+    return build_audio_sample_entry("mp4a", channel_count=channel_count, children=esds)
+
+
+def build_encv_sample_entry(index: int, *, per_sample_iv_size: int = 8) -> bytes:
+    sinf = build_protection_scheme_info("avc1", per_sample_iv_size=per_sample_iv_size)
+    return build_visual_sample_entry("encv", 1920, 1080, _avc_configuration(index) + sinf)
+
+
+def build_enca_sample_entry(index: int, *, per_sample_iv_size: int = 8) -> bytes:
+    channel_count, esds = _aac_configuration(index)
+    sinf = build_protection_scheme_info("mp4a", per_sample_iv_size=per_sample_iv_size)
+    return build_audio_sample_entry("enca", channel_count=channel_count, children=esds + sinf)
+
+
+VIDEO_SAMPLE_ENTRY_BUILDERS: tuple[Callable[[int], bytes], ...] = (
+    build_avc_sample_entry,
+    build_hevc_sample_entry,
+    build_encv_sample_entry,
+)
+AUDIO_SAMPLE_ENTRY_BUILDERS: tuple[Callable[[int], bytes], ...] = (
+    build_mp4a_sample_entry,
+    build_enca_sample_entry,
+)
+
+
+def make_audio_track(
+    track_id: int,
+    sample_count: int,
+    *,
+    timescale: int = 48_000,
+    sample_delta: int = 1_024,
+    samples_per_chunk: int = 20,
+) -> SampleTableTrack:
+    chunks = [samples_per_chunk] * (sample_count // samples_per_chunk)
+    if sample_count % samples_per_chunk:
+        chunks.append(sample_count % samples_per_chunk)
+    return SampleTableTrack(
+        track_id=track_id,
+        handler_type="soun",
+        timescale=timescale,
+        sample_sizes=[180 + (index * 13) % 40 for index in range(sample_count)],
+        sample_durations=[sample_delta] * sample_count,
+        chunk_sample_counts=chunks,
+    )
+
+
+def iter_codec_config_movie(
+    track_count: int,
+    *,
+    entries_per_track: int = 8,
+    samples_per_track: int = 30,
+) -> Iterator[bytes]:
+    """Yield a movie with ``track_count`` tracks carrying many codec sample entries.
+
+    Every fourth track is audio (``mp4a``/``enca``); the rest cycle through
+    ``avc1``, ``hvc1`` and ``encv`` entries. Each ``stsd`` holds
+    ``entries_per_track`` entries with distinct parameter sets.
+    """
+
+    tracks = []
+    sample_entries: dict[int, list[bytes]] = {}
+    for track_id in range(1, track_count + 1):
+        if track_id % 4 == 0:
+            tracks.append(make_audio_track(track_id, samples_per_track))
+            builders = AUDIO_SAMPLE_ENTRY_BUILDERS
+        else:
+            tracks.append(make_video_track(track_id, samples_per_track))
+            builders = VIDEO_SAMPLE_ENTRY_BUILDERS
+        sample_entries[track_id] = [
+            builders[(track_id + index) % len(builders)](track_id * entries_per_track + index)
+            for index in range(entries_per_track)
+        ]
+    return iter_sample_table_movie(tracks, sample_entries=sample_entries)
+
+
+@stress_generator(
+    "codec-configs",
+    default_scale=200,
+    description="Hundreds of tracks whose stsd boxes carry avc1/hvc1/encv/mp4a/enca entries.",
+)
+def stress_codec_configs(scale: int) -> Iterator[bytes]:
+    return iter_codec_config_movie(scale)
+
+
+# Metadata --------------------------------------------------------------------
+
+ITUNES_ITEM_IDENTIFIERS = (
+    b"\xa9nam",
+    b"\xa9ART",
+    b"\xa9alb",
+    b"\xa9day",
+    b"\xa9cmt",
+    b"\xa9too",
+    b"desc",
+    b"tmpo",
+    b"cpil",
+)
+JPEG_SIGNATURE = bytes([0xFF, 0xD8, 0xFF, 0xE0]) + b"\x00\x10JFIF\x00"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def raw_box(box_type: bytes, payload: bytes) -> bytes:
+    """Like :func:`box` but accepts non-ASCII identifiers such as ``\\xa9nam``."""
+
+    if len(box_type) != 4:
+        raise ValueError("Box type must be exactly four bytes")
+    return (8 + len(payload)).to_bytes(4, "big") + box_type + payload
+
+
+def build_metadata_data_atom(type_code: int, value: bytes, locale: int = 0) -> bytes:
+    return box("data", type_code.to_bytes(4, "big") + locale.to_bytes(4, "big") + value)
+
+
+def build_metadata_item(identifier: bytes, values: list[tuple[int, bytes]]) -> bytes:
+    return raw_box(identifier, b"".join(build_metadata_data_atom(*value) for value in values))
+
+
+def build_metadata_keys_box(keys: list[tuple[str, str]]) -> bytes:
+    payload = bytearray(len(keys).to_bytes(4, "big"))
+    for namespace, name in keys:
+        encoded = name.encode("utf-8")
+        payload.extend((8 + len(encoded)).to_bytes(4, "big"))
+        payload.extend(namespace.encode("ascii"))
+        payload.extend(encoded)
+    return full_box("keys", 0, 0, bytes(payload))
+
+
+def build_metadata_box(handler_type: str, children: bytes) -> bytes:
+    hdlr = build_handler_box(handler_type, "")
+    return full_box("meta", 0, 0, hdlr + children)
+
+
+def metadata_value(index: int) -> tuple[int, bytes]:
+    """Return a ``(well-known type, value)`` pair cycling through value kinds."""
+
+    kind = index % 7
+    if kind == 0:
+        return 1, f"Title {index} – café".encode("utf-8")
+    if kind == 1:
+        return 2, f"Kommentar {index}".encode("utf-16-be")
+    if kind == 2:
+        return 21, (-index).to_bytes(4, "big", signed=True)
+    if kind == 3:
+        return 22, index.to_bytes(8, "big")
+    if kind == 4:
+        return 23, struct.pack(">f", index / 3)
+    if kind == 5:
+        return 24, struct.pack(">d", index / 7)
+    return 27, bytes([index & 1])
+
+
+def build_artwork(size: int, index: int) -> tuple[int, bytes]:
+    """Return a ``(type, payload)`` JPEG- or PNG-tagged artwork of ``size`` bytes."""
+
+    if index % 2 == 0:
+        header, type_code, trailer = JPEG_SIGNATURE, 13, b"\xff\xd9"
+    else:
+        header, type_code, trailer = PNG_SIGNATURE, 14, b"IEND\xaeB`\x82"
+    filler = max(size - len(header) - len(trailer), 0)
+    return type_code, header + bytes([index & 0xFF]) * filler + trailer
+
+
+def build_metadata_stress_movie(
+    item_count: int,
+    *,
+    artwork_count: int = 2,
+    artwork_size: int = 4 * 1024 * 1024,
+) -> bytes:
+    """Return a movie with large iTunes-style and keyed metadata hierarchies.
+
+    Half of the items live in ``moov/udta/meta`` (``mdir`` handler) using
+    classic four-character identifiers plus ``covr`` artwork; the other half
+    live in ``moov/meta`` (``mdta`` handler) with a ``keys`` table of the same
+    size and ``ilst`` entries addressed by key index.
+    """
+
+    itunes_count = item_count // 2
+    keyed_count = item_count - itunes_count
+
+    items = [
+        build_metadata_item(
+            ITUNES_ITEM_IDENTIFIERS[index % len(ITUNES_ITEM_IDENTIFIERS)],
+            [metadata_value(index)],
+        )
+        for index in range(itunes_count)
+    ]
+    if artwork_count:
+        artwork = [build_artwork(artwork_size, index) for index in range(artwork_count)]
+        items.append(build_metadata_item(b"covr", artwork))
+    udta = box("udta", build_metadata_box("mdir", box("ilst", b"".join(items))))
+
+    keys = [("mdta", f"com.isoinspector.stress.key{index}") for index in range(keyed_count)]
+    keyed_items = [
+        build_metadata_item((index + 1).to_bytes(4, "big"), [metadata_value(index)])
+        for index in range(keyed_count)
+    ]
+    meta = build_metadata_box(
+        "mdta", build_metadata_keys_box(keys) + box("ilst", b"".join(keyed_items))
+    )
+
+    ftyp = box("ftyp", brand_payload("M4A ", 0, ["M4A ", "mp42", "isom"]))
+    mvhd = build_movie_header(1_000, 0, next_track_id=1)
+    return ftyp + box("moov", mvhd + meta + udta)
+
+
+@stress_generator(
+    "metadata",
+    default_scale=5_000,
+    description="udta/meta(mdir) and meta(mdta)/keys item lists with mixed value types and 4 MiB artwork.",
+)
+def stress_metadata(scale: int) -> list[bytes]:
+    return [build_metadata_stress_movie(scale)]
+
+
+# Unknown box floods ----------------------------------------------------------
+
+MP4RA_CATALOG_PATH = REPO_ROOT / "Sources" / "ISOInspectorKit" / "Resources" / "MP4RABoxes.json"
+# Mirrors FourCharContainerCode so registered filler boxes never recurse.
+CONTAINER_TYPES = frozenset(
+    {
+        "moov", "trak", "mdia", "minf", "dinf", "stbl", "edts", "mvex", "moof", "traf",
+        "mfra", "tref", "udta", "strk", "strd", "sinf", "schi", "stsd", "meta", "ilst",
+    }
+)
+# Codes the Swift parsers handle that MP4RABoxes.json does not list.
+REGISTRY_ONLY_TYPES = frozenset({"ilst", "keys", "data"})
+FLOOD_ALPHABET = b"abcdefghijklmnopqrstuvwxyz0123456789"
+# Maps random bytes onto FLOOD_ALPHABET so fourccs can be drawn with randbytes().
+FLOOD_TRANSLATION = bytes(FLOOD_ALPHABET[value % len(FLOOD_ALPHABET)] for value in range(256))
+
+
+def load_mp4ra_catalog(path: Path = MP4RA_CATALOG_PATH) -> tuple[set[str], set[bytes]]:
+    """Return the registered fourccs and UUID extended types from the catalog."""
+
+    with path.open("r", encoding="utf-8") as handle:
+        catalog = json.load(handle)
+    fourccs: set[str] = set()
+    uuids: set[bytes] = set()
+    for entry in catalog.get("boxes", []):
+        if entry.get("type") == "uuid" and entry.get("uuid"):
+            uuids.add(bytes.fromhex(entry["uuid"].replace("-", "")))
+        elif entry.get("type"):
+            fourccs.add(entry["type"])
+    return fourccs, uuids
+
+
+def iter_unknown_box_flood(
+    box_count: int,
+    *,
+    seed: int = 0,
+    uuid_ratio: float = 0.25,
+    registered_ratio: float = 0.0,
+    max_payload: int = 16,
+    batch_size: int = 4_096,
+    catalog_path: Path = MP4RA_CATALOG_PATH,
+) -> Iterator[bytes]:
+    """Yield ``ftyp`` followed by ``box_count`` small top-level boxes.
+
+    Each box is, in proportion, an unregistered random fourcc (never a
+    catalog, container or parser-only code), a ``uuid`` box with an
+    unregistered random extended type, or (``registered_ratio``) a registered
+    non-container catalog type with a zero-filled payload. Output is produced
+    in batches of ``batch_size`` boxes so memory stays flat at millions of
+    boxes.
+    """
+
+    rng = random.Random(seed)
+    registered, registered_uuids = load_mp4ra_catalog(catalog_path)
+    registered_leaves = sorted(
+        fourcc for fourcc in registered if fourcc not in CONTAINER_TYPES and fourcc != "uuid"
+    )
+    unknown_uuid_threshold = uuid_ratio
+    registered_threshold = uuid_ratio + registered_ratio
+    if registered_threshold > 1:
+        raise ValueError("uuid_ratio + registered_ratio must not exceed 1")
+
+    excluded = registered | CONTAINER_TYPES | REGISTRY_ONLY_TYPES
+
+    def unknown_fourcc() -> bytes:
+        while True:
+            candidate = rng.randbytes(4).translate(FLOOD_TRANSLATION)
+            if candidate.decode("ascii") not in excluded:
+                return candidate
+
+    yield box("ftyp", brand_payload("isom", 0, ["isom"]))
+    batch = bytearray()
+    for index in range(box_count):
+        roll = rng.random()
+        payload_size = rng.randrange(max_payload + 1)
+        if roll < unknown_uuid_threshold:
+            extended_type = rng.randbytes(16)
+            while extended_type in registered_uuids:
+                extended_type = rng.randbytes(16)
+            batch.extend((24 + payload_size).to_bytes(4, "big") + b"uuid" + extended_type)
+            batch.extend(rng.randbytes(payload_size))
+        elif roll < registered_threshold:
+            fourcc = rng.choice(registered_leaves).encode("latin-1")
+            batch.extend((8 + payload_size).to_bytes(4, "big") + fourcc + bytes(payload_size))
+        else:
+            batch.extend((8 + payload_size).to_bytes(4, "big") + unknown_fourcc())
+            batch.extend(rng.randbytes(payload_size))
+        if (index + 1) % batch_size == 0:
+            yield bytes(batch)
+            batch.clear()
+    if batch:
+        yield bytes(batch)
+
+
+@stress_generator(
+    "unknown-flood",
+    default_scale=1_000_000,
+    description="Top-level flood of unregistered fourcc and uuid boxes.",
+)
+def stress_unknown_flood(scale: int) -> Iterator[bytes]:
+    return iter_unknown_box_flood(scale)
+
+
+@stress_generator(
+    "unknown-flood-mixed",
+    default_scale=1_000_000,
+    description="Unregistered fourcc/uuid flood mixed 50/50 with registered leaf box types.",
+)
+def stress_unknown_flood_mixed(scale: int) -> Iterator[bytes]:
+    return iter_unknown_box_flood(scale, uuid_ratio=0.2, registered_ratio=0.5)
+
+
+# Random trees ----------------------------------------------------------------
+
+DEFAULT_RANDOM_TREE_ROOT = DEFAULT_STRESS_ROOT / "random"
+# Never coarser than any media timescale below, so edit list durations
+# converted to media ticks round-trip within the one-tick validator tolerance.
+RANDOM_TREE_MOVIE_TIMESCALE = 90_000
+RANDOM_VIDEO_CADENCES = ((30_000, 1_001), (24_000, 1_000), (25_000, 1_000), (90_000, 3_003))
+RANDOM_AUDIO_CADENCES = ((48_000, 1_024), (44_100, 1_024), (32_000, 1_024))
+RANDOM_PROGRESSIVE_BRANDS = (
+    ("isom", ("isom", "iso2", "mp41")),
+    ("mp42", ("mp42", "isom")),
+    ("M4V ", ("M4V ", "mp42", "isom")),
+)
+RANDOM_FRAGMENTED_BRANDS = (
+    ("iso6", ("iso6", "dash")),
+    ("iso5", ("iso5", "dash", "cmfc")),
+)
+SYNC_SAMPLE_FLAGS = 0x0200_0000  # sample_depends_on = 2 (I-frame)
+NON_SYNC_SAMPLE_FLAGS = 0x0101_0000  # depends on others, non-sync
+
+
+@dataclass
+class RandomTreePlan:
+    """Every random decision behind one generated tree.
+
+    Plans are derived entirely from ``seed`` so any generated file can be
+    rebuilt from the seed recorded in its sidecar.
+    """
+
+    seed: int
+    tracks: list[SampleTableTrack]
+    sample_entries: dict[int, list[bytes]]
+    ftyp: bytes
+    fragment_count: int = 0
+    edit_lists: Optional[dict[int, list[dict]]] = None
+    metadata_items: int = 0
+    free_sizes: tuple[int, int] = (0, 0)  # (inside moov, trailing top-level)
+    moov_first: bool = True
+    force_co64: bool = False
+    include_mehd: bool = False
+
+    @property
+    def fragmented(self) -> bool:
+        return self.fragment_count > 0
+
+    def summary(self) -> dict:
+        return {
+            "layout": "fragmented" if self.fragmented else "progressive",
+            "fragment_count": self.fragment_count,
+            "moov_first": self.moov_first,
+            "co64": self.force_co64,
+            "mehd": self.include_mehd,
+            "metadata_items": self.metadata_items,
+            "free_sizes": list(self.free_sizes),
+            "tracks": [
+                {
+                    "track_id": track.track_id,
+                    "handler_type": track.handler_type,
+                    "timescale": track.timescale,
+                    "sample_count": len(track.sample_sizes),
+                    "sample_entries": len(self.sample_entries[track.track_id]),
+                    "edit_entries": len((self.edit_lists or {}).get(track.track_id, [])),
+                }
+                for track in self.tracks
+            ],
+        }
+
+
+def plan_random_tree(
+    seed: int,
+    *,
+    max_tracks: int = 6,
+    max_samples: int = 2_000,
+    max_fragments: int = 24,
+) -> RandomTreePlan:
+    """Draw a spec-valid tree shape from ``seed`` using the existing builders.
+
+    The plan picks the track count and kinds, per-track cadences and table
+    sizes, sample entry codecs, progressive versus fragmented layout, the
+    ``moov``/``mdat`` order, and which optional boxes (``ctts``, ``stss``,
+    ``edts``, ``udta``, ``free``, ``mehd``, ``co64``) appear.
+    """
+
+    rng = random.Random(seed)
+    track_ids = list(range(1, rng.randint(1, max_tracks) + 1))
+    rng.shuffle(track_ids)
+    tracks: list[SampleTableTrack] = []
+    sample_entries: dict[int, list[bytes]] = {}
+    for track_id in track_ids:
+        sample_count = rng.randint(1, max_samples)
+        entry_count = rng.randint(1, 3)
+        if rng.random() < 0.3:
+            timescale, delta = rng.choice(RANDOM_AUDIO_CADENCES)
+            track = make_audio_track(
+                track_id,
+                sample_count,
+                timescale=timescale,
+                sample_delta=delta,
+                samples_per_chunk=rng.randint(1, 64),
+            )
+            builders = AUDIO_SAMPLE_ENTRY_BUILDERS
+        else:
+            timescale, delta = rng.choice(RANDOM_VIDEO_CADENCES)
+            track = make_video_track(
+                track_id,
+                sample_count,
+                timescale=timescale,
+                sample_delta=delta,
+                gop_size=rng.randint(1, 120),
+                chunk_pattern=tuple(rng.randint(1, 32) for _ in range(rng.randint(1, 4))),
+                base_sample_size=rng.randint(16, 256),
+                b_frames=rng.random() < 0.5,
+            )
+            if rng.random() < 0.2:
+                track.sync_samples = None
+            builders = VIDEO_SAMPLE_ENTRY_BUILDERS
+        tracks.append(track)
+        sample_entries[track_id] = [
+            rng.choice(builders)(rng.randrange(1 << 16)) for _ in range(entry_count)
+        ]
+
+    plan = RandomTreePlan(
+        seed=seed,
+        tracks=tracks,
+        sample_entries=sample_entries,
+        ftyp=b"",
+        metadata_items=rng.choice((0, 0, rng.randint(1, 64))),
+        free_sizes=(rng.choice((0, rng.randint(0, 256))), rng.choice((0, rng.randint(0, 4_096)))),
+    )
+    min_samples = min(len(track.sample_sizes) for track in tracks)
+    if rng.random() < 0.4:
+        plan.fragment_count = rng.randint(1, min(max_fragments, min_samples))
+        plan.include_mehd = rng.random() < 0.5
+        brands = rng.choice(RANDOM_FRAGMENTED_BRANDS)
+    else:
+        plan.moov_first = rng.random() < 0.7
+        plan.force_co64 = rng.random() < 0.2
+        plan.edit_lists = _random_edit_lists(rng, tracks)
+        brands = rng.choice(RANDOM_PROGRESSIVE_BRANDS)
+    plan.ftyp = box("ftyp", brand_payload(brands[0], 0, brands[1]))
+    return plan
+
+
+def _random_edit_lists(rng: random.Random, tracks: list[SampleTableTrack]) -> dict[int, list[dict]]:
+    durations = {
+        track.track_id: track.media_duration * RANDOM_TREE_MOVIE_TIMESCALE // track.timescale
+        for track in tracks
+    }
+    movie_duration = max(durations.values())
+    edit_lists: dict[int, list[dict]] = {}
+    for track in tracks:
+        if rng.random() >= 0.5:
+            continue
+        # A leading empty edit pads shorter tracks so every edit list spans
+        # the movie duration, as EditListValidationRule expects.
+        lead = movie_duration - durations[track.track_id]
+        media_time = track.composition_offsets[0] if track.composition_offsets else 0
+        entries = [{"segment_duration": lead, "media_time": -1}] if lead else []
+        entries.append({"segment_duration": durations[track.track_id], "media_time": media_time})
+        edit_lists[track.track_id] = entries
+    return edit_lists
+
+
+@dataclass
+class FragmentRun:
+    """Consecutive samples of one track carried by a single ``traf``."""
+
+    track: SampleTableTrack
+    first_sample: int
+    sample_count: int
+    base_decode_time: int
+
+    @property
+    def end_sample(self) -> int:
+        return self.first_sample + self.sample_count
+
+    @property
+    def payload_size(self) -> int:
+        return sum(self.track.sample_sizes[self.first_sample : self.end_sample])
+
+    @property
+    def duration(self) -> int:
+        return sum(self.track.sample_durations[self.first_sample : self.end_sample])
+
+
+def iter_fragment_runs(
+    tracks: list[SampleTableTrack], fragment_count: int
+) -> Iterator[list[FragmentRun]]:
+    """Yield, per fragment, the runs that split each track's samples evenly."""
+
+    decode_times = {track.track_id: 0 for track in tracks}
+    for fragment in range(fragment_count):
+        runs = []
+        for track in tracks:
+            total = len(track.sample_sizes)
+            first = total * fragment // fragment_count
+            count = total * (fragment + 1) // fragment_count - first
+            if not count:
+                continue
+            run = FragmentRun(track, first, count, decode_times[track.track_id])
+            runs.append(run)
+            decode_times[track.track_id] += run.duration
+        yield runs
+
+
+def build_track_fragment(
+    run: FragmentRun,
+    *,
+    data_offset: int,
+    sync_samples: Optional[set[int]],
+) -> bytes:
+    track, first_sample, end = run.track, run.first_sample, run.end_sample
+    trun_flags = 0x000001 | 0x000100 | 0x000200
+    sample_flags = None
+    if sync_samples is not None:
+        trun_flags |= 0x000400
+        sample_flags = [
+            SYNC_SAMPLE_FLAGS if number in sync_samples else NON_SYNC_SAMPLE_FLAGS
+            for number in range(first_sample + 1, end + 1)
+        ]
+    composition_offsets = None
+    if track.composition_offsets:
+        trun_flags |= 0x000800
+        composition_offsets = track.composition_offsets[first_sample:end]
+    tfhd = build_track_fragment_header(track.track_id, 0x020000)
+    tfdt = build_track_fragment_decode_time(run.base_decode_time)
+    trun = build_track_run(
+        sample_count=run.sample_count,
+        flags=trun_flags,
+        data_offset=data_offset,
+        sample_durations=track.sample_durations[first_sample:end],
+        sample_sizes=track.sample_sizes[first_sample:end],
+        sample_flags=sample_flags,
+        composition_offsets=composition_offsets,
+    )
+    return box("traf", tfhd + tfdt + trun)
+
+
+def build_media_fragment(
+    sequence_number: int,
+    runs: list[FragmentRun],
+    sync_sets: dict[int, Optional[set[int]]],
+) -> tuple[bytes, int]:
+    """Return ``(moof, mdat_payload_size)`` with runs laid out in ``runs`` order.
+
+    ``tfhd`` sets default-base-is-moof and every ``trun`` data offset points at
+    the run inside the ``mdat`` that immediately follows the ``moof``.
+    """
+
+    payload_size = sum(run.payload_size for run in runs)
+    mfhd = full_box("mfhd", 0, 0, sequence_number.to_bytes(4, "big"))
+
+    def assemble(base: int) -> bytes:
+        trafs = bytearray()
+        cursor = base
+        for run in runs:
+            trafs.extend(
+                build_track_fragment(
+                    run, data_offset=cursor, sync_samples=sync_sets[run.track.track_id]
+                )
+            )
+            cursor += run.payload_size
+        return box("moof", mfhd + bytes(trafs))
+
+    return assemble(len(assemble(0)) + len(box_header("mdat", payload_size))), payload_size
+
+
+def sync_sample_sets(tracks: list[SampleTableTrack]) -> dict[int, Optional[set[int]]]:
+    return {
+        track.track_id: set(track.sync_samples) if track.sync_samples is not None else None
+        for track in tracks
+    }
+
+
+def iter_fragment_payload(runs: list[FragmentRun]) -> Iterator[bytes]:
+    for run in runs:
+        yield from iter_filler(run.payload_size, run.track.track_id)
+
+
+def build_fragmented_movie_init(
+    tracks: list[SampleTableTrack],
+    *,
+    movie_timescale: int = 1_000,
+    sample_entries: Optional[dict[int, list[bytes]]] = None,
+    ftyp: Optional[bytes] = None,
+    include_mehd: bool = False,
+    movie_extras: bytes = b"",
+) -> bytes:
+    """Return ``ftyp`` plus a ``moov`` with empty sample tables and ``mvex``."""
+
+    ftyp = ftyp or box("ftyp", brand_payload("iso6", 0, ["iso6", "dash"]))
+    entries = sample_entries or {}
+    traks = b"".join(
+        build_sample_table_trak(
+            SampleTableTrack(track.track_id, track.handler_type, track.timescale, [], [], []),
+            [],
+            movie_timescale=movie_timescale,
+            sample_entries=entries.get(track.track_id),
+        )
+        for track in tracks
+    )
+    next_track_id = max(track.track_id for track in tracks) + 1
+    mvhd = build_movie_header(movie_timescale, 0, next_track_id)
+    mvex = b""
+    if include_mehd:
+        fragment_duration = max(
+            track.media_duration * movie_timescale // track.timescale for track in tracks
+        )
+        mvex += full_box("mehd", 0, 0, fragment_duration.to_bytes(4, "big"))
+    mvex += b"".join(build_track_extends_box(track.track_id) for track in tracks)
+    return ftyp + box("moov", mvhd + traks + box("mvex", mvex) + movie_extras)
+
+
+def iter_fragmented_movie(
+    tracks: list[SampleTableTrack],
+    fragment_count: int,
+    *,
+    movie_timescale: int = 1_000,
+    sample_entries: Optional[dict[int, list[bytes]]] = None,
+    ftyp: Optional[bytes] = None,
+    include_mehd: bool = False,
+    movie_extras: bytes = b"",
+) -> Iterator[bytes]:
+    """Yield an init segment and ``fragment_count`` ``moof``/``mdat`` pairs.
+
+    Each track's samples are split evenly across the fragments.
+    """
+
+    yield build_fragmented_movie_init(
+        tracks,
+        movie_timescale=movie_timescale,
+        sample_entries=sample_entries,
+        ftyp=ftyp,
+        include_mehd=include_mehd,
+        movie_extras=movie_extras,
+    )
+    sync_sets = sync_sample_sets(tracks)
+    for sequence_number, runs in enumerate(iter_fragment_runs(tracks, fragment_count), start=1):
+        moof, payload_size = build_media_fragment(sequence_number, runs, sync_sets)
+        yield moof
+        yield box_header("mdat", payload_size)
+        yield from iter_fragment_payload(runs)
+
+
+def iter_random_tree(plan: RandomTreePlan) -> Iterator[bytes]:
+    """Yield the file described by ``plan``."""
+
+    extras = b""
+    if plan.metadata_items:
+        items = [
+            build_metadata_item(
+                ITUNES_ITEM_IDENTIFIERS[index % len(ITUNES_ITEM_IDENTIFIERS)],
+                [metadata_value(plan.seed + index)],
+            )
+            for index in range(plan.metadata_items)
+        ]
+        extras += box("udta", build_metadata_box("mdir", box("ilst", b"".join(items))))
+    if plan.free_sizes[0]:
+        extras += box("free", bytes(plan.free_sizes[0]))
+
+    if plan.fragmented:
+        yield from iter_fragmented_movie(
+            plan.tracks,
+            plan.fragment_count,
+            movie_timescale=RANDOM_TREE_MOVIE_TIMESCALE,
+            sample_entries=plan.sample_entries,
+            ftyp=plan.ftyp,
+            include_mehd=plan.include_mehd,
+            movie_extras=extras,
+        )
+    else:
+        yield from iter_sample_table_movie(
+            plan.tracks,
+            movie_timescale=RANDOM_TREE_MOVIE_TIMESCALE,
+            force_co64=plan.force_co64,
+            sample_entries=plan.sample_entries,
+            edit_lists=plan.edit_lists,
+            movie_extras=extras,
+            moov_first=plan.moov_first,
+            ftyp=plan.ftyp,
+        )
+    if plan.free_sizes[1]:
+        yield box_header("free", plan.free_sizes[1])
+        yield from iter_filler(plan.free_sizes[1], 0)
+
+
+def generate_random_tree_fixtures(
+    count: int,
+    root: Path = DEFAULT_RANDOM_TREE_ROOT,
+    *,
+    seed: int = 0,
+    max_samples: Optional[int] = None,
+) -> list[Path]:
+    """Write ``count`` random trees using seeds ``seed`` .. ``seed + count - 1``.
+
+    Each sidecar records the file's own seed and the plan summary, so a
+    failing or slow file is reproduced with ``--random-trees 1 --seed <seed>``.
+    """
+
+    paths = []
+    for index in range(count):
+        tree_seed = seed + index
+        options = {"max_samples": max_samples} if max_samples is not None else {}
+        plan = plan_random_tree(tree_seed, **options)
+        metadata = {
+            "generator": "random-tree",
+            "seed": tree_seed,
+            "options": options,
+            "shape": plan.summary(),
+        }
+        path = root / f"random-tree-{tree_seed}.{STRESS_EXTENSION}"
+        paths.append(write_stream_fixture(path, iter_random_tree(plan), metadata))
+    return paths
+
+
+# Random access indexes -------------------------------------------------------
+
+
+@dataclass
+class SegmentReference:
+    """One ``sidx`` reference to a media subsegment or a nested ``sidx``."""
+
+    referenced_size: int
+    subsegment_duration: int
+    reference_type: int = 0  # 1 when the reference points at another sidx
+    starts_with_sap: bool = True
+    sap_type: int = 1
+    sap_delta_time: int = 0
+
+
+def build_segment_index_box(
+    reference_id: int,
+    timescale: int,
+    earliest_presentation_time: int,
+    references: list[SegmentReference],
+    *,
+    first_offset: int = 0,
+    version: int = 0,
+) -> bytes:
+    if len(references) > 0xFFFF:
+        raise ValueError("sidx reference_count must fit in 16 bits")
+    width = 8 if version == 1 else 4
+    payload = bytearray()
+    payload.extend(reference_id.to_bytes(4, "big"))
+    payload.extend(timescale.to_bytes(4, "big"))
+    payload.extend(earliest_presentation_time.to_bytes(width, "big"))
+    payload.extend(first_offset.to_bytes(width, "big"))
+    payload.extend((0).to_bytes(2, "big"))  # reserved
+    payload.extend(len(references).to_bytes(2, "big"))
+    for reference in references:
+        if reference.referenced_size >= 1 << 31:
+            raise ValueError("sidx referenced_size must fit in 31 bits")
+        payload.extend(
+            ((reference.reference_type << 31) | reference.referenced_size).to_bytes(4, "big")
+        )
+        payload.extend(reference.subsegment_duration.to_bytes(4, "big"))
+        sap = (
+            (int(reference.starts_with_sap) << 31)
+            | (reference.sap_type << 28)
+            | reference.sap_delta_time
+        )
+        payload.extend(sap.to_bytes(4, "big"))
+    return full_box("sidx", version, 0, bytes(payload))
+
+
+@dataclass
+class RandomAccessEntry:
+    """One ``tfra`` entry locating a sync sample."""
+
+    time: int
+    moof_offset: int
+    traf_number: int
+    trun_number: int
+    sample_number: int
+
+
+def _length_size(values: Iterable[int], minimum: int = 1) -> int:
+    largest = max(values, default=0)
+    size = max(minimum, (largest.bit_length() + 7) // 8, 1)
+    if size > 4:
+        raise ValueError("tfra numbers must fit in 4 bytes")
+    return size
+
+
+def build_track_fragment_random_access_box(
+    track_id: int,
+    entries: list[RandomAccessEntry],
+    *,
+    version: int = 0,
+    min_length_size: int = 1,
+) -> bytes:
+    """Return a ``tfra`` box using the narrowest number fields for ``entries``.
+
+    ``min_length_size`` widens the traf/trun/sample number fields so parsers
+    are exercised with every ``length_size_of_*`` encoding.
+    """
+
+    traf_size = _length_size((entry.traf_number for entry in entries), min_length_size)
+    trun_size = _length_size((entry.trun_number for entry in entries), min_length_size)
+    sample_size = _length_size((entry.sample_number for entry in entries), min_length_size)
+    width = 8 if version == 1 else 4
+    payload = bytearray()
+    payload.extend(track_id.to_bytes(4, "big"))
+    length_sizes = ((traf_size - 1) << 4) | ((trun_size - 1) << 2) | (sample_size - 1)
+    payload.extend(length_sizes.to_bytes(4, "big"))
+    payload.extend(len(entries).to_bytes(4, "big"))
+    for entry in entries:
+        payload.extend(entry.time.to_bytes(width, "big"))
+        payload.extend(entry.moof_offset.to_bytes(width, "big"))
+        payload.extend(entry.traf_number.to_bytes(traf_size, "big"))
+        payload.extend(entry.trun_number.to_bytes(trun_size, "big"))
+        payload.extend(entry.sample_number.to_bytes(sample_size, "big"))
+    return full_box("tfra", version, 0, bytes(payload))
+
+
+def build_movie_fragment_random_access_box(tfra_boxes: list[bytes]) -> bytes:
+    mfro_size = 16
+    mfra_size = 8 + sum(len(tfra) for tfra in tfra_boxes) + mfro_size
+    mfro = full_box("mfro", 0, 0, mfra_size.to_bytes(4, "big"))
+    return box("mfra", b"".join(tfra_boxes) + mfro)
+
+
+def presentation_times(run: FragmentRun) -> Iterator[int]:
+    """Yield the presentation time of every sample in ``run``."""
+
+    track = run.track
+    decode_time = run.base_decode_time
+    for index in range(run.first_sample, run.end_sample):
+        offset = track.composition_offsets[index] if track.composition_offsets else 0
+        yield decode_time + offset
+        decode_time += track.sample_durations[index]
+
+
+def iter_random_access_movie(
+    fragment_count: int,
+    *,
+    fragments_per_segment: int = 64,
+    samples_per_fragment: int = 48,
+    version: int = 0,
+    min_length_size: int = 1,
+) -> Iterator[bytes]:
+    """Yield a fragmented movie with a two-level ``sidx`` index and ``mfra``.
+
+    A root ``sidx`` references one child ``sidx`` per segment of
+    ``fragments_per_segment`` fragments (``reference_type`` 1); each child
+    references its fragments (``reference_type`` 0). A trailing ``mfra``
+    carries one ``tfra`` per track locating every sync sample, followed by an
+    ``mfro`` holding the ``mfra`` size. ``version`` selects 32- or 64-bit
+    ``sidx`` and ``tfra`` fields.
+    """
+
+    if samples_per_fragment % 2:
+        raise ValueError("samples_per_fragment must be even")
+    video_samples = fragment_count * samples_per_fragment
+    video = make_video_track(1, video_samples, gop_size=samples_per_fragment // 2)
+    audio = make_audio_track(2, video_samples * 25 // 16)
+    tracks = [video, audio]
+    init = build_fragmented_movie_init(
+        tracks,
+        sample_entries={1: [build_avc_sample_entry(1)], 2: [build_mp4a_sample_entry(2)]},
+        ftyp=box("ftyp", brand_payload("iso6", 0, ["iso6", "dash", "msix"])),
+    )
+
+    sync_sets = sync_sample_sets(tracks)
+    fragments = []  # (moof, payload size, runs)
+    for sequence_number, runs in enumerate(iter_fragment_runs(tracks, fragment_count), start=1):
+        moof, payload_size = build_media_fragment(sequence_number, runs, sync_sets)
+        fragments.append((moof, payload_size, runs))
+
+    def fragment_size(fragment: tuple[bytes, int, list[FragmentRun]]) -> int:
+        moof, payload_size, _ = fragment
+        return len(moof) + len(box_header("mdat", payload_size)) + payload_size
+
+    def video_run(fragment: tuple[bytes, int, list[FragmentRun]]) -> FragmentRun:
+        return next(run for run in fragment[2] if run.track is video)
+
+    segments = [
+        fragments[start : start + fragments_per_segment]
+        for start in range(0, len(fragments), fragments_per_segment)
+    ]
+    child_indexes = []
+    root_references = []
+    for segment in segments:
+        references = [
+            SegmentReference(
+                referenced_size=fragment_size(fragment),
+                subsegment_duration=video_run(fragment).duration,
+            )
+            for fragment in segment
+        ]
+        earliest = min(presentation_times(video_run(segment[0])))
+        child = build_segment_index_box(
+            video.track_id, video.timescale, earliest, references, version=version
+        )
+        child_indexes.append(child)
+        root_references.append(
+            SegmentReference(
+                referenced_size=len(child) + sum(ref.referenced_size for ref in references),
+                subsegment_duration=sum(ref.subsegment_duration for ref in references),
+                reference_type=1,
+            )
+        )
+    root = build_segment_index_box(
+        video.track_id,
+        video.timescale,
+        min(presentation_times(video_run(fragments[0]))),
+        root_references,
+        version=version,
+    )
+
+    entries: dict[int, list[RandomAccessEntry]] = {track.track_id: [] for track in tracks}
+    cursor = len(init) + len(root)
+    for segment, child in zip(segments, child_indexes):
+        cursor += len(child)
+        for fragment in segment:
+            for traf_number, run in enumerate(fragment[2], start=1):
+                sync = sync_sets[run.track.track_id]
+                for sample_number, time in enumerate(presentation_times(run), start=1):
+                    if sync is None and sample_number > 1:
+                        break  # every sample is a sync sample; index the first
+                    if sync is not None and run.first_sample + sample_number not in sync:
+                        continue
+                    entries[run.track.track_id].append(
+                        RandomAccessEntry(time, cursor, traf_number, 1, sample_number)
+                    )
+            cursor += fragment_size(fragment)
+    mfra = build_movie_fragment_random_access_box(
+        [
+            build_track_fragment_random_access_box(
+                track_id, track_entries, version=version, min_length_size=min_length_size
+            )
+            for track_id, track_entries in entries.items()
+        ]
+    )
+
+    yield init
+    yield root
+    for segment, child in zip(segments, child_indexes):
+        yield child
+        for moof, payload_size, runs in segment:
+            yield moof
+            yield box_header("mdat", payload_size)
+            yield from iter_fragment_payload(runs)
+    yield mfra
+
+
+@stress_generator(
+    "random-access",
+    default_scale=5_000,
+    description="Fragments indexed by a two-level sidx v0 chain plus mfra/tfra v0/mfro.",
+)
+def stress_random_access(scale: int) -> Iterator[bytes]:
+    return iter_random_access_movie(scale, version=0)
+
+
+@stress_generator(
+    "random-access-v1",
+    default_scale=5_000,
+    description="Fragments indexed by sidx v1 and tfra v1 with 4-byte traf/trun/sample numbers.",
+)
+def stress_random_access_v1(scale: int) -> Iterator[bytes]:
+    return iter_random_access_movie(scale, version=1, min_length_size=4)
+
+
+# Validation rule matrix -----------------------------------------------------------
+
+DEFAULT_RULE_MATRIX_ROOT = DEFAULT_DISTRIBUTION_ROOT / "rule-matrix"
+DEFAULT_RULE_MATRIX_COUNTS = (1, 1_000, 100_000)
+RULE_MATRIX_CATALOG = "rule-matrix.json"
+RULE_MATRIX_SAMPLE_SIZE = 64
+
+
+@dataclass
+class RuleViolationGenerator:
+    """Fixture family that injects a chosen number of violations of one rule.
+
+    ``rule_ids`` lists the validation issues the file must raise and
+    ``parse_issues`` the ``ParseIssue`` codes the walker records on the way.
+    Some rules are reachable only through the walker's own structural checks
+    (``BoxHeaderDecoder`` rejects the box before the rule sees it), in which
+    case ``rule_ids`` is empty and ``parse_issues`` carries the expectation.
+    """
+
+    rule_id: str
+    rule: str
+    description: str
+    rule_ids: tuple[str, ...]
+    parse_issues: tuple[str, ...]
+    factory: Callable[[int], Iterable[bytes]]
+
+    @property
+    def slug(self) -> str:
+        return self.rule_id.lower()
+
+
+RULE_VIOLATION_GENERATORS: dict[str, RuleViolationGenerator] = {}
+
+
+def rule_violation_generator(
+    rule_id: str,
+    *,
+    rule: str,
+    description: str,
+    rule_ids: Optional[tuple[str, ...]] = None,
+    parse_issues: tuple[str, ...] = (),
+) -> Callable[[Callable[[int], Iterable[bytes]]], Callable[[int], Iterable[bytes]]]:
+    """Register ``factory(count)`` as the violation family for ``rule_id``."""
+
+    def decorator(factory: Callable[[int], Iterable[bytes]]) -> Callable[[int], Iterable[bytes]]:
+        if rule_id in RULE_VIOLATION_GENERATORS:
+            raise ValueError(f"Rule violation generator {rule_id!r} already registered")
+        RULE_VIOLATION_GENERATORS[rule_id] = RuleViolationGenerator(
+            rule_id,
+            rule,
+            description,
+            rule_ids if rule_ids is not None else (rule_id,),
+            parse_issues,
+            factory,
+        )
+        return factory
+
+    return decorator
+
+
+def _rule_matrix_ftyp() -> bytes:
+    return box("ftyp", brand_payload("isom", 0x200, ["isom", "iso2", "mp41"]))
+
+
+def _rule_matrix_moov(children: bytes = b"", *, duration: int = 0, next_track_id: int = 2) -> bytes:
+    return box("moov", build_movie_header(600, duration, next_track_id) + children)
+
+
+def iter_single_sample_movie(
+    sample_entries: list[bytes], stsc_entries: Optional[list[tuple[int, int, int]]] = None
+) -> Iterator[bytes]:
+    """Yield a valid one-sample, one-chunk video movie with the given tables.
+
+    ``stsc_entries`` defaults to the single correct run, and the chunk offset
+    always points at the sample inside ``mdat``.
+    """
+
+    stsc_entries = stsc_entries or [(1, 1, 1)]
+
+    def build_moov(chunk_offset: int) -> bytes:
+        stbl = box(
+            "stbl",
+            build_sample_description_box(sample_entries)
+            + build_time_to_sample_box([(1, 1_001)])
+            + build_sample_to_chunk_box(stsc_entries)
+            + build_sample_size_box([RULE_MATRIX_SAMPLE_SIZE])
+            + build_chunk_offset_box([chunk_offset]),
+        )
+        minf = box("minf", build_video_media_header() + build_data_information() + stbl)
+        mdia = box(
+            "mdia",
+            build_media_header(30_000, 1_001) + build_handler_box("vide", "Track 1") + minf,
+        )
+        trak = box("trak", build_track_header(1, 20, 640, 360) + mdia)
+        return _rule_matrix_moov(trak, duration=20)
+
+    ftyp = _rule_matrix_ftyp()
+    mdat = box("mdat", bytes(RULE_MATRIX_SAMPLE_SIZE))
+    yield ftyp
+    yield build_moov(len(ftyp) + len(build_moov(0)) + 8)
+    yield mdat
+
+
+def _iter_batched(boxes: Iterable[bytes], batch_size: int = 4_096) -> Iterator[bytes]:
+    batch = bytearray()
+    for index, data in enumerate(boxes, start=1):
+        batch.extend(data)
+        if index % batch_size == 0:
+            yield bytes(batch)
+            batch.clear()
+    if batch:
+        yield bytes(batch)
+
+
+@rule_violation_generator(
+    "VR-001",
+    rule="StructuralSizeRule",
+    description="udta boxes whose only child declares a size smaller than its header.",
+    rule_ids=(),
+    parse_issues=("header.invalid_size",),
+)
+def violate_structural_size(count: int) -> Iterator[bytes]:
+    udta = box("udta", (4).to_bytes(4, "big") + b"free")
+    yield _rule_matrix_ftyp()
+    yield box_header("moov", len(build_movie_header(600, 0, 1)) + count * len(udta))
+    yield build_movie_header(600, 0, 1)
+    yield from _iter_batched(udta for _ in range(count))
+
+
+@rule_violation_generator(
+    "VR-002",
+    rule="ContainerBoundaryRule",
+    description="udta boxes whose children stop four bytes short of the container end.",
+    parse_issues=("header.truncated_field",),
+)
+def violate_container_boundary(count: int) -> Iterator[bytes]:
+    udta = box("udta", box("free", b"") + bytes(4))
+    yield _rule_matrix_ftyp()
+    yield box_header("moov", len(build_movie_header(600, 0, 1)) + count * len(udta))
+    yield build_movie_header(600, 0, 1)
+    yield from _iter_batched(udta for _ in range(count))
+
+
+@rule_violation_generator(
+    "VR-003",
+    rule="VersionFlagsRule",
+    description="Tracks whose tkhd flags differ from the catalog's expected 0x000007.",
+)
+def violate_version_flags(count: int) -> Iterator[bytes]:
+    traks = (
+        box("trak", build_track_header(track_id, 0, flags=0x000001))
+        for track_id in range(1, count + 1)
+    )
+    mvhd = build_movie_header(600, 0, count + 1)
+    trak_size = len(box("trak", build_track_header(1, 0)))
+    yield _rule_matrix_ftyp()
+    yield box_header("moov", len(mvhd) + count * trak_size)
+    yield mvhd
+    yield from _iter_batched(traks)
+
+
+@rule_violation_generator(
+    "VR-004",
+    rule="FileTypeOrderingRule",
+    description="Empty moov boxes ahead of ftyp (also raises one E3 advisory).",
+    rule_ids=("VR-004", "E3"),
+)
+def violate_file_type_ordering(count: int) -> Iterator[bytes]:
+    yield from _iter_batched(box("moov", b"") for _ in range(count))
+    yield _rule_matrix_ftyp()
+    yield _rule_matrix_moov()
+
+
+@rule_violation_generator(
+    "VR-005",
+    rule="MovieDataOrderingRule",
+    description="mdat boxes between ftyp and moov in a non-fragmented file.",
+)
+def violate_movie_data_ordering(count: int) -> Iterator[bytes]:
+    yield _rule_matrix_ftyp()
+    yield from _iter_batched(box("mdat", bytes(8)) for _ in range(count))
+    yield _rule_matrix_moov()
+
+
+@rule_violation_generator(
+    "VR-006",
+    rule="UnknownBoxRule",
+    description="Top-level boxes with unregistered random fourccs.",
+)
+def violate_unknown_box(count: int) -> Iterator[bytes]:
+    return iter_unknown_box_flood(count, uuid_ratio=0.0)
+
+
+@rule_violation_generator(
+    "VR-014",
+    rule="EditListValidationRule",
+    description="One track whose elst entries each play at media_rate_integer 2.",
+)
+def violate_edit_list(count: int) -> list[bytes]:
+    entries = [
+        {"segment_duration": 600, "media_time": index * 600, "media_rate_integer": 2}
+        for index in range(count)
+    ]
+    duration = count * 600
+    return [
+        build_edit_list_fixture(
+            entries=entries,
+            movie_duration=duration,
+            track_id=1,
+            track_duration=duration,
+            media_timescale=600,
+            media_duration=duration,
+        )
+    ]
+
+
+@rule_violation_generator(
+    "VR-015",
+    rule="SampleTableCorrelationRule",
+    description="stsc entries with first_chunk 0 ahead of the one valid run.",
+)
+def violate_sample_table_correlation(count: int) -> Iterator[bytes]:
+    entries = [(0, 1, 1)] * count + [(1, 1, 1)]
+    return iter_single_sample_movie([build_visual_sample_entry("mp4v", 640, 360)], entries)
+
+
+@rule_violation_generator(
+    "VR-016",
+    rule="FragmentSequenceRule",
+    description="moof boxes whose mfhd sequence numbers count down after the first fragment.",
+)
+def violate_fragment_sequence(count: int) -> Iterator[bytes]:
+    yield build_fragmented_movie_init([make_video_track(1, 1)])
+    sequence_numbers = range(count + 1, 0, -1)
+    yield from _iter_batched(
+        box("moof", full_box("mfhd", 0, 0, sequence.to_bytes(4, "big")))
+        for sequence in sequence_numbers
+    )
+
+
+@rule_violation_generator(
+    "VR-017",
+    rule="FragmentRunValidationRule",
+    description="Fragments whose trun declares sample_count 0.",
+)
+def violate_fragment_run(count: int) -> Iterator[bytes]:
+    traf = box(
+        "traf",
+        build_track_fragment_header(1, 0x020000) + build_track_run(sample_count=0, flags=0),
+    )
+    yield build_fragmented_movie_init([make_video_track(1, 1)])
+    yield from _iter_batched(
+        box("moof", full_box("mfhd", 0, 0, sequence.to_bytes(4, "big")) + traf)
+        for sequence in range(1, count + 1)
+    )
+
+
+@rule_violation_generator(
+    "VR-018",
+    rule="CodecConfigurationValidationRule",
+    description="avc1 sample entries whose avcC carries a zero-length SPS.",
+)
+def violate_codec_configuration(count: int) -> Iterator[bytes]:
+    avcc = build_avc_configuration_box([b""], [synthetic_nal_unit(b"\x68", 4, 1)])
+    entry = build_visual_sample_entry("avc1", 1920, 1080, avcc)
+    return iter_single_sample_movie([entry] * count)
+
+
+@rule_violation_generator(
+    "E3",
+    rule="TopLevelOrderingAdvisoryRule",
+    description="pdin boxes between ftyp and moov; the advisory fires once per file.",
+)
+def violate_top_level_ordering(count: int) -> Iterator[bytes]:
+    yield _rule_matrix_ftyp()
+    yield from _iter_batched(full_box("pdin", 0, 0, b"") for _ in range(count))
+    yield _rule_matrix_moov()
+
+
+def generate_rule_matrix_fixtures(
+    rule_ids: Optional[Iterable[str]] = None,
+    counts: Iterable[int] = DEFAULT_RULE_MATRIX_COUNTS,
+    root: Path = DEFAULT_RULE_MATRIX_ROOT,
+) -> list[Path]:
+    """Write one fixture per ``(rule, count)`` pair plus ``rule-matrix.json``.
+
+    Catalog entries are keyed by ``<rule>-<count>`` and record the injected
+    violation count, the rule and parse issue codes the validator must report,
+    and the file's size and SHA-256. Rules that are not regenerated keep their
+    existing catalog entries.
+    """
+
+    selected = list(rule_ids) if rule_ids else list(RULE_VIOLATION_GENERATORS)
+    catalog_path = root / RULE_MATRIX_CATALOG
+    entries: dict[str, dict] = {}
+    if catalog_path.exists():
+        existing = json.loads(catalog_path.read_text(encoding="utf-8"))
+        entries = {entry["id"]: entry for entry in existing.get("fixtures", [])}
+
+    paths = []
+    for rule_id in selected:
+        generator = RULE_VIOLATION_GENERATORS[rule_id]
+        for count in counts:
+            fixture_id = f"{generator.slug}-{count}"
+            path = root / f"{fixture_id}.{STRESS_EXTENSION}"
+            metadata = rule_matrix_fixture_metadata(generator, count)
+            write_stream_fixture(path, generator.factory(count), metadata)
+            sidecar = json.loads(
+                path.with_suffix(path.suffix + ".json").read_text(encoding="utf-8")
+            )
+            entries[fixture_id] = {"id": fixture_id, "filename": path.name, **sidecar}
+            paths.append(path)
+
+    ordered = sorted(entries.values(), key=lambda entry: (entry["rule_id"], entry["violations"]))
+    catalog = {"fixtures": ordered}
+    catalog_path.write_text(json.dumps(catalog, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return paths
+
+
+def rule_matrix_fixture_metadata(generator: RuleViolationGenerator, count: int) -> dict:
+    return {
+        "generator": "rule-matrix",
+        "rule_id": generator.rule_id,
+        "rule": generator.rule,
+        "violations": count,
+        "expected_rule_ids": list(generator.rule_ids),
+        "expected_parse_issues": list(generator.parse_issues),
+        "description": generator.description,
+    }
+
+
+def parse_count_list(value: str) -> tuple[int, ...]:
+    try:
+        counts = tuple(int(part) for part in value.split(",") if part.strip())
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid count list {value!r}") from exc
+    if not counts or any(count <= 0 for count in counts):
+        raise argparse.ArgumentTypeError("counts must be positive integers")
+    return counts
+
+
+# Builder profiling -------------------------------------------------------------
+
+DEFAULT_PROFILE_REPEATS = 5
+DEFAULT_PROFILE_MEMORY_RATIO = 4.0
+DEFAULT_PROFILE_JSON = DEFAULT_STRESS_ROOT / "builder-profile.json"
+# Builders whose output is smaller than this are judged against this floor so
+# interpreter noise on tiny fixtures is not reported as a memory problem.
+PROFILE_MEMORY_FLOOR = BUFFER_SIZE
+
+
+@dataclass
+class BuilderProfile:
+    """Timing and allocation measurements for one builder."""
+
+    name: str
+    kind: str
+    repeats: int
+    median_seconds: float
+    byte_size: int
+    peak_bytes: int
+    flagged: bool = False
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.median_seconds <= 0:
+            return 0.0
+        return self.byte_size / self.median_seconds / 1_000_000
+
+    @property
+    def memory_ratio(self) -> float:
+        return self.peak_bytes / max(self.byte_size, 1)
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "repeats": self.repeats,
+            "median_seconds": self.median_seconds,
+            "byte_size": self.byte_size,
+            "megabytes_per_second": self.megabytes_per_second,
+            "peak_bytes": self.peak_bytes,
+            "memory_ratio": self.memory_ratio,
+            "flagged": self.flagged,
+        }
+
+
+def iter_profiled_builders(
+    stress_scale: Optional[int] = None,
+) -> Iterator[tuple[str, str, Callable[[], Iterable[bytes]]]]:
+    """Yield ``(name, kind, factory)`` for every registered fixture builder.
+
+    Builders come from :func:`list_fixture_builders`, so every registry
+    :func:`build_fixture` accepts is profiled. Stress families run at
+    ``stress_scale`` when given, otherwise at their default scale; rule
+    matrix families inject a single violation.
+    """
+
+    for name, kind in list_fixture_builders():
+        scale = stress_scale if kind == "stress" else None
+        _, factory, _ = resolve_fixture_builder(name, scale)
+        yield name, kind, factory
+
+
+def _drain(factory: Callable[[], Iterable[bytes]]) -> int:
+    return sum(len(chunk) for chunk in factory())
+
+
+def profile_builder(
+    name: str,
+    kind: str,
+    factory: Callable[[], Iterable[bytes]],
+    *,
+    repeats: int = DEFAULT_PROFILE_REPEATS,
+    memory_ratio: float = DEFAULT_PROFILE_MEMORY_RATIO,
+) -> BuilderProfile:
+    """Time ``repeats`` untraced runs and one ``tracemalloc`` run of ``factory``.
+
+    Output chunks are consumed and discarded, so streaming builders are
+    measured by their working set rather than by the size of the file.
+    """
+
+    timings = []
+    byte_size = 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        byte_size = _drain(factory)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        _drain(factory)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BuilderProfile(
+        name=name,
+        kind=kind,
+        repeats=repeats,
+        median_seconds=statistics.median(timings),
+        byte_size=byte_size,
+        peak_bytes=peak_bytes,
+        flagged=peak_bytes > memory_ratio * max(byte_size, PROFILE_MEMORY_FLOOR),
+    )
+
+
+def profile_builders(
+    *,
+    repeats: int = DEFAULT_PROFILE_REPEATS,
+    memory_ratio: float = DEFAULT_PROFILE_MEMORY_RATIO,
+    stress_scale: Optional[int] = None,
+    names: Optional[Iterable[str]] = None,
+) -> list[BuilderProfile]:
+    selected = set(names) if names else None
+    profiles = []
+    for name, kind, factory in iter_profiled_builders(stress_scale):
+        if selected is not None and name not in selected:
+            continue
+        profiles.append(
+            profile_builder(name, kind, factory, repeats=repeats, memory_ratio=memory_ratio)
+        )
+        logger.debug("Profiled %s", name)
+    return profiles
+
+
+def format_profile_table(profiles: list[BuilderProfile], memory_ratio: float) -> str:
+    headers = ("builder", "kind", "median ms", "bytes", "MB/s", "peak KiB", "peak/out", "flag")
+    rows = [
+        (
+            profile.name,
+            profile.kind,
+            f"{profile.median_seconds * 1_000:.2f}",
+            str(profile.byte_size),
+            f"{profile.megabytes_per_second:.1f}",
+            f"{profile.peak_bytes / 1024:.1f}",
+            f"{profile.memory_ratio:.2f}",
+            f"> {memory_ratio:g}x" if profile.flagged else "",
+        )
+        for profile in profiles
+    ]
+    widths = [max(len(row[index]) for row in [headers, *rows]) for index in range(len(headers))]
+    numeric = {2, 3, 4, 5, 6}
+
+    def render(row: tuple[str, ...]) -> str:
+        cells = [
+            cell.rjust(width) if index in numeric else cell.ljust(width)
+            for index, (cell, width) in enumerate(zip(row, widths))
+        ]
+        return "  ".join(cells).rstrip()
+
+    lines = [render(headers), "  ".join("-" * width for width in widths).rstrip()]
+    lines.extend(render(row) for row in rows)
+    return "\n".join(lines)
+
+
+def write_profile_report(
+    profiles: list[BuilderProfile], path: Path, *, repeats: int, memory_ratio: float
+) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "repeats": repeats,
+        "memory_ratio": memory_ratio,
+        "builders": [profile.as_dict() for profile in profiles],
+        "flagged": [profile.name for profile in profiles if profile.flagged],
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+# In-memory fixtures ----------------------------------------------------------------
+
+
+@dataclass
+class FixtureBuffer:
+    """Fixture bytes built in memory, with the metadata a sidecar would carry.
+
+    ``data`` is a writable ``memoryview`` over either a buffer owned by the
+    result or the caller's buffer passed to :func:`build_fixture_into`.
+    """
+
+    name: str
+    kind: str
+    data: memoryview
+    metadata: dict
+
+
+def list_fixture_builders() -> list[tuple[str, str]]:
+    """Return ``(name, kind)`` for every builder :func:`build_fixture` accepts.
+
+    Kinds are ``text``, ``corrupt``, ``stress`` and ``rule-matrix``; names are
+    unique across kinds.
+    """
+
+    builders = [(name, "text") for name in TEXT_FIXTURE_BUILDERS]
+    builders.extend((name, "corrupt") for name in CORRUPT_FIXTURE_BUILDERS)
+    builders.extend((name, "stress") for name in STRESS_GENERATORS)
+    builders.extend((rule_id, "rule-matrix") for rule_id in RULE_VIOLATION_GENERATORS)
+    return builders
+
+
+def resolve_fixture_builder(
+    name: str, scale: Optional[int] = None
+) -> tuple[str, Callable[[], Iterable[bytes]], dict]:
+    """Return ``(kind, factory, metadata)`` for the builder called ``name``.
+
+    ``scale`` is the stress scale or rule violation count; it defaults to the
+    stress family's default scale and to a single violation.
+    """
+
+    if name in TEXT_FIXTURE_BUILDERS:
+        builder = TEXT_FIXTURE_BUILDERS[name]
+        return "text", lambda: [builder()], {"generator": name}
+    if name in CORRUPT_FIXTURE_BUILDERS:
+        builder = CORRUPT_FIXTURE_BUILDERS[name]
+        return "corrupt", lambda: [builder()], {"generator": name}
+    if name in STRESS_GENERATORS:
+        generator = STRESS_GENERATORS[name]
+        resolved = scale if scale is not None else generator.default_scale
+        metadata = stress_fixture_metadata(generator, resolved)
+        return "stress", lambda: generator.factory(resolved), metadata
+    if name in RULE_VIOLATION_GENERATORS:
+        rule = RULE_VIOLATION_GENERATORS[name]
+        count = scale if scale is not None else 1
+        return "rule-matrix", lambda: rule.factory(count), rule_matrix_fixture_metadata(rule, count)
+    raise KeyError(f"Unknown fixture builder {name!r}")
+
+
+def build_fixture(name: str, *, scale: Optional[int] = None) -> FixtureBuffer:
+    """Build fixture ``name`` into a new buffer without touching disk."""
+
+    kind, factory, metadata = resolve_fixture_builder(name, scale)
+    buffer = bytearray()
+    hasher = hashlib.sha256()
+    for chunk in factory():
+        buffer.extend(chunk)
+        hasher.update(chunk)
+    metadata.update({"byte_size": len(buffer), "sha256": hasher.hexdigest()})
+    return FixtureBuffer(name, kind, memoryview(buffer), metadata)
+
+
+def measure_fixture(name: str, *, scale: Optional[int] = None) -> int:
+    """Return the size in bytes of fixture ``name`` without keeping its output."""
+
+    _, factory, _ = resolve_fixture_builder(name, scale)
+    return _drain(factory)
+
+
+def build_fixture_into(
+    name: str,
+    buffer,
+    *,
+    offset: int = 0,
+    scale: Optional[int] = None,
+) -> FixtureBuffer:
+    """Stream fixture ``name`` into the writable ``buffer`` starting at ``offset``.
+
+    ``buffer`` is anything exposing a writable buffer (``bytearray``,
+    ``mmap``, ``array``, a ``memoryview``); it is addressed as raw bytes.
+    Size it with :func:`measure_fixture`. ``ValueError`` is raised before
+    writing a chunk that would not fit.
+    """
+
+    kind, factory, metadata = resolve_fixture_builder(name, scale)
+    target = memoryview(buffer).cast("B")
+    if target.readonly:
+        raise ValueError("buffer must be writable")
+    if not 0 <= offset <= len(target):
+        raise ValueError(f"offset {offset} outside buffer of {len(target)} bytes")
+    hasher = hashlib.sha256()
+    cursor = offset
+    for chunk in factory():
+        end = cursor + len(chunk)
+        if end > len(target):
+            raise ValueError(
+                f"{name} does not fit: buffer has {len(target) - offset} bytes after offset"
+            )
+        target[cursor:end] = chunk
+        hasher.update(chunk)
+        cursor = end
+    metadata.update({"byte_size": cursor - offset, "sha256": hasher.hexdigest()})
+    return FixtureBuffer(name, kind, target[offset:cursor], metadata)
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate deterministic fixtures and optionally download external "
+            "assets described by a manifest."
+        )
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="Path to manifest describing remote fixtures to download.",
+    )
+    parser.add_argument(
+        "--distribution-root",
+        type=Path,
+        default=DEFAULT_DISTRIBUTION_ROOT,
+        help="Directory root for mirrored fixture binaries.",
+    )
+    parser.add_argument(
+        "--license-root",
+        type=Path,
+        default=DEFAULT_LICENSE_ROOT,
+        help="Directory for mirrored license texts.",
+    )
+    parser.add_argument(
+        "--corrupt-root",
+        type=Path,
+        default=DEFAULT_CORRUPT_ROOT,
+        help="Directory for generated corrupt fixture binaries.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate manifest metadata without downloading fixtures.",
+    )
+    parser.add_argument(
+        "--skip-text-fixtures",
+        action="store_true",
+        help="Skip regeneration of base64 text fixtures.",
+    )
+    parser.add_argument(
+        "--skip-corrupt-fixtures",
+        action="store_true",
+        help="Skip regeneration of corrupt binary fixtures.",
+    )
+    parser.add_argument(
+        "--stress",
+        action="append",
+        default=[],
+        choices=sorted(STRESS_GENERATORS) + ["all"],
+        help="Stress fixture family to generate (repeatable, or 'all').",
+    )
+    parser.add_argument(
+        "--stress-scale",
+        type=int,
+        default=None,
+        help="Override the primary scale (samples, entries, boxes, ...) of stress fixtures.",
+    )
+    parser.add_argument(
+        "--stress-root",
+        type=Path,
+        default=DEFAULT_STRESS_ROOT,
+        help="Directory for generated stress fixture binaries and sidecars.",
+    )
+    parser.add_argument(
+        "--random-trees",
+        type=int,
+        default=0,
+        metavar="COUNT",
+        help="Generate COUNT seeded random trees (seeds --seed .. --seed + COUNT - 1).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="First seed used by --random-trees.",
+    )
+    parser.add_argument(
+        "--random-tree-root",
+        type=Path,
+        default=DEFAULT_RANDOM_TREE_ROOT,
+        help="Directory for generated random trees and sidecars.",
+    )
+    parser.add_argument(
+        "--rule-matrix",
+        action="append",
+        default=[],
+        choices=list(RULE_VIOLATION_GENERATORS) + ["all"],
+        help="Validation rule to generate violation fixtures for (repeatable, or 'all').",
+    )
+    parser.add_argument(
+        "--rule-matrix-counts",
+        type=parse_count_list,
+        default=DEFAULT_RULE_MATRIX_COUNTS,
+        metavar="N[,N...]",
+        help="Violation counts per rule (default: 1,1000,100000).",
+    )
+    parser.add_argument(
+        "--rule-matrix-root",
+        type=Path,
+        default=DEFAULT_RULE_MATRIX_ROOT,
+        help="Directory for rule matrix fixtures and rule-matrix.json.",
+    )
+    parser.add_argument(
+        "--profile-builders",
+        action="store_true",
+        help="Time every registered builder and report throughput and peak memory, then exit.",
+    )
+    parser.add_argument(
+        "--profile-repeats",
+        type=int,
+        default=DEFAULT_PROFILE_REPEATS,
+        help="Timed runs per builder for --profile-builders.",
+    )
+    parser.add_argument(
+        "--profile-memory-ratio",
+        type=float,
+        default=DEFAULT_PROFILE_MEMORY_RATIO,
+        help="Flag builders whose peak traced memory exceeds this multiple of their output.",
+    )
+    parser.add_argument(
+        "--profile-only",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Restrict --profile-builders to the named builder (repeatable).",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        default=DEFAULT_PROFILE_JSON,
+        help="Path for the JSON profile report.",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        help="Logging level (DEBUG, INFO, WARNING, ...).",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = build_argument_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
+
+    if args.profile_builders:
+        profiles = profile_builders(
+            repeats=args.profile_repeats,
+            memory_ratio=args.profile_memory_ratio,
+            stress_scale=args.stress_scale,
+            names=args.profile_only,
+        )
+        print(format_profile_table(profiles, args.profile_memory_ratio))
+        write_profile_report(
+            profiles,
+            args.profile_json,
+            repeats=args.profile_repeats,
+            memory_ratio=args.profile_memory_ratio,
+        )
+        logger.info("Wrote %s", args.profile_json)
+        return 0
+
+    if not args.skip_text_fixtures:
+        generate_text_fixtures()
+
+    if not args.skip_corrupt_fixtures:
+        generate_corrupt_fixtures(args.corrupt_root)
+
+    if args.stress:
+        names = sorted(STRESS_GENERATORS) if "all" in args.stress else args.stress
+        generate_stress_fixtures(names, args.stress_root, args.stress_scale)
+
+    if args.random_trees:
+        generate_random_tree_fixtures(
+            args.random_trees,
+            args.random_tree_root,
+            seed=args.seed,
+            max_samples=args.stress_scale,
+        )
+
+    if args.rule_matrix:
+        rule_ids = None if "all" in args.rule_matrix else args.rule_matrix
+        generate_rule_matrix_fixtures(rule_ids, args.rule_matrix_counts, args.rule_matrix_root)
 
     if args.manifest:
         try:
@@ -0,0 +1,73 @@
+import array
+import hashlib
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from test_generate_fixtures_manifest import load_generate_fixtures_module
+
+
+class InMemoryFixtureTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def test_every_builder_is_listed_once(self):
+        builders = self.module.list_fixture_builders()
+        names = [name for name, _ in builders]
+        self.assertEqual(len(names), len(set(names)))
+        kinds = dict(builders)
+        self.assertEqual(kinds["dash_segment_1"], "text")
+        self.assertEqual(kinds["empty-file.mp4"], "corrupt")
+        self.assertEqual(kinds["sample-table"], "stress")
+        self.assertEqual(kinds["VR-016"], "rule-matrix")
+
+    def test_text_fixture_matches_builder(self):
+        fixture = self.module.build_fixture("dash_segment_1")
+        expected = self.module.build_dash_segment()
+        self.assertIsInstance(fixture.data, memoryview)
+        self.assertEqual(fixture.kind, "text")
+        self.assertEqual(fixture.data, expected)
+        self.assertEqual(fixture.metadata["sha256"], hashlib.sha256(expected).hexdigest())
+
+    def test_metadata_matches_written_sidecar(self):
+        fixture = self.module.build_fixture("edit-list", scale=40)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.module.generate_stress_fixtures(["edit-list"], Path(tmp), 40)[0]
+            sidecar = json.loads(path.with_suffix(".mp4.json").read_text(encoding="utf-8"))
+            written = path.read_bytes()
+        self.assertEqual(fixture.metadata, sidecar)
+        self.assertEqual(fixture.data, written)
+
+    def test_build_into_caller_buffer(self):
+        size = self.module.measure_fixture("VR-017", scale=3)
+        buffer = bytearray(b"\xAA" * (size + 10))
+        fixture = self.module.build_fixture_into("VR-017", buffer, offset=4, scale=3)
+        expected = self.module.build_fixture("VR-017", scale=3)
+
+        self.assertEqual(fixture.metadata, expected.metadata)
+        self.assertEqual(fixture.data, expected.data)
+        self.assertEqual(bytes(buffer[:4]), b"\xAA" * 4)
+        self.assertEqual(bytes(buffer[4 + size :]), b"\xAA" * 6)
+
+        fixture.data[0] = 0
+        self.assertEqual(buffer[4], 0)
+
+    def test_build_into_typed_buffer(self):
+        expected = self.module.build_fixture("invalid-fourcc.mp4").data
+        words = array.array("I", bytes(16))
+        fixture = self.module.build_fixture_into("invalid-fourcc.mp4", words)
+        self.assertEqual(fixture.data, expected)
+        self.assertEqual(words.tobytes()[: len(expected)], expected)
+
+    def test_small_or_readonly_buffers_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.module.build_fixture_into("dash_segment_1", bytearray(8))
+        with self.assertRaises(ValueError):
+            self.module.build_fixture_into("dash_segment_1", bytes(4096))
+        with self.assertRaises(KeyError):
+            self.module.build_fixture("not-a-fixture")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,671 @@
+import json
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from test_generate_fixtures_manifest import load_generate_fixtures_module
+
+CONTAINERS = {
+    "moov", "trak", "mdia", "minf", "stbl", "dinf", "edts", "moof", "traf", "mfra", "udta",
+}
+
+
+def walk_boxes(data: bytes, start: int = 0, end: int | None = None, path: tuple = ()):
+    """Yield ``(path, payload_start, payload_end)`` for every box in ``data``."""
+
+    end = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, offset)
+        header = 8
+        if size == 1:
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header = 16
+        box_type = box_type.decode("latin-1")
+        box_path = path + (box_type,)
+        yield box_path, offset + header, offset + size
+        if box_type in CONTAINERS:
+            yield from walk_boxes(data, offset + header, offset + size, box_path)
+        offset += size
+
+
+def full_box_uint32s(data: bytes, start: int, end: int) -> list[int]:
+    body = data[start + 4 : end]
+    return list(struct.unpack(f">{len(body) // 4}I", body))
+
+
+class SampleTableStressTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def sample_tables(self, data: bytes) -> list[dict]:
+        tracks: list[dict] = []
+        for path, start, end in walk_boxes(data):
+            if path[-1] == "trak":
+                tracks.append({})
+            elif len(path) > 1 and path[-2] == "stbl":
+                tracks[-1][path[-1]] = (start, end)
+        return tracks
+
+    def assert_tables_correlate(self, data: bytes) -> None:
+        mdat = next((s, e) for p, s, e in walk_boxes(data) if p == ("mdat",))
+        tracks = self.sample_tables(data)
+        self.assertEqual(len(tracks), 2)
+        for tables in tracks:
+            stsz = full_box_uint32s(data, *tables["stsz"])
+            sample_size, sample_count, sizes = stsz[0], stsz[1], stsz[2:]
+            self.assertEqual(sample_size, 0)
+            self.assertEqual(len(sizes), sample_count)
+
+            stts = full_box_uint32s(data, *tables["stts"])
+            self.assertEqual(sum(stts[1::2]), sample_count)
+            ctts = full_box_uint32s(data, *tables["ctts"])
+            self.assertEqual(sum(ctts[1::2]), sample_count)
+            stss = full_box_uint32s(data, *tables["stss"])
+            self.assertTrue(all(1 <= number <= sample_count for number in stss[1:]))
+
+            offset_type = "co64" if "co64" in tables else "stco"
+            start, end = tables[offset_type]
+            if offset_type == "co64":
+                count = struct.unpack_from(">I", data, start + 4)[0]
+                offsets = list(struct.unpack_from(f">{count}Q", data, start + 8))
+            else:
+                offsets = full_box_uint32s(data, start, end)[1:]
+
+            stsc = full_box_uint32s(data, *tables["stsc"])[1:]
+            runs = [tuple(stsc[index : index + 3]) for index in range(0, len(stsc), 3)]
+            per_chunk = []
+            for index, (first_chunk, samples_per_chunk, _) in enumerate(runs):
+                last_chunk = runs[index + 1][0] if index + 1 < len(runs) else len(offsets) + 1
+                per_chunk.extend([samples_per_chunk] * (last_chunk - first_chunk))
+            self.assertEqual(len(per_chunk), len(offsets))
+            self.assertEqual(sum(per_chunk), sample_count)
+
+            cursor = 0
+            for chunk_offset, count in zip(offsets, per_chunk):
+                chunk_size = sum(sizes[cursor : cursor + count])
+                cursor += count
+                self.assertGreaterEqual(chunk_offset, mdat[0])
+                self.assertLessEqual(chunk_offset + chunk_size, mdat[1])
+
+    def test_sample_tables_reference_mdat_ranges(self):
+        self.assert_tables_correlate(self.module.build_sample_table_fixture(500))
+
+    def test_co64_variant_correlates(self):
+        self.assert_tables_correlate(self.module.build_sample_table_fixture(200, force_co64=True))
+
+    def test_durations_beyond_32_bits_use_version_1_headers(self):
+        # Same media duration as ~4.4M samples at 30000/1001, with far fewer samples.
+        track = self.module.make_video_track(1, 30, timescale=1_000, sample_delta=150_000_000)
+        self.assertGreater(track.media_duration, 0xFFFF_FFFF)
+        trak = self.module.build_sample_table_trak(track, [0, 0, 0], movie_timescale=1_000)
+        moov = self.module.box(
+            "moov", self.module.build_movie_header(1_000, track.media_duration, 2) + trak
+        )
+
+        headers = {p[-1]: (s, e) for p, s, e in walk_boxes(moov) if p[-1] in ("mvhd", "tkhd", "mdhd")}
+        duration_offsets = {"mvhd": 24, "tkhd": 28, "mdhd": 24}
+        for name, (start, end) in headers.items():
+            self.assertEqual(moov[start], 1, name)
+            duration = struct.unpack_from(">Q", moov, start + duration_offsets[name])[0]
+            self.assertEqual(duration, track.media_duration, name)
+        self.assertEqual(headers["mvhd"][1] - headers["mvhd"][0], 112)
+        self.assertEqual(headers["tkhd"][1] - headers["tkhd"][0], 96)
+        self.assertEqual(headers["mdhd"][1] - headers["mdhd"][0], 36)
+
+    def test_short_durations_keep_version_0_headers(self):
+        self.assertEqual(self.module.build_media_header(1_000, 0xFFFF_FFFF)[8], 0)
+        self.assertEqual(len(self.module.build_movie_header(1_000, 0xFFFF_FFFF, 2)), 108)
+
+    def test_stress_generation_writes_sidecar(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = self.module.generate_stress_fixtures(["sample-table"], Path(tmp), scale=50)
+            sidecar = json.loads(paths[0].with_suffix(".mp4.json").read_text(encoding="utf-8"))
+
+            self.assertEqual(sidecar["generator"], "sample-table")
+            self.assertEqual(sidecar["scale"], 50)
+            self.assertEqual(sidecar["byte_size"], paths[0].stat().st_size)
+
+
+class EditListStressTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def test_entries_mix_empty_dwell_and_rate_edits(self):
+        entries = self.module.make_edit_list_entries(70)
+
+        self.assertTrue(any(entry["media_time"] == -1 for entry in entries))
+        self.assertTrue(any(entry.get("media_rate_integer") == 0 for entry in entries))
+        self.assertTrue(any(entry.get("media_rate_integer") == 2 for entry in entries))
+        self.assertTrue(any(entry.get("media_rate_fraction") == 0x8000 for entry in entries))
+
+    def test_version_1_movie_declares_every_entry(self):
+        data = self.module.build_edit_list_stress_movie(300, track_count=3, version=1)
+
+        edit_lists = [(s, e) for p, s, e in walk_boxes(data) if p[-1] == "elst"]
+        self.assertEqual(len(edit_lists), 3)
+        for start, end in edit_lists:
+            version = data[start]
+            count = struct.unpack_from(">I", data, start + 4)[0]
+            self.assertEqual(version, 1)
+            self.assertEqual(count, 300)
+            self.assertEqual(end - start, 8 + count * 20)
+
+
+class EncryptionStressTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def assert_fragments_consistent(self, data: bytes, iv_size: int) -> None:
+        boxes = list(walk_boxes(data))
+        moofs = [(s - 8, e) for p, s, e in boxes if p == ("moof",)]
+        mdats = [(s, e) for p, s, e in boxes if p == ("mdat",)]
+        self.assertEqual(len(moofs), 3)
+        for (moof_start, moof_end), (mdat_start, mdat_end) in zip(moofs, mdats):
+            inner = {p[-1]: (s, e) for p, s, e in boxes if moof_start < s < moof_end}
+            senc_start, senc_end = inner["senc"]
+            flags = int.from_bytes(data[senc_start + 1 : senc_start + 4], "big")
+            self.assertEqual(flags, 0x000003)
+            self.assertEqual(data[senc_start + 7], iv_size)
+            sample_count = struct.unpack_from(">I", data, senc_start + 24)[0]
+
+            saio_start, _ = inner["saio"]
+            version = data[saio_start]
+            offset_format = ">Q" if version == 1 else ">I"
+            aux_offset = struct.unpack_from(offset_format, data, saio_start + 16)[0]
+            self.assertEqual(moof_start + aux_offset, senc_start + 28)
+
+            saiz_start, saiz_end = inner["saiz"]
+            self.assertEqual(struct.unpack_from(">I", data, saiz_start + 13)[0], sample_count)
+            aux_sizes = data[saiz_start + 17 : saiz_end]
+            self.assertEqual(sum(aux_sizes), senc_end - (senc_start + 28))
+
+            trun_start, _ = inner["trun"]
+            count, data_offset = struct.unpack_from(">Ii", data, trun_start + 4)
+            sizes = struct.unpack_from(f">{count}I", data, trun_start + 12)
+            self.assertEqual(count, sample_count)
+            self.assertEqual(moof_start + data_offset, mdat_start)
+            self.assertEqual(sum(sizes), mdat_end - mdat_start)
+
+    def test_iv8_fragments_are_consistent(self):
+        data = b"".join(self.module.iter_encrypted_fragmented_movie(3, 40, iv_size=8))
+        self.assert_fragments_consistent(data, 8)
+
+    def test_iv16_fragments_use_64_bit_offsets(self):
+        data = b"".join(
+            self.module.iter_encrypted_fragmented_movie(3, 40, iv_size=16, saio_version=1)
+        )
+        self.assert_fragments_consistent(data, 16)
+
+
+class SampleDescriptionStressTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def child_boxes(self, entry: bytes, header_length: int) -> dict:
+        return {p[-1]: entry[s:e] for p, s, e in walk_boxes(entry, 8 + header_length, len(entry))}
+
+    def test_avc_configuration_counts_match_payload(self):
+        entry = self.module.build_avc_sample_entry(5)
+        avcc = self.child_boxes(entry, 78)["avcC"]
+
+        self.assertEqual(avcc[4] & 0x03, 3)
+        self.assertEqual(avcc[5] & 0x1F, 1)
+        sps_length = struct.unpack_from(">H", avcc, 6)[0]
+        self.assertEqual(avcc[8], 0x67)
+        pps_count = avcc[8 + sps_length]
+        pps_length = struct.unpack_from(">H", avcc, 9 + sps_length)[0]
+        self.assertEqual(pps_count, 1)
+        self.assertEqual(len(avcc), 11 + sps_length + pps_length + 4)
+
+    def test_hevc_arrays_are_complete(self):
+        entry = self.module.build_hevc_sample_entry(3, nal_units_per_array=5)
+        hvcc = self.child_boxes(entry, 78)["hvcC"]
+
+        self.assertEqual(hvcc[22], 4)
+        cursor = 23
+        types = []
+        for _ in range(hvcc[22]):
+            types.append(hvcc[cursor] & 0x3F)
+            count = struct.unpack_from(">H", hvcc, cursor + 1)[0]
+            self.assertEqual(count, 5)
+            cursor += 3
+            for _ in range(count):
+                length = struct.unpack_from(">H", hvcc, cursor)[0]
+                self.assertGreater(length, 0)
+                cursor += 2 + length
+        self.assertEqual(types, [32, 33, 34, 39])
+        self.assertEqual(cursor, len(hvcc))
+
+    def test_esds_descriptor_lengths_are_consistent(self):
+        esds = self.child_boxes(self.module.build_mp4a_sample_entry(1), 28)["esds"]
+
+        self.assertEqual(esds[4], 0x03)
+        self.assertEqual(esds[5], len(esds) - 6)
+
+    def test_protected_entries_wrap_original_format(self):
+        encv = self.child_boxes(self.module.build_encv_sample_entry(2, per_sample_iv_size=16), 78)
+        enca = self.child_boxes(self.module.build_enca_sample_entry(2), 28)
+
+        self.assertIn("avcC", encv)
+        self.assertIn("esds", enca)
+        for children, original in ((encv, b"avc1"), (enca, b"mp4a")):
+            sinf = children["sinf"]
+            self.assertEqual(sinf[4:8], b"frma")
+            self.assertEqual(sinf[8:12], original)
+        self.assertEqual(encv["sinf"][-17], 16)
+
+    def test_movie_declares_every_sample_entry(self):
+        data = b"".join(self.module.iter_codec_config_movie(12, entries_per_track=6))
+
+        counts = [
+            struct.unpack_from(">I", data, s + 4)[0] for p, s, e in walk_boxes(data) if p[-1] == "stsd"
+        ]
+        self.assertEqual(counts, [6] * 12)
+
+    def test_video_track_headers_match_sample_entry_dimensions(self):
+        data = b"".join(self.module.iter_codec_config_movie(12, entries_per_track=6))
+
+        checked = 0
+        for path, trak_start, trak_end in walk_boxes(data):
+            if path[-1] != "trak":
+                continue
+            boxes = {p[-1]: (s, e) for p, s, e in walk_boxes(data, trak_start, trak_end)}
+            if data[boxes["hdlr"][0] + 8 : boxes["hdlr"][0] + 12] != b"vide":
+                continue
+            tkhd_end = boxes["tkhd"][1]
+            width, height = struct.unpack_from(">II", data, tkhd_end - 8)
+            entry = boxes["stsd"][0] + 8
+            self.assertEqual(
+                (width >> 16, height >> 16), struct.unpack_from(">HH", data, entry + 32)
+            )
+            checked += 1
+        self.assertGreater(checked, 0)
+
+
+class MetadataStressTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def items(self, data: bytes, start: int, end: int) -> list[tuple[bytes, list[bytes]]]:
+        items = []
+        for _, item_start, item_end in walk_boxes(data, start, end):
+            identifier = data[item_start - 4 : item_start]
+            values = [data[s:e] for p, s, e in walk_boxes(data, item_start, item_end)]
+            items.append((identifier, values))
+        return items
+
+    def test_keyed_and_itunes_item_lists(self):
+        data = self.module.build_metadata_stress_movie(
+            40, artwork_count=2, artwork_size=4096
+        )
+        metas = [(p, s, e) for p, s, e in walk_boxes(data) if p[-1] == "meta"]
+        self.assertEqual([p for p, _, _ in metas], [("moov", "meta"), ("moov", "udta", "meta")])
+
+        keyed_path, keyed_start, keyed_end = metas[0]
+        children = {p[-1]: (s, e) for p, s, e in walk_boxes(data, keyed_start + 4, keyed_end)}
+        key_count = struct.unpack_from(">I", data, children["keys"][0] + 4)[0]
+        keyed_items = self.items(data, *children["ilst"])
+        self.assertEqual(key_count, 20)
+        self.assertEqual(
+            [int.from_bytes(identifier, "big") for identifier, _ in keyed_items],
+            list(range(1, 21)),
+        )
+
+        _, itunes_start, itunes_end = metas[1]
+        children = {p[-1]: (s, e) for p, s, e in walk_boxes(data, itunes_start + 4, itunes_end)}
+        itunes_items = self.items(data, *children["ilst"])
+        self.assertEqual(len(itunes_items), 21)
+        identifier, artwork = itunes_items[-1]
+        self.assertEqual(identifier, b"covr")
+        self.assertEqual([value[3] for value in artwork], [13, 14])
+        self.assertEqual([len(value) - 8 for value in artwork], [4096, 4096])
+
+
+class UnknownBoxFloodTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def test_flood_avoids_registered_types_and_is_reproducible(self):
+        registered, registered_uuids = self.module.load_mp4ra_catalog()
+        data = b"".join(self.module.iter_unknown_box_flood(2_000, seed=7, batch_size=64))
+
+        boxes = [(p, s, e) for p, s, e in walk_boxes(data)]
+        self.assertEqual(len(boxes), 2_001)
+        self.assertEqual(boxes[-1][2], len(data))
+        uuid_count = 0
+        for (box_type,), start, _ in boxes[1:]:
+            if box_type == "uuid":
+                uuid_count += 1
+                self.assertNotIn(data[start : start + 16], registered_uuids)
+            else:
+                self.assertNotIn(box_type, registered)
+        self.assertGreater(uuid_count, 0)
+        self.assertEqual(
+            data, b"".join(self.module.iter_unknown_box_flood(2_000, seed=7, batch_size=64))
+        )
+
+    def test_flood_avoids_container_and_parser_only_types(self):
+        excluded = self.module.CONTAINER_TYPES | self.module.REGISTRY_ONLY_TYPES
+        alphabet = b"adeiklsty"  # spells ilst, keys, data and stsd
+        original = self.module.FLOOD_TRANSLATION
+        self.module.FLOOD_TRANSLATION = bytes(alphabet[value % len(alphabet)] for value in range(256))
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                catalog = Path(tmpdir) / "MP4RABoxes.json"
+                catalog.write_text(json.dumps({"boxes": []}))
+                data = b"".join(
+                    self.module.iter_unknown_box_flood(
+                        20_000, seed=3, uuid_ratio=0.0, catalog_path=catalog
+                    )
+                )
+        finally:
+            self.module.FLOOD_TRANSLATION = original
+
+        types = {p[0] for p, _, _ in walk_boxes(data) if len(p) == 1}
+        self.assertGreater(len(types), 1_000)
+        self.assertFalse(types & excluded)
+
+    def test_mixed_flood_includes_registered_leaf_types(self):
+        registered, _ = self.module.load_mp4ra_catalog()
+        data = b"".join(
+            self.module.iter_unknown_box_flood(500, uuid_ratio=0.1, registered_ratio=0.5)
+        )
+
+        types = [p[0] for p, _, _ in walk_boxes(data)][1:]
+        known = [box_type for box_type in types if box_type in registered and box_type != "uuid"]
+        self.assertTrue(known)
+        self.assertFalse(set(known) & self.module.CONTAINER_TYPES)
+
+
+class RandomTreeTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def assert_progressive_offsets(self, data: bytes, boxes: list) -> None:
+        mdat_start, mdat_end = next((s, e) for p, s, e in boxes if p == ("mdat",))
+        for path, start, end in boxes:
+            if path[-1] == "stco":
+                offsets = full_box_uint32s(data, start, end)[1:]
+            elif path[-1] == "co64":
+                count = struct.unpack_from(">I", data, start + 4)[0]
+                offsets = list(struct.unpack_from(f">{count}Q", data, start + 8))
+            else:
+                continue
+            self.assertTrue(offsets)
+            self.assertTrue(all(mdat_start <= offset < mdat_end for offset in offsets))
+
+    def assert_fragment_offsets(self, data: bytes, boxes: list) -> None:
+        moof_start = None
+        for path, start, end in boxes:
+            if path == ("moof",):
+                moof_start = start - 8
+                mdat_start, mdat_end = next(
+                    (s, e) for p, s, e in boxes if p == ("mdat",) and s > end
+                )
+            elif path[-1] == "trun":
+                flags = int.from_bytes(data[start + 1 : start + 4], "big")
+                self.assertTrue(flags & 0x000001)
+                data_offset = struct.unpack_from(">i", data, start + 8)[0]
+                self.assertTrue(mdat_start <= moof_start + data_offset < mdat_end)
+
+    def test_random_trees_are_well_formed(self):
+        layouts = set()
+        for seed in range(24):
+            plan = self.module.plan_random_tree(seed, max_tracks=3, max_samples=300)
+            data = b"".join(self.module.iter_random_tree(plan))
+            boxes = list(walk_boxes(data))
+            top_level = [(p, s, e) for p, s, e in boxes if len(p) == 1]
+            self.assertEqual(top_level[0][0], ("ftyp",))
+            self.assertEqual(top_level[-1][2], len(data))
+            traks = [p for p, _, _ in boxes if p == ("moov", "trak")]
+            self.assertEqual(len(traks), len(plan.tracks))
+            if plan.fragmented:
+                self.assert_fragment_offsets(data, boxes)
+                moofs = [p for p, _, _ in top_level if p == ("moof",)]
+                self.assertEqual(len(moofs), plan.fragment_count)
+            else:
+                self.assert_progressive_offsets(data, boxes)
+            layouts.add((plan.fragmented, plan.moov_first))
+        self.assertEqual(len(layouts), 3)
+
+    def test_edit_lists_span_movie_duration(self):
+        checked = 0
+        for seed in range(40):
+            plan = self.module.plan_random_tree(seed, max_samples=200)
+            if not plan.edit_lists:
+                continue
+            data = b"".join(self.module.iter_random_tree(plan))
+            boxes = list(walk_boxes(data))
+            mvhd = next(s for p, s, e in boxes if p == ("moov", "mvhd"))
+            movie_duration = struct.unpack_from(">I", data, mvhd + 16)[0]
+            for path, start, _ in boxes:
+                if path[-1] == "elst":
+                    self.assertEqual(data[start], 0)
+                    count = struct.unpack_from(">I", data, start + 4)[0]
+                    spans = [
+                        struct.unpack_from(">I", data, start + 8 + index * 12)[0]
+                        for index in range(count)
+                    ]
+                    self.assertEqual(sum(spans), movie_duration, f"seed {seed}")
+                    checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_generation_is_reproducible_from_sidecar_seed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = self.module.generate_random_tree_fixtures(
+                2, Path(tmp), seed=11, max_samples=100
+            )
+            sidecar = json.loads(paths[1].with_suffix(".mp4.json").read_text())
+            plan = self.module.plan_random_tree(sidecar["seed"], **sidecar["options"])
+            regenerated = b"".join(self.module.iter_random_tree(plan))
+            self.assertEqual(paths[1].read_bytes(), regenerated)
+        self.assertEqual(sidecar["seed"], 12)
+        self.assertEqual(sidecar["shape"], plan.summary())
+
+
+class BuilderProfileTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def test_profiles_cover_requested_builders(self):
+        profiles = self.module.profile_builders(
+            repeats=2, stress_scale=10, names=["edit_list_empty", "edit-list"]
+        )
+
+        self.assertEqual([profile.name for profile in profiles], ["edit_list_empty", "edit-list"])
+        self.assertEqual(
+            profiles[0].byte_size, len(self.module.build_edit_list_empty())
+        )
+        self.assertEqual(
+            profiles[1].byte_size, len(self.module.build_edit_list_stress_movie(10))
+        )
+        self.assertTrue(all(profile.peak_bytes > 0 for profile in profiles))
+
+    def test_profiler_covers_every_registered_builder(self):
+        profiled = [(name, kind) for name, kind, _ in self.module.iter_profiled_builders(10)]
+
+        self.assertEqual(profiled, self.module.list_fixture_builders())
+        self.assertIn(("VR-001", "rule-matrix"), profiled)
+        profile = self.module.profile_builders(repeats=1, names=["VR-001"])[0]
+        self.assertEqual(profile.byte_size, len(self.module.build_fixture("VR-001").data))
+
+    def test_memory_ratio_flags_builders(self):
+        profile = self.module.profile_builder(
+            "large", "test", lambda: [bytes(1 << 20)], repeats=1, memory_ratio=0.5
+        )
+        self.assertTrue(profile.flagged)
+        profile = self.module.profile_builder(
+            "streamed", "test", lambda: self.module.iter_filler(1 << 22, 0), repeats=1
+        )
+        self.assertFalse(profile.flagged)
+
+    def test_cli_writes_table_and_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            report_path = Path(tmp) / "profile.json"
+            exit_code = self.module.main(
+                [
+                    "--profile-builders",
+                    "--profile-repeats",
+                    "1",
+                    "--profile-only",
+                    "invalid-fourcc.mp4",
+                    "--profile-json",
+                    str(report_path),
+                ]
+            )
+            report = json.loads(report_path.read_text())
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(report["builders"][0]["name"], "invalid-fourcc.mp4")
+        self.assertEqual(report["builders"][0]["byte_size"], 8)
+
+
+class RandomAccessStressTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def parse_sidx(self, data: bytes, start: int) -> tuple[int, list[tuple[int, int, int]]]:
+        version = data[start]
+        width = 8 if version == 1 else 4
+        cursor = start + 12 + 2 * width
+        count = struct.unpack_from(">H", data, cursor + 2)[0]
+        cursor += 4
+        references = []
+        for _ in range(count):
+            size_word, duration, _ = struct.unpack_from(">III", data, cursor)
+            references.append((size_word >> 31, size_word & 0x7FFFFFFF, duration))
+            cursor += 12
+        return cursor, references
+
+    def parse_tfra(self, data: bytes, start: int) -> list[tuple[int, int]]:
+        version = data[start]
+        width = 8 if version == 1 else 4
+        _, lengths, count = struct.unpack_from(">III", data, start + 4)
+        numbers = ((lengths >> 4) & 3) + ((lengths >> 2) & 3) + (lengths & 3) + 3
+        cursor = start + 16
+        entries = []
+        for _ in range(count):
+            time = int.from_bytes(data[cursor : cursor + width], "big")
+            offset = int.from_bytes(data[cursor + width : cursor + 2 * width], "big")
+            entries.append((time, offset))
+            cursor += 2 * width + numbers
+        return entries
+
+    def assert_indexes_resolve(self, data: bytes, version: int) -> None:
+        top_level = [(p[0], s, e) for p, s, e in walk_boxes(data) if len(p) == 1]
+        types = [box_type for box_type, _, _ in top_level]
+        self.assertEqual(types[:3], ["ftyp", "moov", "sidx"])
+        self.assertEqual(types[-1], "mfra")
+        moof_starts = {s - 8 for box_type, s, _ in top_level if box_type == "moof"}
+
+        root_start = top_level[2][1]
+        self.assertEqual(data[root_start], version)
+        cursor, root_refs = self.parse_sidx(data, root_start)
+        for reference_type, size, _ in root_refs:
+            self.assertEqual(reference_type, 1)
+            self.assertEqual(data[cursor + 4 : cursor + 8], b"sidx")
+            child_end, child_refs = self.parse_sidx(data, cursor + 8)
+            child_cursor = child_end
+            for child_type, child_size, _ in child_refs:
+                self.assertEqual(child_type, 0)
+                self.assertIn(child_cursor, moof_starts)
+                child_cursor += child_size
+            self.assertEqual(child_cursor, cursor + size)
+            cursor += size
+        self.assertEqual(cursor, top_level[-1][1] - 8)
+
+        mfra_start, mfra_end = top_level[-1][1], top_level[-1][2]
+        children = list(walk_boxes(data, mfra_start, mfra_end))
+        self.assertEqual([p[0] for p, _, _ in children], ["tfra", "tfra", "mfro"])
+        mfro_start = children[-1][1]
+        self.assertEqual(
+            struct.unpack_from(">I", data, mfro_start + 4)[0], mfra_end - mfra_start + 8
+        )
+        video_entries = self.parse_tfra(data, children[0][1])
+        self.assertEqual(len(video_entries), 2 * len(moof_starts))
+        self.assertTrue(all(offset in moof_starts for _, offset in video_entries))
+        self.assertEqual(
+            [time for time, _ in video_entries], sorted(time for time, _ in video_entries)
+        )
+
+    def test_version_0_indexes_resolve(self):
+        data = b"".join(self.module.iter_random_access_movie(150, fragments_per_segment=16))
+        self.assert_indexes_resolve(data, 0)
+
+    def test_version_1_indexes_resolve(self):
+        data = b"".join(
+            self.module.iter_random_access_movie(40, version=1, min_length_size=4)
+        )
+        self.assert_indexes_resolve(data, 1)
+        tfra = next(s for p, s, _ in walk_boxes(data) if p[-1] == "tfra")
+        self.assertEqual(struct.unpack_from(">I", data, tfra + 8)[0], 0x3F)
+
+
+class RuleMatrixTests(unittest.TestCase):
+    def setUp(self):
+        self.module = load_generate_fixtures_module()
+
+    def build(self, rule_id: str, count: int) -> bytes:
+        return b"".join(self.module.RULE_VIOLATION_GENERATORS[rule_id].factory(count))
+
+    def test_every_rule_scales_with_violation_count(self):
+        for rule_id in self.module.RULE_VIOLATION_GENERATORS:
+            with self.subTest(rule_id=rule_id):
+                small = self.build(rule_id, 2)
+                large = self.build(rule_id, 5)
+                top_level = [e for p, _, e in walk_boxes(large) if len(p) == 1]
+                self.assertEqual(top_level[-1], len(large))
+                self.assertGreater(len(large), len(small))
+
+    def test_injected_violations_are_counted(self):
+        data = self.build("VR-003", 4)
+        flags = [
+            int.from_bytes(data[s + 1 : s + 4], "big") for p, s, _ in walk_boxes(data)
+            if p[-1] == "tkhd"
+        ]
+        self.assertEqual(flags, [1, 1, 1, 1])
+
+        data = self.build("VR-016", 3)
+        sequences = [
+            struct.unpack_from(">I", data, s + 4)[0] for p, s, _ in walk_boxes(data)
+            if p[-1] == "mfhd"
+        ]
+        self.assertEqual(sequences, [4, 3, 2, 1])
+
+        data = self.build("VR-004", 3)
+        types = [p[0] for p, _, _ in walk_boxes(data) if len(p) == 1]
+        self.assertEqual(types, ["moov", "moov", "moov", "ftyp", "moov"])
+
+    def test_sample_table_violation_keeps_chunk_offsets_valid(self):
+        data = self.build("VR-015", 3)
+        boxes = {p[-1]: (s, e) for p, s, e in walk_boxes(data)}
+        stsc = full_box_uint32s(data, *boxes["stsc"])
+        self.assertEqual(stsc[0], 4)
+        self.assertEqual(stsc[1::3], [0, 0, 0, 1])
+        chunk_offset = full_box_uint32s(data, *boxes["stco"])[1]
+        self.assertEqual(chunk_offset, boxes["mdat"][0])
+
+    def test_generation_writes_catalog(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = self.module.generate_rule_matrix_fixtures(["VR-001", "E3"], (1, 10), root)
+            self.module.generate_rule_matrix_fixtures(["VR-006"], (2,), root)
+            catalog = json.loads((root / "rule-matrix.json").read_text(encoding="utf-8"))
+            sizes = {path.name: path.stat().st_size for path in paths}
+
+        fixtures = {entry["id"]: entry for entry in catalog["fixtures"]}
+        self.assertEqual(
+            [entry["id"] for entry in catalog["fixtures"]],
+            ["e3-1", "e3-10", "vr-001-1", "vr-001-10", "vr-006-2"],
+        )
+        self.assertEqual(fixtures["vr-001-10"]["violations"], 10)
+        self.assertEqual(fixtures["vr-001-10"]["expected_rule_ids"], [])
+        self.assertEqual(fixtures["vr-001-10"]["expected_parse_issues"], ["header.invalid_size"])
+        self.assertEqual(fixtures["vr-006-2"]["expected_rule_ids"], ["VR-006"])
+        self.assertEqual(fixtures["e3-10"]["byte_size"], sizes["e3-10.mp4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Cross-check the hand-maintained fixture catalog, payloads, and snapshots.
+
+The ``ISOInspectorKit`` fixture tree is maintained by hand and the individual
+pieces can silently drift apart. The audit verifies that:
+
+* Every resource named in ``catalog.json`` exists and decodes as base64.
+* Every ``Media/*.txt`` payload is referenced by the catalog.
+* Every ``Fixtures/Corrupt/*.base64`` payload decodes and is listed in
+  ``corrupt-fixtures.json`` (and vice versa). When a raw binary sibling is
+  present its SHA-256 must match the decoded payload.
+* Every ``Snapshots/<id>.json`` that belongs to a catalog fixture records a
+  ``format.byte_size`` equal to the decoded fixture size.
+
+Payloads are decoded in a streaming fashion on a thread pool. Per-file results
+are cached by content hash so repeated runs only decode files that changed.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES_ROOT = ROOT / "Tests" / "ISOInspectorKitTests" / "Fixtures"
+DEFAULT_CATALOG = FIXTURES_ROOT / "catalog.json"
+DEFAULT_SNAPSHOTS = FIXTURES_ROOT / "Snapshots"
+DEFAULT_CORRUPT_ROOT = ROOT / "Fixtures" / "Corrupt"
+DEFAULT_CORRUPT_CATALOG = ROOT / "Documentation" / "FixtureCatalog" / "corrupt-fixtures.json"
+DEFAULT_CACHE = ROOT / ".git" / "fixture-audit-cache.json"
+CACHE_VERSION = 1
+BUFFER_SIZE = 1024 * 64
+WHITESPACE = b" \t\r\n\v\f"
+
+
+@dataclass
+class DecodedPayload:
+    """Size and digest of a decoded base64 payload."""
+
+    byte_size: int
+    sha256: str
+    error: Optional[str] = None
+
+
+@dataclass
+class AuditReport:
+    """Errors and warnings accumulated across the audit."""
+
+    errors: list[str]
+    warnings: list[str]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class PayloadCache:
+    """Persisted map of payload results keyed by the encoded file's digest.
+
+    Entries also remember the file's ``(size, mtime_ns)`` so unchanged files
+    skip both hashing and decoding on subsequent runs.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.by_digest: dict[str, dict] = {}
+        self.by_path: dict[str, dict] = {}
+        self.dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                self.by_digest = data.get("digests", {})
+                self.by_path = data.get("paths", {})
+
+    def lookup_stat(self, path: Path, stat: os.stat_result) -> Optional[DecodedPayload]:
+        entry = self.by_path.get(str(path))
+        if not entry or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        return self.lookup_digest(entry["digest"])
+
+    def lookup_digest(self, digest: str) -> Optional[DecodedPayload]:
+        cached = self.by_digest.get(digest)
+        return DecodedPayload(**cached) if cached else None
+
+    def store(self, path: Path, stat: os.stat_result, digest: str, payload: DecodedPayload) -> None:
+        self.by_path[str(path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+        }
+        self.by_digest[digest] = asdict(payload)
+        self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        temp_path.write_text(
+            json.dumps(
+                {"version": CACHE_VERSION, "digests": self.by_digest, "paths": self.by_path}
+            ),
+            encoding="utf-8",
+        )
+        temp_path.replace(self.path)
+
+
+def iter_base64_decoded(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decode base64 ``chunks`` incrementally, ignoring whitespace.
+
+    Whitespace (including the line breaks emitted by ``base64.encodebytes``) is
+    stripped and only complete four-character quanta are decoded per chunk, so
+    memory use is bounded by the chunk size rather than the payload size.
+    Raises ``binascii.Error`` for invalid input.
+    """
+
+    pending = b""
+    for chunk in chunks:
+        pending += chunk.translate(None, WHITESPACE)
+        usable = len(pending) - len(pending) % 4
+        if usable:
+            yield base64.b64decode(pending[:usable], validate=True)
+            pending = pending[usable:]
+    if pending:
+        raise binascii.Error(f"{len(pending)} trailing base64 characters")
+
+
+def decode_base64_stream(chunks: Iterable[bytes]) -> DecodedPayload:
+    """Decode base64 ``chunks`` incrementally, returning decoded size and digest."""
+
+    hasher = hashlib.sha256()
+    byte_size = 0
+    try:
+        for decoded in iter_base64_decoded(chunks):
+            hasher.update(decoded)
+            byte_size += len(decoded)
+    except (binascii.Error, ValueError) as exc:
+        return DecodedPayload(byte_size=0, sha256="", error=f"invalid base64: {exc}")
+    return DecodedPayload(byte_size=byte_size, sha256=hasher.hexdigest())
+
+
+def read_chunks(path: Path) -> Iterator[bytes]:
+    """Yield the contents of ``path`` in ``BUFFER_SIZE`` chunks."""
+
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(BUFFER_SIZE), b""):
+            yield chunk
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    for chunk in read_chunks(path):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def decode_payload(path: Path, cache: PayloadCache) -> DecodedPayload:
+    """Return the decoded payload summary for ``path``, consulting ``cache``."""
+
+    stat = path.stat()
+    cached = cache.lookup_stat(path, stat)
+    if cached is not None:
+        return cached
+
+    digest = _hash_file(path)
+    cached = cache.lookup_digest(digest)
+    if cached is None:
+        cached = decode_base64_stream(read_chunks(path))
+    cache.store(path, stat, digest, cached)
+    return cached
+
+
+def _load_json(path: Path, report: AuditReport) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        report.errors.append(f"{path}: file not found")
+    except json.JSONDecodeError as exc:
+        report.errors.append(f"{path}: JSON parsing failed: {exc}")
+    return None
+
+
+def _catalog_resources(catalog: dict, fixtures_root: Path) -> dict[str, Path]:
+    resources: dict[str, Path] = {}
+    for entry in catalog.get("fixtures", []):
+        resource = entry.get("resource") or {}
+        name = resource.get("name")
+        extension = resource.get("extension")
+        filename = f"{name}.{extension}" if extension else str(name)
+        subdirectory = resource.get("subdirectory")
+        base = fixtures_root / subdirectory if subdirectory else fixtures_root
+        resources[entry.get("id", filename)] = base / filename
+    return resources
+
+
+def audit(
+    *,
+    catalog_path: Path = DEFAULT_CATALOG,
+    snapshots_root: Path = DEFAULT_SNAPSHOTS,
+    corrupt_root: Path = DEFAULT_CORRUPT_ROOT,
+    corrupt_catalog_path: Path = DEFAULT_CORRUPT_CATALOG,
+    cache_path: Optional[Path] = DEFAULT_CACHE,
+    jobs: Optional[int] = None,
+) -> AuditReport:
+    """Cross-check fixtures, catalogs, and snapshots and return the findings."""
+
+    report = AuditReport(errors=[], warnings=[])
+    cache = PayloadCache(cache_path)
+
+    catalog = _load_json(catalog_path, report) or {}
+    resources = _catalog_resources(catalog, catalog_path.parent)
+    media_root = catalog_path.parent / "Media"
+
+    corrupt_catalog = _load_json(corrupt_catalog_path, report) or {}
+    corrupt_names = {
+        entry["filename"] for entry in corrupt_catalog.get("fixtures", []) if "filename" in entry
+    }
+
+    payload_paths: set[Path] = {path for path in resources.values() if path.exists()}
+    payload_paths.update(media_root.glob("*.txt"))
+    if corrupt_root.is_dir():
+        payload_paths.update(corrupt_root.glob("*.base64"))
+
+    ordered_paths = sorted(payload_paths)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        decoded = dict(
+            zip(ordered_paths, executor.map(lambda p: decode_payload(p, cache), ordered_paths))
+        )
+
+    for path, payload in decoded.items():
+        if payload.error:
+            report.errors.append(f"{path}: {payload.error}")
+
+    for fixture_id, path in sorted(resources.items()):
+        if not path.exists():
+            report.errors.append(f"{catalog_path}: resource for '{fixture_id}' missing ({path})")
+
+    referenced = set(resources.values())
+    for path in sorted(media_root.glob("*.txt")):
+        if path not in referenced:
+            report.warnings.append(f"{path}: not referenced by {catalog_path.name}")
+
+    for name in sorted(corrupt_names):
+        if not (corrupt_root / f"{name}.base64").exists():
+            report.errors.append(f"{corrupt_catalog_path}: payload for '{name}' missing")
+    for path in sorted(corrupt_root.glob("*.base64")) if corrupt_root.is_dir() else []:
+        raw_path = path.with_suffix("")
+        if raw_path.name not in corrupt_names:
+            report.warnings.append(f"{path}: not listed in {corrupt_catalog_path.name}")
+        payload = decoded[path]
+        if raw_path.exists() and not payload.error and _hash_file(raw_path) != payload.sha256:
+            report.errors.append(f"{raw_path}: SHA-256 differs from {path.name}")
+
+    for snapshot_path in sorted(snapshots_root.glob("*.json")):
+        fixture_id = snapshot_path.stem
+        resource = resources.get(fixture_id)
+        if resource is None:
+            report.warnings.append(f"{snapshot_path}: no catalog fixture named '{fixture_id}'")
+            continue
+        payload = decoded.get(resource)
+        if payload is None or payload.error:
+            continue
+        snapshot = _load_json(snapshot_path, report)
+        byte_size = ((snapshot or {}).get("format") or {}).get("byte_size")
+        if byte_size is None:
+            report.warnings.append(f"{snapshot_path}: format.byte_size missing")
+        elif byte_size != payload.byte_size:
+            report.errors.append(
+                f"{snapshot_path}: format.byte_size is {byte_size} but "
+                f"{resource.name} decodes to {payload.byte_size} bytes"
+            )
+
+    cache.save()
+    return report
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--catalog", type=Path, default=DEFAULT_CATALOG)
+    parser.add_argument("--snapshots", type=Path, default=DEFAULT_SNAPSHOTS)
+    parser.add_argument("--corrupt-root", type=Path, default=DEFAULT_CORRUPT_ROOT)
+    parser.add_argument("--corrupt-catalog", type=Path, default=DEFAULT_CORRUPT_CATALOG)
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE if DEFAULT_CACHE.parent.is_dir() else None,
+        help="Cache file for decoded payload results (default: .git/fixture-audit-cache.json).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the result cache.")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker thread count.")
+    args = parser.parse_args(argv)
+
+    report = audit(
+        catalog_path=args.catalog,
+        snapshots_root=args.snapshots,
+        corrupt_root=args.corrupt_root,
+        corrupt_catalog_path=args.corrupt_catalog,
+        cache_path=None if args.no_cache else args.cache,
+        jobs=args.jobs,
+    )
+
+    for warning in report.warnings:
+        print(f"warning: {warning}")
+    for error in report.errors:
+        print(f"error: {error}")
+
+    if not report.ok:
+        print(f"Fixture audit failed with {len(report.errors)} error(s).", file=sys.stderr)
+        return 1
+    print(f"Fixture audit passed ({len(report.warnings)} warning(s)).")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    raise SystemExit(main(sys.argv[1:]))
@@ -4,6 +4,13 @@
 The script accepts an optional list of YAML paths to validate. When no
 arguments are provided it defaults to the tracked ``*.yml`` and ``*.yaml``
 files in the repository to keep the pre-commit hook fast and deterministic.
+Results are cached per git blob id (see ``validation_cache.py``), so repeated
+runs only parse files that changed.
+
+Every document of a multi-document stream is loaded. Parsing uses libyaml's
+``CSafeLoader`` when PyYAML was built with it and the files are spread across
+a process pool; failures are re-parsed with the pure-Python loader so error
+messages keep their source excerpts.
 """
 
 from __future__ import annotations
@@ -12,8 +19,11 @@ import argparse
 import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Optional
+
+from validation_cache import ResultCache, blob_ids
 
 try:
     import yaml
@@ -30,11 +40,30 @@ class PermissiveLoader(yaml.SafeLoader):
 
 
 def _construct_undefined(self, node):
+    if isinstance(node, yaml.MappingNode):
+        return self.construct_mapping(node)
+    if isinstance(node, yaml.SequenceNode):
+        return self.construct_sequence(node)
     return self.construct_scalar(node)
 
 
 PermissiveLoader.add_constructor(None, _construct_undefined)
 
+if getattr(yaml, "__with_libyaml__", False):
+
+    class CPermissiveLoader(yaml.CSafeLoader):
+        """libyaml-backed ``PermissiveLoader``."""
+
+    CPermissiveLoader.add_constructor(None, _construct_undefined)
+    FAST_LOADER: type = CPermissiveLoader
+else:  # pragma: no cover - depends on how PyYAML was built
+    FAST_LOADER = PermissiveLoader
+
+
+def _load_documents(text: str, loader: type) -> None:
+    for _ in yaml.load_all(text, Loader=loader):
+        pass
+
 
 def _git_ls_files(patterns: Iterable[str]) -> list[Path]:
     """Return tracked files that match the given glob patterns."""
@@ -72,13 +101,59 @@ def _validate_yaml(path: Path) -> list[str]:
         return ["Empty YAML document"]
 
     try:
-        yaml.load(text, Loader=PermissiveLoader)
-    except yaml.YAMLError as error:  # pragma: no cover - exercised in CI
+        _load_documents(text, FAST_LOADER)
+    except yaml.YAMLError as error:
+        if FAST_LOADER is PermissiveLoader:
+            return [str(error)]
+        try:
+            _load_documents(text, PermissiveLoader)
+        except yaml.YAMLError as detailed:
+            return [str(detailed)]
         return [str(error)]
 
     return []
 
 
+def validate_paths(
+    paths: list[Path], cache: ResultCache | None = None, jobs: Optional[int] = None
+) -> list[tuple[Path, str]]:
+    """Return ``(path, issue)`` pairs for ``paths`` in input order.
+
+    Cached results are reused; the remaining files are parsed on ``jobs``
+    worker processes (default: CPU count; ``1`` parses in-process).
+    """
+
+    cache = cache or ResultCache.disabled()
+    keys = blob_ids(paths) if cache.enabled else {}
+    hits = {}
+    for path in paths:
+        cached = cache.lookup(keys.get(path))
+        if cached is not None:
+            hits[path] = cached
+    pending = [path for path in paths if path not in hits]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(pending) < 2:
+        computed: Iterator[list[str]] = map(_validate_yaml, pending)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(pending)))
+        computed = executor.map(_validate_yaml, pending)
+    errors = []
+    try:
+        for path in paths:
+            issues = hits.get(path)
+            if issues is None:
+                issues = next(computed)
+                cache.store(keys.get(path), issues)
+            errors.extend((path, issue) for issue in issues)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        cache.save()
+    return errors
+
+
 def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -86,6 +161,20 @@ def main(argv: list[str]) -> int:
         nargs="*",
         help="Optional YAML files to validate. Defaults to tracked .yml/.yaml files.",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker process count (default: CPU count; 1 validates in-process).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the result cache (default: .git/validation-cache).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Revalidate every file.")
     args = parser.parse_args(argv)
 
     repo_root = Path(__file__).resolve().parents[1]
@@ -100,12 +189,16 @@ def main(argv: list[str]) -> int:
         print("No YAML files to validate.")
         return 0
 
-    errors = []
-    for path in paths:
-        path_errors = _validate_yaml(path)
-        if path_errors:
-            for issue in path_errors:
-                errors.append((path, issue))
+    if args.no_cache:
+        cache = ResultCache.disabled()
+    else:
+        cache = ResultCache.for_validator(
+            "check_yaml",
+            [Path(__file__)],
+            config={"pyyaml": yaml.__version__, "loader": FAST_LOADER.__name__},
+            cache_dir=args.cache_dir,
+        )
+    errors = validate_paths(paths, cache, args.jobs)
 
     if errors:
         for path, issue in errors:
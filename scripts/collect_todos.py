@@ -8,20 +8,44 @@ This script implements PDD (Puzzle-Driven Development) task tracking by:
 3. Grouping tasks by number
 4. Generating a Markdown report with tasks sorted by number
 
+The tree is walked with ``os.scandir`` (see ``directory_walk.py``), pruning
+excluded directories before descending into them, and files are scanned on a
+worker pool. Results are ordered by path and line number regardless of the
+number of workers.
+
+Extracted items are kept in a persistent index next to the report, so later
+runs only re-extract files whose size, modification time and content changed.
+
+With ``--git`` the working tree is not read at all: tracked blobs are listed
+from the git index (or from ``--rev``) and streamed through a single
+``git cat-file --batch`` process, scanning each distinct blob once.
+
 Usage:
-    python3 scripts/collect_todos.py [--output OUTPUT_FILE]
+    python3 scripts/collect_todos.py [--output OUTPUT_FILE] [--jobs N] [--no-index]
+    python3 scripts/collect_todos.py --git [--rev REV]
 
 Example:
     python3 scripts/collect_todos.py --output DOCS/TODO_REPORT.md
 """
 
 import argparse
+import hashlib
+import json
+import mmap
 import os
 import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from directory_walk import PRUNED_DIRECTORIES, iter_files
 
 
 @dataclass
@@ -39,14 +63,99 @@ class TodoItem:
         return f"{self.file_path}:{self.line_number}"
 
 
+class TodoIndex:
+    """Persistent per-file index of extracted @todo items.
+
+    Maps each path (relative to the scan root) to its size, ``mtime_ns``,
+    SHA-256 and extracted items. Files whose size and mtime are unchanged are
+    reused without being opened; files whose content hash is unchanged are
+    reused without being re-extracted. The whole index is discarded when the
+    scan root or this script changes.
+    """
+
+    VERSION = 1
+
+    # Files modified this close to the scan are hashed again on the next run,
+    # because a later edit within the same timestamp tick would be invisible.
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, path: Optional[Path], root: Path):
+        self.path = path
+        self.root = root
+        self.identity = self._identity(root)
+        self.entries: Dict[str, dict] = {}
+        self.started_ns = time.time_ns()
+
+    @staticmethod
+    def _identity(root: Path) -> str:
+        digest = hashlib.sha256(f"{TodoIndex.VERSION}\0{root}\0".encode())
+        digest.update(Path(__file__).read_bytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, path: Optional[Path], root: Path) -> 'TodoIndex':
+        """Loads the index at ``path``, starting empty if it is missing or stale."""
+        index = cls(path, root)
+        if path is None:
+            return index
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return index
+        if isinstance(data, dict) and data.get('identity') == index.identity:
+            entries = data.get('files')
+            if isinstance(entries, dict):
+                index.entries = entries
+        return index
+
+    def reuse(self, rel_path: str, stat: os.stat_result) -> Optional[List[TodoItem]]:
+        """Returns the indexed items if the file's size and mtime are unchanged."""
+        entry = self.entries.get(rel_path)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return [TodoItem(**item) for item in entry['items']]
+        return None
+
+    def digest(self, rel_path: str) -> Optional[str]:
+        entry = self.entries.get(rel_path)
+        return entry['hash'] if entry else None
+
+    def items(self, rel_path: str) -> List[TodoItem]:
+        return [TodoItem(**item) for item in self.entries[rel_path]['items']]
+
+    def update(self, rel_path: str, stat: os.stat_result, digest: str,
+               items: List[TodoItem]) -> None:
+        racy = stat.st_mtime_ns >= self.started_ns - self.RACY_WINDOW_NS
+        self.entries[rel_path] = {
+            'size': stat.st_size,
+            'mtime_ns': None if racy else stat.st_mtime_ns,
+            'hash': digest,
+            'items': [asdict(item) for item in items],
+        }
+
+    def retain(self, rel_paths: set) -> None:
+        """Drops entries for files that no longer exist or are no longer scanned."""
+        self.entries = {path: entry for path, entry in self.entries.items() if path in rel_paths}
+
+    def save(self) -> None:
+        """Atomically writes the index; failures only cost the next run a rescan."""
+        if self.path is None:
+            return
+        data = {'identity': self.identity, 'files': self.entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_name, self.path)
+        except OSError as e:
+            print(f"Warning: Could not write index {self.path}: {e}")
+
+
 class TodoCollector:
     """Collects @todo puzzles from source files."""
 
     # Directories to exclude from scanning
-    EXCLUDED_DIRS = {
-        '.build', '.git', 'build', 'DerivedData',
-        'Derived', '.swiftpm', 'Pods', 'node_modules'
-    }
+    EXCLUDED_DIRS = PRUNED_DIRECTORIES
 
     # File extensions to scan
     INCLUDE_EXTENSIONS = {
@@ -61,8 +170,14 @@ class TodoCollector:
         re.IGNORECASE
     )
 
-    def __init__(self, root_dir: str = '.'):
+    # Byte-level prefilter; only lines containing a match are decoded
+    TODO_MARKER = re.compile(rb'@todo', re.IGNORECASE)
+
+    def __init__(self, root_dir: str = '.', jobs: Optional[int] = None,
+                 index_path: Optional[Path] = None):
         self.root_dir = Path(root_dir).resolve()
+        self.jobs = jobs
+        self.index_path = index_path
         self.todos: List[TodoItem] = []
 
     def should_scan_file(self, file_path: Path) -> bool:
@@ -76,45 +191,70 @@ class TodoCollector:
         return file_path.suffix in self.INCLUDE_EXTENSIONS
 
     def extract_todos_from_file(self, file_path: Path) -> List[TodoItem]:
-        """Extracts all @todo items from a single file."""
-        todos = []
+        """Extracts all @todo items from a single file.
+
+        The file is memory-mapped and searched for ``@todo`` as bytes first, so
+        files without puzzles are never decoded. Only the lines around each hit
+        are decoded; line numbers come from counting newlines up to the hit.
+        """
+        return self.scan_file(file_path)[1] or []
+
+    def scan_file(self, file_path: Path,
+                  known_digest: Optional[str] = None) -> Tuple[Optional[str], Optional[List[TodoItem]]]:
+        """Returns ``(sha256, items)`` for a file.
 
+        Items are ``None`` when the content hash equals ``known_digest``, and
+        the digest is ``None`` when the file cannot be read.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except Exception as e:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    digest = hashlib.sha256(b'').hexdigest()
+                    return digest, (None if digest == known_digest else [])
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    digest = hashlib.sha256(data).hexdigest()
+                    if digest == known_digest:
+                        return digest, None
+                    return digest, self._extract_todos_from_bytes(data, file_path)
+        except (OSError, ValueError) as e:
             print(f"Warning: Could not read {file_path}: {e}")
-            return todos
+            return None, []
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+    def _extract_todos_from_bytes(self, data, file_path: Path) -> List[TodoItem]:
+        """Extracts @todo items from the raw contents of ``file_path``."""
+        todos = []
+        rel_path = str(file_path.relative_to(self.root_dir))
+
+        def read_line(start: int) -> tuple[str, int]:
+            """Returns the decoded line starting at ``start`` and the offset after it."""
+            end = data.find(b'\n', start)
+            end = len(data) if end < 0 else end + 1
+            return data[start:end].decode('utf-8', errors='ignore'), end
+
+        line_number = 1
+        counted = 0
+        hit = self.TODO_MARKER.search(data)
+        while hit:
+            line_start = data.rfind(b'\n', 0, hit.start()) + 1
+            line_number += data[counted:line_start].count(b'\n')
+            counted = line_start
+
+            line, position = read_line(line_start)
             match = self.TODO_PATTERN.search(line)
-
             if match:
                 task_id = match.group(1)  # May be None
                 description = match.group(2).strip()
 
-                # Collect continuation lines (indented lines after @todo)
+                # Collect continuation comment lines after @todo, skipping empty lines
                 full_comment = [description]
-                j = i + 1
-
-                # Determine base indentation from the @todo line
-                base_indent = len(line) - len(line.lstrip())
-
-                while j < len(lines):
-                    next_line = lines[j].rstrip()
+                while position < len(data):
+                    next_line, next_position = read_line(position)
+                    stripped = next_line.strip()
 
-                    # Skip empty lines
-                    if not next_line.strip():
-                        j += 1
+                    if not stripped:
+                        position = next_position
                         continue
 
-                    # Check if line is a continuation (indented more than base)
-                    next_indent = len(next_line) - len(next_line.lstrip())
-
-                    # For comment lines, look for comment markers
-                    stripped = next_line.strip()
                     if stripped.startswith(('///', '//', '#', '--')):
                         # Remove comment markers
                         content = re.sub(r'^[\s]*(?:///?|#|--)\s?', '', stripped)
@@ -122,38 +262,183 @@ class TodoCollector:
                         # Check if it's still part of the todo (indented or continuation)
                         if content and not self.TODO_PATTERN.search(content):
                             full_comment.append(content)
-                            j += 1
+                            position = next_position
                             continue
 
-                    # Stop if we hit another @todo or unindented line
+                    # Stop if we hit another @todo or a non-comment line
                     break
 
-                rel_path = file_path.relative_to(self.root_dir)
-
                 todos.append(TodoItem(
-                    file_path=str(rel_path),
-                    line_number=i + 1,
+                    file_path=rel_path,
+                    line_number=line_number,
                     task_id=task_id,
                     description=description,
                     full_comment=full_comment
                 ))
 
-                i = j
-            else:
-                i += 1
+            hit = self.TODO_MARKER.search(data, position)
 
         return todos
 
+    def iter_candidate_files(self) -> List[Path]:
+        """Returns scannable files sorted by path, never entering excluded directories."""
+        def warn(directory: str, error: OSError) -> None:
+            print(f"Warning: Could not list {directory}: {error}")
+
+        found = list(iter_files(self.root_dir, self.INCLUDE_EXTENSIONS, on_error=warn))
+        found.sort(key=lambda path: path.relative_to(self.root_dir).parts)
+        return found
+
     def collect_all_todos(self) -> List[TodoItem]:
         """Scans the entire project and collects all @todo items."""
         print(f"Scanning {self.root_dir} for @todo comments...")
 
-        for file_path in self.root_dir.rglob('*'):
-            if file_path.is_file() and self.should_scan_file(file_path):
-                file_todos = self.extract_todos_from_file(file_path)
-                self.todos.extend(file_todos)
+        index = TodoIndex.load(self.index_path, self.root_dir)
+        files = self.iter_candidate_files()
+        results: Dict[Path, List[TodoItem]] = {}
+        pending = []
+        for file_path in files:
+            rel_path = str(file_path.relative_to(self.root_dir))
+            try:
+                stat = file_path.stat()
+            except OSError:
+                stat = None
+            items = index.reuse(rel_path, stat) if stat else None
+            if items is None:
+                pending.append((file_path, rel_path, stat))
+            else:
+                results[file_path] = items
+
+        paths = [file_path for file_path, _, _ in pending]
+        digests = [index.digest(rel_path) for _, rel_path, _ in pending]
+        jobs = self.jobs or os.cpu_count() or 1
+        if jobs == 1 or len(pending) < 2:
+            scanned = map(self.scan_file, paths, digests)
+            self._merge_scans(index, pending, scanned, results)
+        else:
+            # map() yields in submission order, so results pair up with ``pending``.
+            chunksize = max(1, len(pending) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+                scanned = executor.map(self.scan_file, paths, digests, chunksize=chunksize)
+                self._merge_scans(index, pending, scanned, results)
+
+        index.retain({str(file_path.relative_to(self.root_dir)) for file_path in files})
+        index.save()
+
+        for file_path in files:
+            self.todos.extend(results[file_path])
+
+        print(f"Found {len(self.todos)} @todo items "
+              f"({len(pending)} of {len(files)} files re-read)")
+        return self.todos
 
-        print(f"Found {len(self.todos)} @todo items")
+    @staticmethod
+    def _merge_scans(index: TodoIndex, pending: list, scanned, results: dict) -> None:
+        for (file_path, rel_path, stat), (digest, items) in zip(pending, scanned):
+            if items is None:
+                items = index.items(rel_path)
+            if digest is not None and stat is not None:
+                index.update(rel_path, stat, digest, items)
+            results[file_path] = items
+
+
+    def iter_git_blobs(self, rev: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Returns ``(path, blob id)`` for tracked files that should be scanned.
+
+        Paths are relative to the scan root and sorted like the working-tree
+        walk. Without ``rev`` the blobs come from the git index; otherwise
+        from the tree of ``rev``, which does not need to be checked out.
+        """
+        if rev is None:
+            command = ['git', 'ls-files', '--stage', '-z']
+        else:
+            command = ['git', 'ls-tree', '-r', '-z', rev]
+        result = subprocess.run(command, cwd=self.root_dir, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode(errors='replace').strip())
+
+        blobs = {}
+        for record in result.stdout.split(b'\0'):
+            if not record:
+                continue
+            meta, _, raw_path = record.partition(b'\t')
+            fields = meta.split()
+            if rev is None:
+                mode, oid, stage = fields
+                if stage != b'0':
+                    continue
+            else:
+                mode, kind, oid = fields
+                if kind != b'blob':
+                    continue
+            # Skip symlinks (120000) and submodules (160000)
+            if mode not in (b'100644', b'100755'):
+                continue
+            path = os.fsdecode(raw_path)
+            parts = path.split('/')
+            if any(part in self.EXCLUDED_DIRS for part in parts[:-1]):
+                continue
+            if os.path.splitext(parts[-1])[1] in self.INCLUDE_EXTENSIONS:
+                blobs[path] = oid.decode('ascii')
+
+        return sorted(blobs.items(), key=lambda item: item[0].split('/'))
+
+    def iter_blob_contents(self, oids: List[str]) -> Iterator[bytes]:
+        """Yields the contents of ``oids`` in order from one ``git cat-file --batch``."""
+        process = subprocess.Popen(
+            ['git', 'cat-file', '--batch'],
+            cwd=self.root_dir, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+
+        def feed() -> None:
+            # Requests are written from a thread so the pipes never deadlock.
+            try:
+                for oid in oids:
+                    process.stdin.write(oid.encode('ascii') + b'\n')
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        try:
+            for oid in oids:
+                header = process.stdout.readline().split()
+                if len(header) != 3:
+                    raise RuntimeError(f"git cat-file could not read {oid}")
+                data = process.stdout.read(int(header[2]))
+                process.stdout.read(1)  # trailing newline
+                yield data
+        finally:
+            process.stdout.close()
+            process.kill()
+            process.wait()
+            writer.join()
+
+    def collect_git_todos(self, rev: Optional[str] = None) -> List[TodoItem]:
+        """Collects @todo items from tracked blobs instead of the working tree.
+
+        Each distinct blob is extracted once; identical files share the result.
+        """
+        label = rev or 'the git index'
+        print(f"Scanning {label} in {self.root_dir} for @todo comments...")
+
+        blobs = self.iter_git_blobs(rev)
+        first_paths: Dict[str, str] = {}
+        for path, oid in blobs:
+            first_paths.setdefault(oid, path)
+        oids = list(first_paths)
+
+        by_oid = {}
+        for oid, data in zip(oids, self.iter_blob_contents(oids)):
+            by_oid[oid] = self._extract_todos_from_bytes(data, self.root_dir / first_paths[oid])
+
+        for path, oid in blobs:
+            file_path = str(Path(path))
+            self.todos.extend(replace(item, file_path=file_path) for item in by_oid[oid])
+
+        print(f"Found {len(self.todos)} @todo items "
+              f"({len(oids)} distinct blobs in {len(blobs)} files)")
         return self.todos
 
 
@@ -301,19 +586,59 @@ def main():
         default='.',
         help='Root directory to scan (default: current directory)'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for scanning files (default: CPU count)'
+    )
+    parser.add_argument(
+        '--index',
+        default=None,
+        help='Incremental index path (default: .<report name>.index.json next to the report)'
+    )
+    parser.add_argument(
+        '--no-index',
+        action='store_true',
+        help='Rescan every file without reading or writing the index'
+    )
+    parser.add_argument(
+        '--git',
+        action='store_true',
+        help='Scan tracked blobs from the git index instead of the working tree'
+    )
+    parser.add_argument(
+        '--rev',
+        default=None,
+        help='Scan the tree of this git revision without checking it out (implies --git)'
+    )
 
     args = parser.parse_args()
+    output_path = Path(args.output)
+
+    if args.no_index:
+        index_path = None
+    elif args.index:
+        index_path = Path(args.index)
+    else:
+        index_path = output_path.parent / f'.{output_path.name}.index.json'
 
     # Collect todos
-    collector = TodoCollector(root_dir=args.root)
-    todos = collector.collect_all_todos()
+    collector = TodoCollector(root_dir=args.root, jobs=args.jobs, index_path=index_path)
+    if args.git or args.rev:
+        try:
+            todos = collector.collect_git_todos(args.rev)
+        except (OSError, RuntimeError) as e:
+            print(f"Error: could not read git objects: {e}", file=sys.stderr)
+            return 1
+    else:
+        todos = collector.collect_all_todos()
 
     # Generate report
     generator = MarkdownReportGenerator(todos)
     markdown = generator.generate_markdown()
 
     # Write output
-    output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -321,7 +646,8 @@ def main():
 
     print(f"\n✅ Report generated: {output_path}")
     print(f"   Total puzzles: {len(todos)}")
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
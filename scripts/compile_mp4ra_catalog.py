@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""Compile MP4RABoxes.json into a compact, memory-mappable lookup table.
+
+The bundled catalog is about 214 KB of pretty-printed JSON that
+``ISOInspectorKit`` otherwise decodes at launch. The compiled table keeps the
+same data in fixed-size records sorted by FourCC, so a reader can map the file
+and binary-search it without parsing anything.
+
+Table layout (all integers big-endian, sections 8-byte aligned)::
+
+    header   magic "MP4RACT1", version u32, record_count u32, uuid_count u32,
+             records_offset u32, uuid_index_offset u32, strings_offset u32,
+             strings_length u32, extras_ref u32, source_sha256[32],
+             body_sha256[32]
+    records  per box: fourcc[4], source_index u32, then string refs u32 for
+             name, summary, specification, category, flags and uuid,
+             version i32, has_version u8, 3 padding bytes
+    uuids    per uuid entry: uuid[16], record index u32; sorted by uuid
+    strings  per distinct string: length u16, UTF-8 bytes; sorted
+
+Records are sorted by ``(fourcc, source_index)``. A string ref is the offset of
+the string inside the string table, or ``0xFFFFFFFF`` when the field is
+absent; every distinct string is stored once. ``extras_ref`` points at the
+top-level members other than ``boxes`` (``metadata``, ``provenance``) stored
+as canonical JSON. ``source_sha256`` ties the table to the exact JSON bytes it
+was compiled from and ``body_sha256`` covers everything after the header.
+
+Compiling always verifies that the table decompiles to the same JSON value
+as the source, including box order.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import struct
+import sys
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SOURCE = ROOT / "Sources" / "ISOInspectorKit" / "Resources" / "MP4RABoxes.json"
+DEFAULT_OUTPUT = ROOT / "Distribution" / "MP4RA" / "MP4RABoxes.bin"
+MAGIC = b"MP4RACT1"
+TABLE_VERSION = 1
+HEADER = struct.Struct(">8sIIIIIIII32s32s")
+RECORD = struct.Struct(">4sIIIIIIIiB3x")
+UUID_RECORD = struct.Struct(">16sI")
+STRING_LENGTH = struct.Struct(">H")
+SECTION_ALIGNMENT = 8
+NO_STRING = 0xFFFF_FFFF
+STRING_FIELDS = ("name", "summary", "specification", "category", "flags", "uuid")
+ENTRY_FIELDS = {"type", "version", *STRING_FIELDS}
+
+
+class TableFormatError(RuntimeError):
+    """Raised when a compiled table's header or sections cannot be read."""
+
+
+@dataclass(frozen=True)
+class BoxRecord:
+    """One decoded record of a compiled table."""
+
+    fourcc: bytes
+    source_index: int
+    fields: dict
+
+    def entry(self) -> dict:
+        """Return the record as the JSON entry it was compiled from."""
+
+        return {"type": self.fourcc.decode("ascii"), **self.fields}
+
+
+def _padding(position: int) -> int:
+    return -position % SECTION_ALIGNMENT
+
+
+def _fourcc(identifier: object, index: int) -> bytes:
+    if not isinstance(identifier, str):
+        raise ValueError(f"[index: {index}] type must be a string")
+    if len(identifier) != 4 or not identifier.isascii():
+        raise ValueError(f"[index: {index}] type {identifier!r} is not a four-character code")
+    return identifier.encode("ascii")
+
+
+def _uuid_bytes(value: str, index: int) -> bytes:
+    try:
+        return uuid.UUID(value).bytes
+    except ValueError:
+        raise ValueError(f"[index: {index}] uuid {value!r} is not a valid UUID") from None
+
+
+def build_table(source: bytes) -> bytes:
+    """Compile the catalog JSON in ``source`` into table bytes.
+
+    Raises ``ValueError`` when the catalog holds anything the table cannot
+    represent exactly (unknown entry fields, non-string text fields, a type
+    that is not a four-character code).
+    """
+
+    catalog = json.loads(source)
+    if not isinstance(catalog, dict) or not isinstance(catalog.get("boxes"), list):
+        raise ValueError("catalog must be an object with a 'boxes' array")
+    boxes = catalog["boxes"]
+    extras = {key: value for key, value in catalog.items() if key != "boxes"}
+
+    strings = {json.dumps(extras, sort_keys=True, ensure_ascii=False)}
+    for index, entry in enumerate(boxes):
+        if not isinstance(entry, dict):
+            raise ValueError(f"[index: {index}] box entry must be an object")
+        unknown = entry.keys() - ENTRY_FIELDS
+        if unknown:
+            raise ValueError(f"[index: {index}] unsupported fields: {', '.join(sorted(unknown))}")
+        for name in STRING_FIELDS:
+            if name in entry and not isinstance(entry[name], str):
+                raise ValueError(f"[index: {index}] {name} must be a string")
+            if name in entry:
+                strings.add(entry[name])
+        version = entry.get("version")
+        if "version" in entry and (type(version) is not int or not -(2**31) <= version < 2**31):
+            raise ValueError(f"[index: {index}] version must be a 32-bit integer")
+
+    string_table = bytearray()
+    refs: dict[str, int] = {}
+    for text in sorted(strings):
+        encoded = text.encode("utf-8")
+        if len(encoded) > 0xFFFF:
+            raise ValueError(f"string of {len(encoded)} bytes does not fit the string table")
+        refs[text] = len(string_table)
+        string_table += STRING_LENGTH.pack(len(encoded)) + encoded
+
+    ordered = sorted(
+        ((_fourcc(entry.get("type"), index), index, entry) for index, entry in enumerate(boxes)),
+        key=lambda item: item[:2],
+    )
+    records = bytearray()
+    uuids = []
+    for record_index, (fourcc, source_index, entry) in enumerate(ordered):
+        records += RECORD.pack(
+            fourcc,
+            source_index,
+            *(refs[entry[name]] if name in entry else NO_STRING for name in STRING_FIELDS),
+            entry.get("version", 0),
+            "version" in entry,
+        )
+        if "uuid" in entry:
+            uuids.append((_uuid_bytes(entry["uuid"], source_index), record_index))
+    uuid_index = b"".join(UUID_RECORD.pack(*item) for item in sorted(uuids))
+
+    body = bytearray()
+    offsets = []
+    for section in (records, uuid_index, string_table):
+        body += bytes(_padding(HEADER.size + len(body)))
+        offsets.append(HEADER.size + len(body))
+        body += section
+    header = HEADER.pack(
+        MAGIC,
+        TABLE_VERSION,
+        len(ordered),
+        len(uuids),
+        offsets[0],
+        offsets[1],
+        offsets[2],
+        len(string_table),
+        refs[json.dumps(extras, sort_keys=True, ensure_ascii=False)],
+        hashlib.sha256(source).digest(),
+        hashlib.sha256(body).digest(),
+    )
+    return header + bytes(body)
+
+
+class CompiledTable:
+    """Read-only view of a compiled table held in any buffer (bytes, mmap)."""
+
+    def __init__(self, buffer) -> None:
+        if len(buffer) < HEADER.size:
+            raise TableFormatError("file is smaller than the table header")
+        (
+            magic,
+            version,
+            self.record_count,
+            self.uuid_count,
+            self.records_offset,
+            self.uuid_index_offset,
+            self.strings_offset,
+            self.strings_length,
+            self.extras_ref,
+            self.source_sha256,
+            self.body_sha256,
+        ) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise TableFormatError(f"bad magic {magic!r}")
+        if version != TABLE_VERSION:
+            raise TableFormatError(f"unsupported table version {version}")
+        for end, section in (
+            (self.records_offset + self.record_count * RECORD.size, "records"),
+            (self.uuid_index_offset + self.uuid_count * UUID_RECORD.size, "uuid index"),
+            (self.strings_offset + self.strings_length, "string table"),
+        ):
+            if end > len(buffer):
+                raise TableFormatError(f"{section} extend past end of file")
+        self.buffer = buffer
+
+    def string(self, ref: int) -> Optional[str]:
+        if ref == NO_STRING:
+            return None
+        if ref + STRING_LENGTH.size > self.strings_length:
+            raise TableFormatError(f"string ref {ref} out of range")
+        start = self.strings_offset + ref + STRING_LENGTH.size
+        (length,) = STRING_LENGTH.unpack_from(self.buffer, start - STRING_LENGTH.size)
+        if ref + STRING_LENGTH.size + length > self.strings_length:
+            raise TableFormatError(f"string at {ref} extends past the string table")
+        return bytes(self.buffer[start : start + length]).decode("utf-8")
+
+    def fourcc(self, index: int) -> bytes:
+        start = self.records_offset + index * RECORD.size
+        return bytes(self.buffer[start : start + 4])
+
+    def record(self, index: int) -> BoxRecord:
+        fourcc, source_index, *string_refs, version, has_version = RECORD.unpack_from(
+            self.buffer, self.records_offset + index * RECORD.size
+        )
+        fields = {
+            name: self.string(ref)
+            for name, ref in zip(STRING_FIELDS, string_refs)
+            if ref != NO_STRING
+        }
+        if has_version:
+            fields["version"] = version
+        return BoxRecord(fourcc, source_index, fields)
+
+    def lookup(self, fourcc: str | bytes) -> Optional[BoxRecord]:
+        """Binary-search the records for ``fourcc``; return its first record."""
+
+        key = fourcc.encode("ascii") if isinstance(fourcc, str) else fourcc
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.fourcc(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.record_count and self.fourcc(low) == key:
+            return self.record(low)
+        return None
+
+    def lookup_uuid(self, value: str | uuid.UUID) -> Optional[BoxRecord]:
+        """Binary-search the uuid index for an extended type."""
+
+        key = (value if isinstance(value, uuid.UUID) else uuid.UUID(value)).bytes
+        low, high = 0, self.uuid_count
+        while low < high:
+            middle = (low + high) // 2
+            start = self.uuid_index_offset + middle * UUID_RECORD.size
+            if bytes(self.buffer[start : start + 16]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.uuid_count:
+            candidate, record_index = UUID_RECORD.unpack_from(
+                self.buffer, self.uuid_index_offset + low * UUID_RECORD.size
+            )
+            if candidate == key:
+                return self.record(record_index)
+        return None
+
+    def decompile(self) -> dict:
+        """Rebuild the catalog JSON value, with boxes in their source order."""
+
+        records = sorted(
+            (self.record(index) for index in range(self.record_count)),
+            key=lambda record: record.source_index,
+        )
+        extras = json.loads(self.string(self.extras_ref))
+        return {"boxes": [record.entry() for record in records], **extras}
+
+
+def _canonical(value: object) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def verify_table(table: bytes, source: Optional[bytes] = None) -> list[str]:
+    """Check a table's structure and checksums, returning a list of errors.
+
+    When ``source`` is given the table must have been compiled from exactly
+    those bytes and must decompile to the same JSON value.
+    """
+
+    try:
+        compiled = CompiledTable(table)
+    except TableFormatError as exc:
+        return [str(exc)]
+    errors = []
+    if hashlib.sha256(table[HEADER.size :]).digest() != compiled.body_sha256:
+        errors.append("body checksum mismatch")
+        return errors
+
+    try:
+        fourccs = [compiled.fourcc(index) for index in range(compiled.record_count)]
+        if fourccs != sorted(fourccs):
+            errors.append("records are not sorted by FourCC")
+        uuids = [
+            UUID_RECORD.unpack_from(table, compiled.uuid_index_offset + index * UUID_RECORD.size)
+            for index in range(compiled.uuid_count)
+        ]
+        if uuids != sorted(uuids):
+            errors.append("uuid index is not sorted")
+        for value, record_index in uuids:
+            record = compiled.record(record_index) if record_index < compiled.record_count else None
+            if record is None or uuid.UUID(record.fields.get("uuid", "")).bytes != value:
+                errors.append(f"uuid index entry {uuid.UUID(bytes=value)} points at the wrong record")
+        decompiled = compiled.decompile()
+    except (TableFormatError, UnicodeDecodeError, ValueError) as exc:
+        errors.append(f"table is corrupt: {exc}")
+        return errors
+
+    if source is not None:
+        if hashlib.sha256(source).digest() != compiled.source_sha256:
+            errors.append("table is stale (source catalog changed)")
+        elif _canonical(decompiled) != _canonical(json.loads(source)):
+            errors.append("table does not round-trip to the source catalog")
+    return errors
+
+
+def write_table(source_path: Path, output: Path) -> bytes:
+    """Compile ``source_path`` into ``output`` atomically and return the table."""
+
+    source = source_path.read_bytes()
+    table = build_table(source)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(delete=False, dir=output.parent) as handle:
+        temp_path = Path(handle.name)
+        handle.write(table)
+    temp_path.replace(output)
+    return table
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE)
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Verify an existing table against the source catalog instead of compiling.",
+    )
+    parser.add_argument(
+        "--lookup", metavar="TYPE", help="Print the entry for a FourCC or extended-type UUID."
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        source = args.source.read_bytes()
+    except OSError as exc:
+        print(f"error: {args.source}: {exc.strerror or exc}", file=sys.stderr)
+        return 1
+    if not args.verify:
+        try:
+            table = write_table(args.source, args.output)
+        except (ValueError, json.JSONDecodeError) as exc:
+            print(f"error: {args.source}: {exc}", file=sys.stderr)
+            return 1
+        except OSError as exc:
+            print(f"error: {args.output}: {exc.strerror or exc}", file=sys.stderr)
+            return 1
+        print(
+            f"Compiled {CompiledTable(table).record_count} boxes into {args.output} "
+            f"({len(table)} bytes, source {len(source)} bytes)."
+        )
+    elif not args.output.exists():
+        print(f"error: {args.output} not found", file=sys.stderr)
+        return 1
+
+    table = args.output.read_bytes()
+    errors = verify_table(table, source)
+    for error in errors:
+        print(f"error: {error}")
+    if errors:
+        print(f"MP4RA table verification failed with {len(errors)} error(s).", file=sys.stderr)
+        return 1
+    print(f"MP4RA table verified ({args.output}).")
+
+    if args.lookup:
+        compiled = CompiledTable(table)
+        try:
+            record = (
+                compiled.lookup_uuid(args.lookup)
+                if len(args.lookup) > 4
+                else compiled.lookup(args.lookup)
+            )
+        except (UnicodeEncodeError, ValueError):
+            record = None
+        if record is None:
+            print(f"{args.lookup}: not in catalog")
+            return 1
+        print(json.dumps(record.entry(), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    raise SystemExit(main(sys.argv[1:]))
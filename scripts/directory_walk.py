@@ -0,0 +1,67 @@
+"""Directory walk shared by the repository scripts.
+
+``validate_json.py``, ``collect_todos.py`` and ``scan_box_histogram.py`` list
+candidate files with the same ``os.scandir`` walk, so they agree on which
+build, dependency and VCS directories are never entered.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Collection, Iterator, Optional
+
+
+# Directories the walk never enters: VCS metadata, build output and
+# dependency caches.
+PRUNED_DIRECTORIES = frozenset(
+    {
+        ".build",
+        ".git",
+        ".swiftpm",
+        ".venv",
+        "__pycache__",
+        "build",
+        "Derived",
+        "DerivedData",
+        "node_modules",
+        "Pods",
+    }
+)
+
+
+def iter_files(
+    directory: Path,
+    suffixes: Collection[str],
+    *,
+    ignore_case: bool = False,
+    on_error: Optional[Callable[[str, OSError], None]] = None,
+) -> Iterator[Path]:
+    """Yield files under ``directory`` whose suffix is in ``suffixes``.
+
+    Directories in ``PRUNED_DIRECTORIES`` and symlinked directories are not
+    entered. With ``ignore_case`` suffixes are compared in lower case, so
+    ``suffixes`` must be lower case too. Directories that cannot be listed are
+    passed to ``on_error`` and skipped. Files are yielded in scan order;
+    callers sort them as they need.
+    """
+
+    pending = [str(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError as exc:
+            if on_error is not None:
+                on_error(current, exc)
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in PRUNED_DIRECTORIES:
+                        pending.append(entry.path)
+                    continue
+                suffix = os.path.splitext(entry.name)[1]
+                if ignore_case:
+                    suffix = suffix.lower()
+                if suffix in suffixes and entry.is_file():
+                    yield Path(entry.path)
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""Cross-index MP4RA catalog entries against the registered box parsers.
+
+The Swift sources under ``Sources/ISOInspectorKit/ISO`` are scanned once for
+four-character codes:
+
+* ``registered`` — ``registry.register(parser:for:)`` calls in the
+  ``BoxParserRegistry+*.swift`` extensions, bound through
+  ``FourCharCode("xxxx")`` literals.
+* ``inline`` — codes a parent parser decodes itself (sample entry
+  ``rawValues`` tables, ``rawValue == "xxxx"`` lookups of child boxes and
+  ``case "xxxx":`` labels of ``switch …rawValue`` statements).
+* ``container`` — ``FourCharContainerCode`` cases; the walker descends into
+  their children but the box itself has no parser.
+* ``media/index`` — ``MediaAndIndexBoxCode`` cases.
+
+Every other code falls back to ``BoxParserRegistry``'s placeholder parser.
+The index is joined with ``MP4RABoxes.json`` and the report lists registered
+parsers without catalog metadata, catalog entries without a parser, and the
+high-frequency production codes that still get placeholder parsing. The
+frequency ranking defaults to ``PRODUCTION_FOURCCS`` and can be replaced with
+measured counts via ``--frequencies``.
+
+The scanned index is cached by the git blob ids of its inputs (see
+``validation_cache.py``), so re-running on an unchanged tree skips the scan.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from validation_cache import ResultCache, blob_ids
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SOURCES = ROOT / "Sources" / "ISOInspectorKit" / "ISO"
+DEFAULT_CATALOG = ROOT / "Sources" / "ISOInspectorKit" / "Resources" / "MP4RABoxes.json"
+REGISTRY_GLOB = "BoxParserRegistry*.swift"
+ENUM_SOURCES = {
+    "FourCharContainerCode.swift": "container",
+    "MediaAndIndexBoxCode.swift": "media/index",
+}
+STATUSES = ("registered", "inline", "container", "media/index", "placeholder")
+
+# Box types that dominate progressive MP4, fragmented MP4/CMAF and HLS/DASH
+# production files, most frequent first. Used when no measured frequencies
+# are supplied.
+PRODUCTION_FOURCCS = (
+    "mdat", "moof", "traf", "tfhd", "tfdt", "trun", "mfhd", "styp", "sidx", "emsg",
+    "prft", "senc", "saio", "saiz", "sbgp", "sgpd", "ftyp", "moov", "mvhd", "trak",
+    "tkhd", "edts", "elst", "mdia", "mdhd", "hdlr", "minf", "vmhd", "smhd", "sthd",
+    "nmhd", "dinf", "dref", "url ", "stbl", "stsd", "avc1", "avc3", "avcC", "hvc1",
+    "hev1", "hvcC", "av01", "av1C", "mp4a", "esds", "ac-3", "dac3", "ec-3", "dec3",
+    "Opus", "dOps", "stpp", "wvtt", "btrt", "pasp", "colr", "clli", "mdcv", "sinf",
+    "frma", "schm", "schi", "tenc", "pssh", "encv", "enca", "stts", "ctts", "cslg",
+    "stsc", "stsz", "stco", "co64", "stss", "sdtp", "mvex", "mehd", "trex", "udta",
+    "meta", "ilst", "free", "skip", "mfra", "tfra", "mfro", "uuid",
+)
+
+VARIABLE_RE = re.compile(r'\b(?:let|var)\s+(\w+)\s*=\s*try[?!]?\s*FourCharCode\("(.{4})"\)')
+REGISTER_RE = re.compile(
+    r'\bregister\(\s*parser:\s*([\w.]+)\s*,\s*for:\s*'
+    r'(?:try[?!]?\s*FourCharCode\("(.{4})"\)|(\w+))\s*\)'
+)
+RAW_VALUES_RE = re.compile(r"\brawValues\s*=\s*\[([^\]]*)\]")
+RAW_VALUE_COMPARE_RE = re.compile(r'\brawValue\s*==\s*"(.{4})"')
+CONTAINS_RE = re.compile(r"\[([^\]]*)\]\.contains\([\w.]*rawValue\)")
+SWITCH_RE = re.compile(r"\bswitch\s+[\w.]*\brawValue\s*\{")
+CASE_LABEL_RE = re.compile(r'\bcase\s+("(?:.{4})"(?:\s*,\s*"(?:.{4})")*)\s*:')
+BRACE_RE = re.compile(r'"(?:\\.|[^"\\\n])*"|[{}]')
+ENUM_CASE_RE = re.compile(r'^\s*case\s+\w+\s*=\s*"(.{4})"', re.MULTILINE)
+LITERAL_RE = re.compile(r'"(.{4})"')
+
+
+def _line(text: str, position: int) -> int:
+    return text.count("\n", 0, position) + 1
+
+
+def _switch_case_labels(text: str) -> Iterator[tuple[str, int]]:
+    """Yield ``(fourcc, position)`` for ``case "xxxx":`` labels of ``switch …rawValue`` blocks.
+
+    Only labels directly inside the switch body count, so a nested switch on
+    some other string does not contribute codes.
+    """
+
+    for switch in SWITCH_RE.finditer(text):
+        depth = 1
+        top_level = [switch.end()]  # alternating start/end of depth-1 spans
+        for token in BRACE_RE.finditer(text, switch.end()):
+            if token.group() == "{":
+                depth += 1
+                if depth == 2:
+                    top_level.append(token.start())
+            elif token.group() == "}":
+                depth -= 1
+                if depth == 1:
+                    top_level.append(token.end())
+                elif depth == 0:
+                    top_level.append(token.start())
+                    break
+        for start, end in zip(top_level[::2], top_level[1::2]):
+            for case in CASE_LABEL_RE.finditer(text, start, end):
+                for literal in LITERAL_RE.finditer(case.group(1)):
+                    yield literal.group(1), case.start(1) + literal.start()
+
+
+def scan_sources(sources: Path, root: Path = ROOT) -> dict:
+    """Return the four-character codes referenced by the parser sources.
+
+    The result maps ``"registered"`` to ``{fourcc: {"parser", "location"}}``
+    and every other kind to ``{fourcc: [locations]}``; locations are
+    ``path:line`` strings relative to ``root`` when possible.
+    """
+
+    index: dict = {"registered": {}, "inline": {}, "container": {}, "media/index": {}}
+
+    def location(path: Path, text: str, position: int) -> str:
+        try:
+            name = path.resolve().relative_to(root.resolve()).as_posix()
+        except ValueError:
+            name = path.as_posix()
+        return f"{name}:{_line(text, position)}"
+
+    def add(kind: str, fourcc: str, path: Path, text: str, position: int) -> None:
+        index[kind].setdefault(fourcc, []).append(location(path, text, position))
+
+    for path in sorted(sources.glob(REGISTRY_GLOB)):
+        text = path.read_text(encoding="utf-8")
+        variables = {match.group(1): match.group(2) for match in VARIABLE_RE.finditer(text)}
+        for match in REGISTER_RE.finditer(text):
+            fourcc = match.group(2) or variables.get(match.group(3))
+            if fourcc is not None:
+                index["registered"].setdefault(
+                    fourcc,
+                    {
+                        "parser": match.group(1).split(".")[-1],
+                        "location": location(path, text, match.start()),
+                    },
+                )
+        for pattern in (RAW_VALUES_RE, CONTAINS_RE):
+            for match in pattern.finditer(text):
+                for literal in LITERAL_RE.finditer(match.group(1)):
+                    add("inline", literal.group(1), path, text, match.start(1) + literal.start())
+        for match in RAW_VALUE_COMPARE_RE.finditer(text):
+            add("inline", match.group(1), path, text, match.start())
+        for fourcc, position in _switch_case_labels(text):
+            add("inline", fourcc, path, text, position)
+
+    for name, kind in ENUM_SOURCES.items():
+        path = sources / name
+        if not path.exists():
+            continue
+        text = path.read_text(encoding="utf-8")
+        for match in ENUM_CASE_RE.finditer(text):
+            add(kind, match.group(1), path, text, match.start(1))
+    return index
+
+
+def load_catalog_names(catalog: Path) -> dict[str, str]:
+    """Return ``{fourcc: name}`` for every catalog entry, keeping the first of duplicates."""
+
+    data = json.loads(catalog.read_text(encoding="utf-8"))
+    names = {}
+    for entry in data.get("boxes", []):
+        if isinstance(entry, dict) and isinstance(entry.get("type"), str):
+            names.setdefault(entry["type"], entry.get("name") or "")
+    return names
+
+
+def join_index(index: dict, catalog: dict[str, str]) -> list[dict]:
+    """Join the scanned codes with the catalog into one row per FourCC."""
+
+    rows = []
+    codes = set(catalog).union(*(index[kind] for kind in STATUSES[:-1]))
+    for fourcc in sorted(codes):
+        status = next((kind for kind in STATUSES[:-1] if fourcc in index[kind]), "placeholder")
+        registered = index["registered"].get(fourcc)
+        rows.append(
+            {
+                "fourcc": fourcc,
+                "status": status,
+                "in_catalog": fourcc in catalog,
+                "name": catalog.get(fourcc),
+                "parser": registered["parser"] if registered else None,
+            }
+        )
+    return rows
+
+
+def load_frequencies(path: Path) -> dict[str, int]:
+    """Read ``{fourcc: count}`` from a JSON object or a CSV with ``fourcc``/``count`` columns.
+
+    A JSON document may also be a list of objects with ``fourcc`` and
+    ``count`` keys, or an object holding such a list under ``boxes`` (the
+    output of ``scan_box_histogram.py``).
+    """
+
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".csv":
+        rows: Iterable[dict] = csv.DictReader(text.splitlines())
+    else:
+        data = json.loads(text)
+        if isinstance(data, dict) and isinstance(data.get("boxes"), list):
+            rows = data["boxes"]
+        elif isinstance(data, dict):
+            return {str(key): int(value) for key, value in data.items()}
+        else:
+            rows = data
+    return {row["fourcc"]: int(row["count"]) for row in rows}
+
+
+def default_frequencies() -> dict[str, int]:
+    """Rank ``PRODUCTION_FOURCCS`` so the first entry weighs the most."""
+
+    total = len(PRODUCTION_FOURCCS)
+    return {fourcc: total - rank for rank, fourcc in enumerate(PRODUCTION_FOURCCS)}
+
+
+def build_report(rows: list[dict], frequencies: dict[str, int], top: int) -> dict:
+    """Summarise coverage gaps and frequent codes that lack a dedicated parser.
+
+    ``frequent_without_parser`` lists the frequent codes that fall back to
+    placeholder parsing; frequent containers, media/index codes and codes a
+    parent parses inline are listed separately in ``frequent_handled_indirectly``.
+    """
+
+    by_code = {row["fourcc"]: row for row in rows}
+    frequent = sorted(
+        (code for code, count in frequencies.items() if count > 0),
+        key=lambda code: (-frequencies[code], code),
+    )[:top]
+    unparsed = []
+    indirect = []
+    for code in frequent:
+        row = by_code.get(code, {"fourcc": code, "status": "placeholder", "in_catalog": False})
+        if row["status"] == "placeholder":
+            unparsed.append({**row, "frequency": frequencies[code]})
+        elif row["status"] != "registered":
+            indirect.append({**row, "frequency": frequencies[code]})
+    counts = {status: sum(row["status"] == status for row in rows) for status in STATUSES}
+    return {
+        "counts": counts,
+        "catalog_entries": sum(row["in_catalog"] for row in rows),
+        "registered_without_catalog": [
+            row for row in rows if row["status"] == "registered" and not row["in_catalog"]
+        ],
+        "referenced_without_catalog": [
+            row
+            for row in rows
+            if row["status"] in ("inline", "container", "media/index") and not row["in_catalog"]
+        ],
+        "frequent_without_parser": unparsed,
+        "frequent_handled_indirectly": indirect,
+        "rows": rows,
+    }
+
+
+def _input_key(paths: list[Path], root: Path) -> Optional[str]:
+    ids = blob_ids(paths, root)
+    if len(ids) != len(paths):
+        return None
+    hasher = hashlib.sha256()
+    for path in paths:
+        hasher.update(f"{path.as_posix()}\0{ids[path]}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def build_index(
+    sources: Path, catalog: Path, cache: Optional[ResultCache] = None, root: Path = ROOT
+) -> list[dict]:
+    """Scan ``sources``, join with ``catalog`` and return the joined rows.
+
+    The rows are cached under a key derived from the blob ids of every
+    scanned Swift file and the catalog.
+    """
+
+    cache = cache or ResultCache.disabled()
+    inputs = sorted(sources.glob(REGISTRY_GLOB))
+    inputs += [sources / name for name in ENUM_SOURCES if (sources / name).exists()]
+    inputs.append(catalog)
+    key = _input_key(inputs, root) if cache.enabled else None
+    rows = cache.lookup(key)
+    if rows is None:
+        rows = join_index(scan_sources(sources, root), load_catalog_names(catalog))
+        cache.store(key, rows)
+        cache.save()
+    return rows
+
+
+def print_report(report: dict) -> None:
+    counts = report["counts"]
+    print(
+        f"{report['catalog_entries']} catalog entries; "
+        + ", ".join(f"{counts[status]} {status}" for status in STATUSES)
+    )
+
+    registered = report["registered_without_catalog"]
+    print(f"\nRegistered parsers without catalog metadata ({len(registered)}):")
+    for row in registered:
+        print(f"  {row['fourcc']}  {row['parser']}")
+
+    referenced = report["referenced_without_catalog"]
+    print(f"\nCodes referenced by parsers but missing from the catalog ({len(referenced)}):")
+    for row in referenced:
+        print(f"  {row['fourcc']}  ({row['status']})")
+
+    frequent = report["frequent_without_parser"]
+    print(f"\nHigh-frequency codes that fall back to placeholder parsing ({len(frequent)}):")
+    for row in frequent:
+        name = row.get("name") or ("not in catalog" if not row.get("in_catalog") else "")
+        print(f"  {row['fourcc']}  {row['frequency']:>8}  {name}")
+
+    indirect = report["frequent_handled_indirectly"]
+    if indirect:
+        summary = ", ".join(f"{row['fourcc']} ({row['status']})" for row in indirect)
+        print(f"\nHigh-frequency codes handled without a dedicated parser ({len(indirect)}):")
+        print(f"  {summary}")
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=Path, default=DEFAULT_SOURCES)
+    parser.add_argument("--catalog", type=Path, default=DEFAULT_CATALOG)
+    parser.add_argument(
+        "--frequencies",
+        type=Path,
+        default=None,
+        help="JSON or CSV of measured fourcc counts (default: built-in production ranking).",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=50,
+        help="Number of most frequent codes to check for placeholder parsing (default: 50).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON.")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the index cache (default: .git/validation-cache).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always rescan the sources.")
+    args = parser.parse_args(argv)
+
+    if args.no_cache:
+        cache = ResultCache.disabled()
+    else:
+        cache = ResultCache.for_validator(
+            "index_box_parsers", [Path(__file__)], cache_dir=args.cache_dir
+        )
+    rows = build_index(args.sources, args.catalog, cache)
+    frequencies = load_frequencies(args.frequencies) if args.frequencies else default_frequencies()
+    report = build_report(rows, frequencies, args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    raise SystemExit(main(sys.argv[1:]))
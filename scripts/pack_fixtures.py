@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Pack the base64 test fixtures into one aligned, memory-mappable binary.
+
+Every ``Tests/ISOInspectorKitTests/Fixtures/Media/*.txt`` and
+``Fixtures/Corrupt/*.base64`` payload is decoded once and written into a single
+pack so the Swift test suite can open it with ``MappedReader`` and take
+zero-copy slices instead of decoding base64 in every test.
+
+Pack layout (all integers big-endian)::
+
+    header   magic "ISOFXPK1", version u32, alignment u32, entry_count u32,
+             reserved u32, toc_offset u64, toc_length u64, toc_sha256[32]
+    payloads each starting on an ``alignment`` boundary, zero padded
+    toc      per entry: id_length u16, offset u64, length u64, sha256[32], id
+
+Fixture ids are ``Media/<name>`` and ``Corrupt/<name>`` (for example
+``Media/dash_segment_1`` and ``Corrupt/empty-file.mp4``). The table of contents
+is written after the payloads so packing streams every fixture exactly once.
+"""
+from __future__ import annotations
+
+import argparse
+import binascii
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from audit_fixtures import iter_base64_decoded, read_chunks
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MEDIA_ROOT = ROOT / "Tests" / "ISOInspectorKitTests" / "Fixtures" / "Media"
+DEFAULT_CORRUPT_ROOT = ROOT / "Fixtures" / "Corrupt"
+DEFAULT_OUTPUT = ROOT / "Distribution" / "Fixtures" / "fixtures.pack"
+DEFAULT_ALIGNMENT = 64
+MAGIC = b"ISOFXPK1"
+PACK_VERSION = 1
+HEADER = struct.Struct(">8sIIIIQQ32s")
+TOC_RECORD = struct.Struct(">HQQ32s")
+
+
+class PackFormatError(RuntimeError):
+    """Raised when a pack's header or table of contents cannot be read."""
+
+
+@dataclass(frozen=True)
+class PackEntry:
+    """Location and digest of one fixture inside a pack."""
+
+    fixture_id: str
+    offset: int
+    length: int
+    sha256: str
+
+
+def collect_sources(
+    media_root: Path = DEFAULT_MEDIA_ROOT, corrupt_root: Path = DEFAULT_CORRUPT_ROOT
+) -> list[tuple[str, Path]]:
+    """Return ``(fixture_id, path)`` pairs for every base64 fixture, sorted by id."""
+
+    sources = [(f"Media/{path.stem}", path) for path in media_root.glob("*.txt")]
+    if corrupt_root.is_dir():
+        sources.extend((f"Corrupt/{path.stem}", path) for path in corrupt_root.glob("*.base64"))
+    return sorted(sources)
+
+
+def _padding(position: int, alignment: int) -> int:
+    return -position % alignment
+
+
+def _encode_toc(entries: list[PackEntry]) -> bytes:
+    toc = bytearray()
+    for entry in entries:
+        identifier = entry.fixture_id.encode("utf-8")
+        digest = bytes.fromhex(entry.sha256)
+        toc.extend(TOC_RECORD.pack(len(identifier), entry.offset, entry.length, digest))
+        toc.extend(identifier)
+    return bytes(toc)
+
+
+def write_pack(
+    sources: list[tuple[str, Path]],
+    output: Path,
+    *,
+    alignment: int = DEFAULT_ALIGNMENT,
+) -> list[PackEntry]:
+    """Decode ``sources`` into a pack at ``output`` and return its entries."""
+
+    if alignment <= 0 or alignment & (alignment - 1):
+        raise ValueError("alignment must be a positive power of two")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    entries: list[PackEntry] = []
+    with tempfile.NamedTemporaryFile(delete=False, dir=output.parent) as handle:
+        temp_path = Path(handle.name)
+        try:
+            handle.write(bytes(HEADER.size))
+            position = HEADER.size
+            for fixture_id, path in sources:
+                handle.write(bytes(_padding(position, alignment)))
+                position += _padding(position, alignment)
+                hasher = hashlib.sha256()
+                length = 0
+                try:
+                    for decoded in iter_base64_decoded(read_chunks(path)):
+                        handle.write(decoded)
+                        hasher.update(decoded)
+                        length += len(decoded)
+                except (binascii.Error, ValueError) as exc:
+                    raise ValueError(f"{path}: invalid base64: {exc}") from exc
+                entries.append(PackEntry(fixture_id, position, length, hasher.hexdigest()))
+                position += length
+
+            toc = _encode_toc(entries)
+            handle.write(bytes(_padding(position, alignment)))
+            toc_offset = position + _padding(position, alignment)
+            handle.write(toc)
+            handle.seek(0)
+            handle.write(
+                HEADER.pack(
+                    MAGIC,
+                    PACK_VERSION,
+                    alignment,
+                    len(entries),
+                    0,
+                    toc_offset,
+                    len(toc),
+                    hashlib.sha256(toc).digest(),
+                )
+            )
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+    temp_path.replace(output)
+    return entries
+
+
+def parse_pack(buffer: bytes | mmap.mmap | memoryview) -> tuple[int, list[PackEntry]]:
+    """Return ``(alignment, entries)`` from a pack held in ``buffer``."""
+
+    if len(buffer) < HEADER.size:
+        raise PackFormatError("file is smaller than the pack header")
+    magic, version, alignment, count, _, toc_offset, toc_length, toc_digest = HEADER.unpack_from(
+        buffer, 0
+    )
+    if magic != MAGIC:
+        raise PackFormatError(f"bad magic {magic!r}")
+    if version != PACK_VERSION:
+        raise PackFormatError(f"unsupported pack version {version}")
+    if toc_offset + toc_length > len(buffer):
+        raise PackFormatError("table of contents extends past end of file")
+    with memoryview(buffer) as view:
+        toc = bytes(view[toc_offset : toc_offset + toc_length])
+    if hashlib.sha256(toc).digest() != toc_digest:
+        raise PackFormatError("table of contents checksum mismatch")
+
+    entries = []
+    cursor = 0
+    for _ in range(count):
+        if cursor + TOC_RECORD.size > toc_length:
+            raise PackFormatError("table of contents truncated")
+        id_length, offset, length, digest = TOC_RECORD.unpack_from(toc, cursor)
+        cursor += TOC_RECORD.size
+        fixture_id = toc[cursor : cursor + id_length].decode("utf-8")
+        cursor += id_length
+        entries.append(PackEntry(fixture_id, offset, length, digest.hex()))
+    if cursor != toc_length:
+        raise PackFormatError("table of contents has trailing bytes")
+    return alignment, entries
+
+
+def verify_pack(path: Path, sources: Optional[list[tuple[str, Path]]] = None) -> list[str]:
+    """Check a pack's structure and digests, returning a list of errors.
+
+    Payloads are hashed through ``memoryview`` slices of an ``mmap`` so the
+    verifier never copies fixture bytes. When ``sources`` is given the pack
+    must contain exactly those fixtures with matching decoded digests.
+    """
+
+    errors: list[str] = []
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return [f"{path}: empty file"]
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            try:
+                alignment, entries = parse_pack(mapped)
+            except PackFormatError as exc:
+                return [f"{path}: {exc}"]
+            with memoryview(mapped) as view:
+                for entry in entries:
+                    if entry.offset % alignment:
+                        errors.append(f"{entry.fixture_id}: offset {entry.offset} not aligned")
+                    if entry.offset + entry.length > len(mapped):
+                        errors.append(f"{entry.fixture_id}: payload extends past end of pack")
+                        continue
+                    with view[entry.offset : entry.offset + entry.length] as payload:
+                        digest = hashlib.sha256(payload).hexdigest()
+                    if digest != entry.sha256:
+                        errors.append(f"{entry.fixture_id}: SHA-256 mismatch")
+
+    if sources is not None:
+        packed = {entry.fixture_id: entry for entry in entries}
+        expected = dict(sources)
+        for fixture_id in sorted(expected.keys() - packed.keys()):
+            errors.append(f"{fixture_id}: missing from pack")
+        for fixture_id in sorted(packed.keys() - expected.keys()):
+            errors.append(f"{fixture_id}: not present in source fixtures")
+        for fixture_id in sorted(expected.keys() & packed.keys()):
+            hasher = hashlib.sha256()
+            try:
+                for decoded in iter_base64_decoded(read_chunks(expected[fixture_id])):
+                    hasher.update(decoded)
+            except (binascii.Error, ValueError) as exc:
+                errors.append(f"{expected[fixture_id]}: invalid base64: {exc}")
+                continue
+            if hasher.hexdigest() != packed[fixture_id].sha256:
+                errors.append(f"{fixture_id}: pack is stale (source payload changed)")
+    return errors
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--media-root", type=Path, default=DEFAULT_MEDIA_ROOT)
+    parser.add_argument("--corrupt-root", type=Path, default=DEFAULT_CORRUPT_ROOT)
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--alignment",
+        type=int,
+        default=DEFAULT_ALIGNMENT,
+        help=f"Payload alignment in bytes (default: {DEFAULT_ALIGNMENT}).",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Verify an existing pack against the source fixtures instead of packing.",
+    )
+    parser.add_argument("--list", action="store_true", help="Print the table of contents.")
+    args = parser.parse_args(argv)
+
+    sources = collect_sources(args.media_root, args.corrupt_root)
+    if not args.verify:
+        try:
+            entries = write_pack(sources, args.output, alignment=args.alignment)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        print(f"Packed {len(entries)} fixture(s) into {args.output}.")
+
+    if not args.output.exists():
+        print(f"error: {args.output} not found", file=sys.stderr)
+        return 1
+    errors = verify_pack(args.output, sources)
+    if args.list and not errors:
+        _, entries = parse_pack(args.output.read_bytes())
+        for entry in entries:
+            print(f"{entry.offset:>10} {entry.length:>10} {entry.sha256} {entry.fixture_id}")
+    for error in errors:
+        print(f"error: {error}")
+    if errors:
+        print(f"Fixture pack verification failed with {len(errors)} error(s).", file=sys.stderr)
+        return 1
+    print(f"Fixture pack verified ({args.output}).")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    raise SystemExit(main(sys.argv[1:]))
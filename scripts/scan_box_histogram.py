@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""Histogram the box types found in a corpus of ISO BMFF files.
+
+Every MP4/MOV/fragment file under the given paths is walked on a process
+pool. Only box headers are read: payloads are skipped with positioned reads,
+and the walker recurses into known containers (including ``stsd`` sample
+entries and ``meta``). Small containers such as ``moov`` or ``moof`` are read
+with a single ``pread`` and walked in memory, so a file costs a handful of
+system calls regardless of how many boxes its metadata holds, while ``mdat``
+payloads are never touched.
+
+For every FourCC the scanner reports the number of boxes, the bytes they
+cover and a histogram of nesting depths, joined with the names from
+``MP4RABoxes.json``. Results are written as JSON or CSV; both formats can be
+fed to ``index_box_parsers.py --frequencies``.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import os
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from directory_walk import iter_files
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CATALOG = ROOT / "Sources" / "ISOInspectorKit" / "Resources" / "MP4RABoxes.json"
+MEDIA_SUFFIXES = {
+    ".3g2", ".3gp", ".cmfa", ".cmft", ".cmfv", ".f4v", ".heic", ".heif", ".m4a", ".m4s",
+    ".m4v", ".mj2", ".mov", ".mp4", ".qt",
+}
+MAX_DEPTH = 32
+# Containers up to this size are read with one pread and walked in memory.
+IN_MEMORY_LIMIT = 4 * 1024 * 1024
+HEADER = struct.Struct(">I4s")
+LARGE_SIZE = struct.Struct(">Q")
+
+# Payload bytes to skip before the first child of each container type.
+CONTAINERS = {
+    b"moov": 0, b"trak": 0, b"mdia": 0, b"minf": 0, b"dinf": 0, b"stbl": 0, b"edts": 0,
+    b"mvex": 0, b"moof": 0, b"traf": 0, b"mfra": 0, b"tref": 0, b"udta": 0, b"strk": 0,
+    b"strd": 0, b"sinf": 0, b"schi": 0, b"ilst": 0, b"iprp": 0, b"ipco": 0, b"grpl": 0,
+    b"rinf": 0, b"srpp": 0, b"wave": 0, b"stsd": 8, b"dref": 8, b"iref": 4,
+}
+VISUAL_SAMPLE_ENTRIES = {
+    b"avc1", b"avc2", b"avc3", b"avc4", b"hvc1", b"hev1", b"dvh1", b"dvhe", b"dvav", b"dva1",
+    b"av01", b"vp08", b"vp09", b"encv", b"mp4v", b"s263", b"jpeg", b"mjpg", b"apch", b"apcn",
+    b"apcs", b"apco", b"ap4h", b"vvc1", b"vvi1",
+}
+AUDIO_SAMPLE_ENTRIES = {
+    b"mp4a", b"enca", b"ac-3", b"ec-3", b"ac-4", b"Opus", b"fLaC", b"alac", b"mha1", b"mhm1",
+    b"samr", b"sawb", b"lpcm", b"sowt", b"twos", b"ipcm", b"fpcm",
+}
+VISUAL_ENTRY_HEADER = 78
+# ISO audio entries keep the 28-byte layout in either ``stsd`` version; only
+# QuickTime sound descriptions, which sit in a version 0 ``stsd``, grow with
+# their own version.
+ISO_AUDIO_ENTRY_HEADERS = {0: 28, 1: 28}
+QUICKTIME_AUDIO_ENTRY_HEADERS = {0: 28, 1: 44, 2: 64}
+
+Reader = Callable[[int, int], bytes]
+
+
+def iter_media_files(paths: Iterable[Path], suffixes: set[str] = MEDIA_SUFFIXES) -> Iterator[Path]:
+    """Yield media files under ``paths`` in sorted order, pruning build directories."""
+
+    for path in paths:
+        if path.is_file():
+            yield path
+            continue
+        yield from sorted(iter_files(path, suffixes, ignore_case=True))
+
+
+def _children_offset(
+    fourcc: bytes, parent: Optional[bytes], parent_version: int, read: Reader, payload: int
+) -> Optional[int]:
+    """Return where the children of a box start relative to its payload, or ``None``.
+
+    ``parent_version`` is the version of the enclosing ``stsd``, which decides
+    how audio sample entries are laid out.
+    """
+
+    if fourcc in CONTAINERS:
+        return CONTAINERS[fourcc]
+    if parent == b"ilst":
+        return 0  # metadata items hold their ``data`` boxes directly
+    if fourcc == b"meta":
+        # ISO ``meta`` is a full box; QuickTime ``meta`` starts with its children.
+        return 4 if read(payload, 4) == bytes(4) else 0
+    if parent == b"stsd":
+        if fourcc in VISUAL_SAMPLE_ENTRIES:
+            return VISUAL_ENTRY_HEADER
+        if fourcc in AUDIO_SAMPLE_ENTRIES:
+            version = read(payload + 8, 2)
+            if len(version) != 2:
+                return None
+            if parent_version == 1:
+                return ISO_AUDIO_ENTRY_HEADERS.get(int.from_bytes(version, "big"))
+            return QUICKTIME_AUDIO_ENTRY_HEADERS.get(int.from_bytes(version, "big"))
+    return None
+
+
+class Histogram:
+    """Per-FourCC box counts, byte volume and depth distribution."""
+
+    def __init__(self) -> None:
+        self.boxes: dict[str, list] = {}
+        self.files = 0
+        self.bytes = 0
+        self.errors: list[str] = []
+
+    def add(self, fourcc: bytes, size: int, depth: int) -> None:
+        entry = self.boxes.get(fourcc.decode("latin-1"))
+        if entry is None:
+            entry = self.boxes[fourcc.decode("latin-1")] = [0, 0, {}]
+        entry[0] += 1
+        entry[1] += size
+        entry[2][depth] = entry[2].get(depth, 0) + 1
+
+    def merge(self, other: "Histogram") -> None:
+        self.files += other.files
+        self.bytes += other.bytes
+        self.errors.extend(other.errors)
+        for fourcc, (count, size, depths) in other.boxes.items():
+            entry = self.boxes.setdefault(fourcc, [0, 0, {}])
+            entry[0] += count
+            entry[1] += size
+            for depth, value in depths.items():
+                entry[2][depth] = entry[2].get(depth, 0) + value
+
+
+def _walk(
+    read: Reader,
+    start: int,
+    end: int,
+    depth: int,
+    parent: Optional[bytes],
+    parent_version: int,
+    histogram: Histogram,
+    path: Path,
+    in_memory: bool,
+) -> None:
+    offset = start
+    while offset + HEADER.size <= end:
+        header = read(offset, 16)
+        if len(header) < HEADER.size:
+            histogram.errors.append(f"{path}:{offset}: truncated box header")
+            return
+        size, fourcc = HEADER.unpack_from(header)
+        header_size = HEADER.size
+        if size == 1:
+            if len(header) < 16:
+                histogram.errors.append(f"{path}:{offset}: truncated large size")
+                return
+            (size,) = LARGE_SIZE.unpack_from(header, 8)
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if fourcc == b"uuid":
+            header_size += 16
+        if size < header_size or offset + size > end:
+            histogram.errors.append(
+                f"{path}:{offset}: box {fourcc.decode('latin-1')!r} size {size} "
+                f"exceeds its parent"
+            )
+            return
+        histogram.add(fourcc, size, depth)
+
+        payload = offset + header_size
+        skip = (
+            _children_offset(fourcc, parent, parent_version, read, payload)
+            if depth < MAX_DEPTH
+            else None
+        )
+        if skip is not None and payload + skip < offset + size:
+            child_start, child_end = payload + skip, offset + size
+            version = read(payload, 1) if fourcc == b"stsd" else b""
+            child_version = version[0] if version else 0
+            if not in_memory and child_end - child_start <= IN_MEMORY_LIMIT:
+                data = read(child_start, child_end - child_start)
+                base = child_start
+                view = memoryview(data)
+
+                def memory_read(position: int, length: int) -> bytes:
+                    return bytes(view[position - base : position - base + length])
+
+                _walk(memory_read, child_start, child_start + len(data), depth + 1, fourcc,
+                      child_version, histogram, path, True)
+            else:
+                _walk(read, child_start, child_end, depth + 1, fourcc, child_version, histogram,
+                      path, in_memory)
+        offset += size
+    if offset < end:
+        histogram.errors.append(f"{path}:{offset}: {end - offset} trailing byte(s)")
+
+
+def scan_file(path: Path) -> Histogram:
+    """Return the box histogram of one file."""
+
+    histogram = Histogram()
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError as exc:
+        histogram.errors.append(f"{path}: {exc.strerror}")
+        return histogram
+    try:
+        file_size = os.fstat(fd).st_size
+        histogram.files = 1
+        histogram.bytes = file_size
+
+        def file_read(position: int, length: int) -> bytes:
+            return os.pread(fd, length, position)
+
+        _walk(file_read, 0, file_size, 0, None, 0, histogram, path, False)
+    finally:
+        os.close(fd)
+    return histogram
+
+
+def scan_corpus(files: list[Path], jobs: Optional[int] = None) -> Histogram:
+    """Scan ``files`` on ``jobs`` worker processes and merge the histograms."""
+
+    total = Histogram()
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < 2:
+        for path in files:
+            total.merge(scan_file(path))
+        return total
+    chunksize = max(1, min(64, len(files) // (jobs * 8)))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+        for histogram in executor.map(scan_file, files, chunksize=chunksize):
+            total.merge(histogram)
+    return total
+
+
+def load_catalog_names(catalog: Path) -> dict[str, str]:
+    data = json.loads(catalog.read_text(encoding="utf-8"))
+    return {
+        entry["type"]: entry.get("name") or ""
+        for entry in data.get("boxes", [])
+        if isinstance(entry, dict) and isinstance(entry.get("type"), str)
+    }
+
+
+def histogram_rows(histogram: Histogram, names: dict[str, str]) -> list[dict]:
+    """Return one row per FourCC, most frequent first, joined with catalog names."""
+
+    rows = []
+    for fourcc, (count, size, depths) in histogram.boxes.items():
+        rows.append(
+            {
+                "fourcc": fourcc,
+                "count": count,
+                "bytes": size,
+                "depths": {str(depth): depths[depth] for depth in sorted(depths)},
+                "in_catalog": fourcc in names,
+                "name": names.get(fourcc),
+            }
+        )
+    rows.sort(key=lambda row: (-row["count"], row["fourcc"]))
+    return rows
+
+
+def render_json(histogram: Histogram, rows: list[dict]) -> str:
+    summary = {
+        "files": histogram.files,
+        "bytes": histogram.bytes,
+        "boxes": sum(row["count"] for row in rows),
+        "errors": histogram.errors,
+    }
+    return json.dumps({"summary": summary, "boxes": rows}, indent=2, ensure_ascii=False) + "\n"
+
+
+def render_csv(rows: list[dict]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["fourcc", "count", "bytes", "max_depth", "depths", "in_catalog", "name"])
+    for row in rows:
+        writer.writerow(
+            [
+                row["fourcc"],
+                row["count"],
+                row["bytes"],
+                max(int(depth) for depth in row["depths"]),
+                ";".join(f"{depth}:{count}" for depth, count in row["depths"].items()),
+                "yes" if row["in_catalog"] else "no",
+                row["name"] or "",
+            ]
+        )
+    return buffer.getvalue()
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", type=Path, help="Media files or directories to scan.")
+    parser.add_argument("--catalog", type=Path, default=DEFAULT_CATALOG)
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Write to a file.")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None, help="Worker process count (default: CPU count)."
+    )
+    parser.add_argument(
+        "--suffix",
+        action="append",
+        default=None,
+        help="File suffix to scan in directories (repeatable; default: common MP4/MOV suffixes).",
+    )
+    args = parser.parse_args(argv)
+
+    suffixes = {suffix.lower() for suffix in args.suffix} if args.suffix else MEDIA_SUFFIXES
+    files = list(iter_media_files(args.paths, suffixes))
+    histogram = scan_corpus(files, args.jobs)
+    names = load_catalog_names(args.catalog) if args.catalog.exists() else {}
+    rows = histogram_rows(histogram, names)
+    output = render_json(histogram, rows) if args.format == "json" else render_csv(rows)
+
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output, encoding="utf-8")
+    print(
+        f"Scanned {histogram.files} file(s), {sum(row['count'] for row in rows)} boxes, "
+        f"{len(histogram.errors)} error(s).",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,110 @@
+import base64
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "audit_fixtures.py"
+spec = importlib.util.spec_from_file_location("scripts.audit_fixtures", MODULE_PATH)
+audit_fixtures = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = audit_fixtures
+spec.loader.exec_module(audit_fixtures)
+
+
+class DecodeBase64StreamTests(unittest.TestCase):
+    def test_chunk_boundaries_do_not_affect_result(self) -> None:
+        data = bytes(range(256)) * 5
+        encoded = base64.encodebytes(data)
+
+        whole = audit_fixtures.decode_base64_stream([encoded])
+        split = audit_fixtures.decode_base64_stream(
+            [encoded[index : index + 7] for index in range(0, len(encoded), 7)]
+        )
+
+        self.assertIsNone(whole.error)
+        self.assertEqual(whole.byte_size, len(data))
+        self.assertEqual(whole, split)
+
+    def test_invalid_characters_are_reported(self) -> None:
+        result = audit_fixtures.decode_base64_stream([b"AAA*"])
+
+        self.assertIsNotNone(result.error)
+
+
+class AuditTests(unittest.TestCase):
+    def make_tree(self, root: Path, *, snapshot_size: int) -> dict:
+        fixtures = root / "Fixtures"
+        (fixtures / "Media").mkdir(parents=True)
+        (fixtures / "Snapshots").mkdir()
+        corrupt = root / "Corrupt"
+        corrupt.mkdir()
+
+        payload = b"\x00\x00\x00\x08free"
+        (fixtures / "Media" / "sample.txt").write_text(
+            base64.b64encode(payload).decode("ascii"), encoding="utf-8"
+        )
+        catalog = {
+            "fixtures": [
+                {
+                    "id": "sample",
+                    "resource": {"name": "sample", "extension": "txt", "subdirectory": "Media"},
+                }
+            ]
+        }
+        (fixtures / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+        (fixtures / "Snapshots" / "sample.json").write_text(
+            json.dumps({"format": {"byte_size": snapshot_size}}), encoding="utf-8"
+        )
+        corrupt_catalog = root / "corrupt-fixtures.json"
+        corrupt_catalog.write_text(json.dumps({"fixtures": []}), encoding="utf-8")
+        return {
+            "catalog_path": fixtures / "catalog.json",
+            "snapshots_root": fixtures / "Snapshots",
+            "corrupt_root": corrupt,
+            "corrupt_catalog_path": corrupt_catalog,
+            "cache_path": root / "cache.json",
+        }
+
+    def test_consistent_tree_passes(self) -> None:
+        with TemporaryDirectory() as tmp:
+            paths = self.make_tree(Path(tmp), snapshot_size=8)
+
+            report = audit_fixtures.audit(**paths)
+
+        self.assertTrue(report.ok, report.errors)
+
+    def test_snapshot_byte_size_drift_is_reported(self) -> None:
+        with TemporaryDirectory() as tmp:
+            paths = self.make_tree(Path(tmp), snapshot_size=9)
+
+            report = audit_fixtures.audit(**paths)
+
+        self.assertFalse(report.ok)
+        self.assertIn("format.byte_size is 9", report.errors[0])
+
+    def test_missing_catalog_resource_is_reported(self) -> None:
+        with TemporaryDirectory() as tmp:
+            paths = self.make_tree(Path(tmp), snapshot_size=8)
+            (paths["catalog_path"].parent / "Media" / "sample.txt").unlink()
+
+            report = audit_fixtures.audit(**paths)
+
+        self.assertTrue(any("resource for 'sample' missing" in e for e in report.errors))
+
+    def test_cached_results_are_reused(self) -> None:
+        with TemporaryDirectory() as tmp:
+            paths = self.make_tree(Path(tmp), snapshot_size=8)
+            audit_fixtures.audit(**paths)
+
+            cache = audit_fixtures.PayloadCache(paths["cache_path"])
+            media = paths["catalog_path"].parent / "Media" / "sample.txt"
+            cached = cache.lookup_stat(media, media.stat())
+
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.byte_size, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
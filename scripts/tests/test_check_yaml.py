@@ -0,0 +1,79 @@
+import importlib.util
+import multiprocessing
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "check_yaml.py"
+sys.path.insert(0, str(MODULE_PATH.parent))
+
+try:
+    import yaml  # noqa: F401
+except ImportError:  # pragma: no cover - PyYAML is optional for the script tests
+    check_yaml = None
+else:
+    spec = importlib.util.spec_from_file_location("check_yaml", MODULE_PATH)
+    check_yaml = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = check_yaml
+    spec.loader.exec_module(check_yaml)
+
+
+@unittest.skipIf(check_yaml is None, "PyYAML is not installed")
+class ValidateYamlTests(unittest.TestCase):
+    def validate(self, text: str) -> list[str]:
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sample.yaml"
+            path.write_text(text, encoding="utf-8")
+            return check_yaml._validate_yaml(path)
+
+    def test_every_document_is_loaded(self) -> None:
+        self.assertEqual(self.validate("a: 1\n---\nb: 2\n"), [])
+        issues = self.validate("a: 1\n---\nb: c: d\n")
+        self.assertEqual(len(issues), 1)
+        self.assertIn("line 3", issues[0])
+
+    def test_unknown_tags_are_accepted(self) -> None:
+        text = "scalar: !Ref Name\nmapping: !Sub {a: 1}\nsequence: !GetAZs [x, y]\n"
+        self.assertEqual(self.validate(text), [])
+
+    def test_errors_keep_source_excerpt(self) -> None:
+        issues = self.validate("key: value\n  bad: indent\n")
+        self.assertEqual(len(issues), 1)
+        self.assertIn("bad: indent", issues[0])
+
+    def test_empty_document_is_reported(self) -> None:
+        self.assertEqual(self.validate("\n\n"), ["Empty YAML document"])
+
+
+@unittest.skipIf(check_yaml is None, "PyYAML is not installed")
+class ValidatePathsTests(unittest.TestCase):
+    def write_files(self, root: Path) -> list[Path]:
+        files = []
+        for index in range(6):
+            path = root / f"f{index}.yaml"
+            path.write_text("a: [\n" if index % 2 else f"a: {index}\n", encoding="utf-8")
+            files.append(path)
+        return files
+
+    def test_issues_follow_input_order(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            files = self.write_files(Path(tmpdir))
+            errors = check_yaml.validate_paths(files, jobs=1)
+
+        self.assertEqual([path for path, _ in errors], [files[1], files[3], files[5]])
+
+    @unittest.skipUnless(
+        multiprocessing.get_start_method() == "fork", "worker processes need fork"
+    )
+    def test_parallel_results_match_serial_results(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            files = self.write_files(Path(tmpdir))
+            serial = check_yaml.validate_paths(files, jobs=1)
+            parallel = check_yaml.validate_paths(files, jobs=3)
+
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import multiprocessing
+import sys
+import unittest
+from unittest import mock
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "collect_todos.py"
+sys.path.insert(0, str(MODULE_PATH.parent))
+spec = importlib.util.spec_from_file_location("collect_todos", MODULE_PATH)
+collect_todos = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = collect_todos
+spec.loader.exec_module(collect_todos)
+
+
+class CollectTodosTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.root = Path(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name: str, text: str) -> None:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def collect(self, jobs: int) -> list:
+        collector = collect_todos.TodoCollector(root_dir=str(self.root), jobs=jobs)
+        return collector.collect_all_todos()
+
+    def test_excluded_directories_are_not_entered(self) -> None:
+        self.write("Sources/App.swift", "// @todo #1 Keep me\n")
+        self.write(".build/debug/Generated.swift", "// @todo #2 Build product\n")
+        self.write("Sources/node_modules/pkg/index.h", "// @todo #3 Vendored\n")
+        self.write("Sources/notes.bin", "@todo #4 Wrong extension\n")
+        collector = collect_todos.TodoCollector(root_dir=str(self.root), jobs=1)
+
+        self.assertEqual(
+            [self.root / "Sources" / "App.swift"], collector.iter_candidate_files()
+        )
+
+    def test_items_are_ordered_by_path_and_line(self) -> None:
+        self.write("b.py", "# @todo second file\n")
+        self.write("a/z.swift", "// @todo #7 First\n//   continued\nlet x = 1\n// @todo #8 Second\n")
+        self.write("a.md", "@todo top level\n")
+        todos = self.collect(jobs=1)
+
+        self.assertEqual(
+            ["a/z.swift:1", "a/z.swift:4", "a.md:1", "b.py:1"],
+            [todo.location for todo in todos],
+        )
+        self.assertEqual(["First", "  continued"], todos[0].full_comment)
+
+    def test_extraction_decodes_only_lines_with_hits(self) -> None:
+        path = self.root / "mixed.swift"
+        path.write_bytes(
+            b"\xff\xfe binary noise\r\n"
+            b"let a = 1\r\n"
+            b"// @TODO #A7 Upper case marker\r\n"
+            b"//   more context\r\n"
+            b"\r\n"
+            b"// @todo\r\n"
+            b"let b = 2 // @todo #9 caf\xc3\xa9 trailing"
+        )
+        (self.root / "empty.swift").write_bytes(b"")
+        collector = collect_todos.TodoCollector(root_dir=str(self.root), jobs=1)
+        todos = collector.extract_todos_from_file(path)
+
+        self.assertEqual([3, 7], [todo.line_number for todo in todos])
+        self.assertEqual(["A7", "9"], [todo.task_id for todo in todos])
+        self.assertEqual(["Upper case marker", "  more context", "@todo"], todos[0].full_comment)
+        self.assertEqual("café trailing", todos[1].description)
+        self.assertEqual([], collector.extract_todos_from_file(self.root / "empty.swift"))
+
+    def test_index_reextracts_only_changed_files(self) -> None:
+        self.write("a.swift", "// @todo #1 Alpha\n")
+        self.write("b.swift", "// @todo #2 Beta\n")
+        self.write("c.swift", "// @todo #3 Gamma\n")
+        index_path = self.root / "out" / ".report.md.index.json"
+        collector_class = collect_todos.TodoCollector
+        extract = collector_class._extract_todos_from_bytes
+
+        def collect() -> tuple:
+            calls = []
+
+            def counting(collector, data, file_path):
+                calls.append(file_path.name)
+                return extract(collector, data, file_path)
+
+            with mock.patch.object(collector_class, "_extract_todos_from_bytes", counting):
+                todos = collector_class(str(self.root), jobs=1, index_path=index_path).collect_all_todos()
+            return [todo.location for todo in todos], sorted(calls)
+
+        with mock.patch.object(collect_todos.TodoIndex, "RACY_WINDOW_NS", -10**18):
+            self.assertEqual((["a.swift:1", "b.swift:1", "c.swift:1"], ["a.swift", "b.swift", "c.swift"]), collect())
+            self.assertEqual((["a.swift:1", "b.swift:1", "c.swift:1"], []), collect())
+
+            self.write("b.swift", "let x = 1\n// @todo #2 Beta moved\n")
+            (self.root / "c.swift").unlink()
+            os.utime(self.root / "a.swift", ns=(1, 1))
+            self.assertEqual((["a.swift:1", "b.swift:2"], ["b.swift"]), collect())
+
+        entries = json.loads(index_path.read_text(encoding="utf-8"))["files"]
+        self.assertEqual(["a.swift", "b.swift"], sorted(entries))
+        self.assertEqual(1, entries["a.swift"]["mtime_ns"])
+
+    def test_recently_modified_files_are_rehashed(self) -> None:
+        self.write("a.swift", "// @todo #1 Alpha\n")
+        index_path = self.root / ".report.md.index.json"
+        collect_todos.TodoCollector(str(self.root), jobs=1, index_path=index_path).collect_all_todos()
+
+        entry = json.loads(index_path.read_text(encoding="utf-8"))["files"]["a.swift"]
+        self.assertIsNone(entry["mtime_ns"])
+        self.assertEqual(64, len(entry["hash"]))
+
+    def git(self, *args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+            cwd=self.root, check=True, capture_output=True,
+        )
+
+    @unittest.skipUnless(shutil.which("git"), "git is not installed")
+    def test_git_mode_scans_tracked_blobs_once_per_object(self) -> None:
+        self.git("init", "-q")
+        self.write("Sources/a.swift", "// @todo #1 Shared\n")
+        self.write("Vendor/copy.swift", "// @todo #1 Shared\n")
+        self.write("build/out.swift", "// @todo #2 Excluded directory\n")
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "first")
+        self.write("Sources/a.swift", "let a = 1\n// @todo #1 Shared\n")
+        self.write("Sources/b.swift", "// @todo #3 Staged\n")
+        self.git("add", "Sources")
+        self.write("untracked.swift", "// @todo #4 Untracked\n")
+
+        collector_class = collect_todos.TodoCollector
+        extract = collector_class._extract_todos_from_bytes
+        calls = []
+
+        def counting(collector, data, file_path):
+            calls.append(file_path.name)
+            return extract(collector, data, file_path)
+
+        with mock.patch.object(collector_class, "_extract_todos_from_bytes", counting):
+            staged = collector_class(str(self.root)).collect_git_todos()
+            committed = collector_class(str(self.root)).collect_git_todos("HEAD")
+
+        self.assertEqual(
+            ["Sources/a.swift:2", "Sources/b.swift:1", "Vendor/copy.swift:1"],
+            [todo.location for todo in staged],
+        )
+        self.assertEqual(
+            ["Sources/a.swift:1", "Vendor/copy.swift:1"], [todo.location for todo in committed]
+        )
+        self.assertEqual(["a.swift", "b.swift", "copy.swift", "a.swift"], calls)
+
+    @unittest.skipUnless(shutil.which("git"), "git is not installed")
+    def test_git_mode_reports_unknown_revisions(self) -> None:
+        self.git("init", "-q")
+        collector = collect_todos.TodoCollector(str(self.root))
+
+        with self.assertRaises(RuntimeError):
+            collector.collect_git_todos("no-such-revision")
+
+    @unittest.skipUnless(
+        multiprocessing.get_start_method() == "fork", "parallel collection test requires fork"
+    )
+    def test_parallel_collection_matches_serial_collection(self) -> None:
+        for index in range(12):
+            self.write(f"dir{index % 3}/file{index}.swift", f"// @todo #{index} Task {index}\n")
+
+        self.assertEqual(self.collect(jobs=1), self.collect(jobs=4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import importlib.util
+import io
+import json
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "compile_mp4ra_catalog.py"
+spec = importlib.util.spec_from_file_location("compile_mp4ra_catalog", MODULE_PATH)
+compile_mp4ra_catalog = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = compile_mp4ra_catalog
+spec.loader.exec_module(compile_mp4ra_catalog)
+
+CATALOG = {
+    "boxes": [
+        {"name": "Movie", "specification": "ISO", "summary": "Movie container", "type": "moov"},
+        {"name": "Free", "specification": "ISO", "summary": "Free space", "type": "free"},
+        {
+            "name": "PIFF Track Encryption",
+            "specification": "ISO",
+            "summary": "Protection – ü",
+            "type": "uuid",
+            "uuid": "8974DBCE-7BE7-4C51-84F9-7148F9882554",
+        },
+        {
+            "flags": "000001",
+            "name": "Track Header",
+            "summary": "Track",
+            "type": "tkhd",
+            "version": 1,
+        },
+        {"name": "Compressed Movie", "summary": "Compressed movie", "type": "!mov"},
+    ],
+    "metadata": {"recordCount": 5, "source": "https://mp4ra.org/api/boxes"},
+}
+
+
+class CompileCatalogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = json.dumps(CATALOG, indent=2).encode("utf-8")
+        self.table = compile_mp4ra_catalog.build_table(self.source)
+        self.compiled = compile_mp4ra_catalog.CompiledTable(self.table)
+
+    def test_table_round_trips_to_source(self) -> None:
+        self.assertEqual(compile_mp4ra_catalog.verify_table(self.table, self.source), [])
+        self.assertEqual(self.compiled.decompile(), CATALOG)
+
+    def test_records_are_sorted_and_strings_interned(self) -> None:
+        fourccs = [self.compiled.fourcc(index) for index in range(self.compiled.record_count)]
+        self.assertEqual(fourccs, sorted(fourccs))
+        self.assertEqual(self.table.count(b"\x00\x03ISO"), 1)
+        self.assertEqual(self.compiled.records_offset % 8, 0)
+        self.assertEqual(self.compiled.strings_offset % 8, 0)
+
+    def test_lookup_by_fourcc_and_uuid(self) -> None:
+        self.assertEqual(self.compiled.lookup("tkhd").entry(), CATALOG["boxes"][3])
+        self.assertEqual(self.compiled.lookup(b"!mov").entry(), CATALOG["boxes"][4])
+        self.assertIsNone(self.compiled.lookup("mdat"))
+        record = self.compiled.lookup_uuid("8974dbce-7be7-4c51-84f9-7148f9882554")
+        self.assertEqual(record.entry(), CATALOG["boxes"][2])
+        self.assertIsNone(self.compiled.lookup_uuid("00000000-0000-0000-0000-000000000000"))
+
+    def test_stale_and_corrupt_tables_are_reported(self) -> None:
+        changed = json.dumps({**CATALOG, "boxes": CATALOG["boxes"][:2]}).encode("utf-8")
+        self.assertEqual(
+            compile_mp4ra_catalog.verify_table(self.table, changed),
+            ["table is stale (source catalog changed)"],
+        )
+
+        corrupt = bytearray(self.table)
+        corrupt[-1] ^= 0xFF
+        self.assertEqual(
+            compile_mp4ra_catalog.verify_table(bytes(corrupt)), ["body checksum mismatch"]
+        )
+        with self.assertRaises(compile_mp4ra_catalog.TableFormatError):
+            compile_mp4ra_catalog.CompiledTable(bytes(compile_mp4ra_catalog.HEADER.size))
+
+    def test_unrepresentable_entries_are_rejected(self) -> None:
+        invalid = ({"type": "moov", "extra": 1}, {"type": "toolong"}, {"type": "moov", "name": 3})
+        for entry in invalid:
+            with self.assertRaises(ValueError):
+                compile_mp4ra_catalog.build_table(json.dumps({"boxes": [entry]}).encode("utf-8"))
+
+    def test_write_table_is_verified_by_main(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "MP4RABoxes.json"
+            source.write_bytes(self.source)
+            output = Path(tmpdir) / "out" / "MP4RABoxes.bin"
+            args = ["--source", str(source), "--output", str(output)]
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(compile_mp4ra_catalog.main(args), 0)
+                self.assertEqual(compile_mp4ra_catalog.main([*args, "--verify"]), 0)
+            self.assertEqual(output.read_bytes(), self.table)
+
+    def test_missing_source_is_reported(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "missing.json"
+            stderr = io.StringIO()
+            with redirect_stderr(stderr):
+                status = compile_mp4ra_catalog.main(
+                    ["--source", str(source), "--output", str(Path(tmpdir) / "out.bin")]
+                )
+            self.assertEqual(status, 1)
+            self.assertIn(f"error: {source}:", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
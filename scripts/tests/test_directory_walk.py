@@ -0,0 +1,52 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "directory_walk.py"
+spec = importlib.util.spec_from_file_location("directory_walk", MODULE_PATH)
+directory_walk = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = directory_walk
+spec.loader.exec_module(directory_walk)
+
+
+class IterFilesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.root = Path(self.directory.name)
+
+    def write(self, name: str) -> Path:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+        return path
+
+    def test_suffixes_match_and_pruned_directories_are_skipped(self) -> None:
+        kept = self.write("a/b/data.json")
+        upper = self.write("a/DATA.JSON")
+        self.write("a/notes.txt")
+        for pruned in (".git", "build", "Pods", "node_modules", "__pycache__"):
+            self.write(f"{pruned}/skip.json")
+
+        found = set(directory_walk.iter_files(self.root, {".json"}))
+        self.assertEqual({kept}, found)
+        found = set(directory_walk.iter_files(self.root, {".json"}, ignore_case=True))
+        self.assertEqual({kept, upper}, found)
+
+    def test_unlistable_directories_are_reported(self) -> None:
+        missing = self.root / "missing"
+        errors = []
+        found = list(
+            directory_walk.iter_files(
+                missing, {".json"}, on_error=lambda path, exc: errors.append(path)
+            )
+        )
+
+        self.assertEqual([], found)
+        self.assertEqual([str(missing)], errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "index_box_parsers.py"
+sys.path.insert(0, str(MODULE_PATH.parent))
+spec = importlib.util.spec_from_file_location("index_box_parsers", MODULE_PATH)
+index_box_parsers = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = index_box_parsers
+spec.loader.exec_module(index_box_parsers)
+
+REGISTRY = """
+extension BoxParserRegistry {
+    enum DefaultParsers {
+        static func registerAll(into registry: inout BoxParserRegistry) {
+            if let ftyp = try? FourCharCode("ftyp") {
+                registry.register(parser: fileType, for: ftyp)
+            }
+            if let keys = try? FourCharCode("keys") {
+                registry.register(parser: metadataKeys, for: keys)
+            }
+            registry.register(parser: DefaultParsers.trackRun, for: try! FourCharCode("trun"))
+        }
+    }
+}
+"""
+
+SAMPLE_ENTRIES = """
+extension BoxParserRegistry.DefaultParsers {
+    static let visualSampleEntryTypes: Set<FourCharCode> = {
+        let rawValues = [
+            "avc1", "hvc1",
+        ]
+        return Set(rawValues.compactMap { try? FourCharCode($0) })
+    }()
+
+    static func codec(format: FourCharCode, boxes: [BoxHeader]) {
+        let avcBox = boxes.first(where: { $0.type.rawValue == "avcC" })
+        if ["vp09", "vp08"].contains(format.rawValue) {}
+    }
+}
+"""
+
+DATA_REFERENCES = """
+extension BoxParserRegistry.DefaultParsers {
+    static func entry(type: FourCharCode, mode: String) {
+        switch type.rawValue {
+        case "url ":
+            switch mode {
+            case "abcd": break
+            default: break
+            }
+        case "urn ", "alis":
+            let label = "}"
+        default:
+            break
+        }
+    }
+}
+"""
+
+CONTAINERS = """
+public enum FourCharContainerCode: String, CaseIterable {
+    /// `moov` — Movie box.
+    case moov = "moov"
+    case trak = "trak"
+}
+"""
+
+
+class IndexBoxParsersTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.root = Path(self.tmpdir.name)
+        self.sources = self.root / "ISO"
+        self.sources.mkdir()
+        (self.sources / "BoxParserRegistry+DefaultParsers.swift").write_text(REGISTRY)
+        (self.sources / "BoxParserRegistry+SampleDescription.swift").write_text(SAMPLE_ENTRIES)
+        (self.sources / "FourCharContainerCode.swift").write_text(CONTAINERS)
+        (self.sources / "BoxParserRegistry+HandlerAndData.swift").write_text(DATA_REFERENCES)
+        self.catalog = self.root / "MP4RABoxes.json"
+        boxes = [
+            {"type": code, "name": code.upper()}
+            for code in ("ftyp", "trun", "avc1", "avcC", "moov", "trak", "sgpd", "emsg")
+        ]
+        self.catalog.write_text(json.dumps({"boxes": boxes}))
+
+    def rows(self, cache=None) -> dict[str, dict]:
+        rows = index_box_parsers.build_index(self.sources, self.catalog, cache, self.root)
+        return {row["fourcc"]: row for row in rows}
+
+    def test_registered_literals_are_found(self) -> None:
+        index = index_box_parsers.scan_sources(self.sources, self.root)
+
+        self.assertEqual(set(index["registered"]), {"ftyp", "keys", "trun"})
+        self.assertEqual(index["registered"]["trun"]["parser"], "trackRun")
+        self.assertEqual(
+            index["registered"]["ftyp"]["location"], "ISO/BoxParserRegistry+DefaultParsers.swift:6"
+        )
+        self.assertEqual(
+            set(index["inline"]), {"avc1", "hvc1", "avcC", "vp09", "vp08", "url ", "urn ", "alis"}
+        )
+        self.assertEqual(
+            index["inline"]["urn "], ["ISO/BoxParserRegistry+HandlerAndData.swift:10"]
+        )
+        self.assertEqual(set(index["container"]), {"moov", "trak"})
+
+    def test_rows_join_catalog_and_classify_codes(self) -> None:
+        rows = self.rows()
+
+        self.assertEqual(rows["ftyp"]["status"], "registered")
+        self.assertEqual(rows["avcC"]["status"], "inline")
+        self.assertEqual(rows["moov"]["status"], "container")
+        self.assertEqual(rows["sgpd"]["status"], "placeholder")
+        self.assertFalse(rows["keys"]["in_catalog"])
+        self.assertFalse(rows["hvc1"]["in_catalog"])
+
+    def test_report_ranks_frequent_codes_without_parser(self) -> None:
+        rows = list(self.rows().values())
+        report = index_box_parsers.build_report(
+            rows,
+            {"trun": 900, "sgpd": 500, "moov": 300, "avcC": 200, "emsg": 40, "prft": 20, "ftyp": 1},
+            top=6,
+        )
+
+        self.assertEqual(
+            [(row["fourcc"], row["status"]) for row in report["frequent_without_parser"]],
+            [("sgpd", "placeholder"), ("emsg", "placeholder"), ("prft", "placeholder")],
+        )
+        self.assertEqual(
+            [(row["fourcc"], row["status"]) for row in report["frequent_handled_indirectly"]],
+            [("moov", "container"), ("avcC", "inline")],
+        )
+        self.assertEqual([row["fourcc"] for row in report["registered_without_catalog"]], ["keys"])
+        self.assertEqual(report["counts"]["registered"], 3)
+
+    def test_frequencies_load_from_csv_and_json(self) -> None:
+        csv_path = self.root / "counts.csv"
+        csv_path.write_text("fourcc,count,bytes\nmdat,12,900\nmoov,3,40\n")
+        json_path = self.root / "counts.json"
+        json_path.write_text(json.dumps([{"fourcc": "mdat", "count": 12}]))
+        histogram_path = self.root / "histogram.json"
+        histogram_path.write_text(
+            json.dumps({"summary": {"files": 1}, "boxes": [{"fourcc": "moof", "count": 4}]})
+        )
+
+        self.assertEqual(index_box_parsers.load_frequencies(csv_path), {"mdat": 12, "moov": 3})
+        self.assertEqual(index_box_parsers.load_frequencies(json_path), {"mdat": 12})
+        self.assertEqual(index_box_parsers.load_frequencies(histogram_path), {"moof": 4})
+
+    def test_index_is_cached_until_a_source_changes(self) -> None:
+        open_cache = lambda: index_box_parsers.ResultCache.for_validator(  # noqa: E731
+            "index_box_parsers", [MODULE_PATH], cache_dir=self.root / "cache"
+        )
+        self.rows(open_cache())
+
+        original = index_box_parsers.scan_sources
+        calls = []
+        index_box_parsers.scan_sources = lambda *args: calls.append(args) or original(*args)
+        try:
+            self.rows(open_cache())
+            self.assertEqual(calls, [])
+            registry = self.sources / "BoxParserRegistry+DefaultParsers.swift"
+            registry.write_text(REGISTRY.replace('"keys"', '"sgpd"'))
+            rows = self.rows(open_cache())
+        finally:
+            index_box_parsers.scan_sources = original
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(rows["sgpd"]["status"], "registered")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import base64
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "pack_fixtures.py"
+sys.path.insert(0, str(MODULE_PATH.parent))
+spec = importlib.util.spec_from_file_location("scripts.pack_fixtures", MODULE_PATH)
+pack_fixtures = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = pack_fixtures
+spec.loader.exec_module(pack_fixtures)
+
+
+class PackFixturesTests(unittest.TestCase):
+    def make_sources(self, root: Path) -> dict[str, bytes]:
+        media = root / "Media"
+        corrupt = root / "Corrupt"
+        media.mkdir()
+        corrupt.mkdir()
+        payloads = {
+            "Media/sample": b"\x00\x00\x00\x08free",
+            "Media/large": bytes(range(256)) * 300,
+            "Corrupt/empty-file.mp4": b"",
+        }
+        (media / "sample.txt").write_text(
+            base64.b64encode(payloads["Media/sample"]).decode("ascii"), encoding="utf-8"
+        )
+        (media / "large.txt").write_text(
+            base64.b64encode(payloads["Media/large"]).decode("ascii"), encoding="utf-8"
+        )
+        (corrupt / "empty-file.mp4.base64").write_text("", encoding="ascii")
+        return payloads
+
+    def test_pack_round_trips_aligned_payloads(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            payloads = self.make_sources(root)
+            sources = pack_fixtures.collect_sources(root / "Media", root / "Corrupt")
+            output = root / "fixtures.pack"
+
+            entries = pack_fixtures.write_pack(sources, output, alignment=128)
+            data = output.read_bytes()
+            alignment, parsed = pack_fixtures.parse_pack(data)
+            errors = pack_fixtures.verify_pack(output, sources)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(alignment, 128)
+        self.assertEqual(parsed, entries)
+        self.assertEqual(
+            [entry.fixture_id for entry in parsed],
+            ["Corrupt/empty-file.mp4", "Media/large", "Media/sample"],
+        )
+        for entry in parsed:
+            self.assertEqual(entry.offset % 128, 0)
+            payload = data[entry.offset : entry.offset + entry.length]
+            self.assertEqual(payload, payloads[entry.fixture_id])
+
+    def test_corrupted_payload_is_reported(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.make_sources(root)
+            sources = pack_fixtures.collect_sources(root / "Media", root / "Corrupt")
+            output = root / "fixtures.pack"
+            entries = pack_fixtures.write_pack(sources, output)
+            large = next(entry for entry in entries if entry.fixture_id == "Media/large")
+            data = bytearray(output.read_bytes())
+            data[large.offset] ^= 0xFF
+            output.write_bytes(bytes(data))
+
+            errors = pack_fixtures.verify_pack(output)
+
+        self.assertEqual(errors, ["Media/large: SHA-256 mismatch"])
+
+    def test_stale_pack_is_reported(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.make_sources(root)
+            sources = pack_fixtures.collect_sources(root / "Media", root / "Corrupt")
+            output = root / "fixtures.pack"
+            pack_fixtures.write_pack(sources, output)
+            (root / "Media" / "sample.txt").write_text(
+                base64.b64encode(b"changed").decode("ascii"), encoding="utf-8"
+            )
+            (root / "Media" / "extra.txt").write_text("AAAA", encoding="utf-8")
+
+            errors = pack_fixtures.verify_pack(
+                output, pack_fixtures.collect_sources(root / "Media", root / "Corrupt")
+            )
+
+        self.assertIn("Media/extra: missing from pack", errors)
+        self.assertIn("Media/sample: pack is stale (source payload changed)", errors)
+
+    def test_bad_magic_is_rejected(self) -> None:
+        with self.assertRaises(pack_fixtures.PackFormatError):
+            pack_fixtures.parse_pack(bytes(pack_fixtures.HEADER.size))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import importlib.util
+import csv
+import json
+import multiprocessing
+import struct
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scan_box_histogram.py"
+sys.path.insert(0, str(MODULE_PATH.parent))
+spec = importlib.util.spec_from_file_location("scan_box_histogram", MODULE_PATH)
+scan_box_histogram = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = scan_box_histogram
+spec.loader.exec_module(scan_box_histogram)
+
+
+def box(fourcc: bytes, payload: bytes = b"") -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), fourcc) + payload
+
+
+def full_box(fourcc: bytes, payload: bytes = b"") -> bytes:
+    return box(fourcc, bytes(4) + payload)
+
+
+def movie() -> bytes:
+    sample_entry = box(b"avc1", bytes(78) + box(b"avcC", b"\x01\x64") + box(b"pasp", bytes(8)))
+    stsd = full_box(b"stsd", struct.pack(">I", 1) + sample_entry)
+    stbl = box(b"stbl", stsd + full_box(b"stts", bytes(4)))
+    minf = box(b"minf", full_box(b"vmhd", bytes(8)) + stbl)
+    trak = box(b"trak", full_box(b"tkhd", bytes(80)) + box(b"mdia", minf))
+    meta = full_box(b"meta", full_box(b"hdlr", bytes(20)) + box(b"ilst", box(b"\xa9nam", box(b"data", bytes(12)))))
+    moov = box(b"moov", full_box(b"mvhd", bytes(96)) + trak + box(b"udta", meta))
+    return box(b"ftyp", b"isom" + bytes(4)) + moov + box(b"mdat", bytes(1000))
+
+
+class ScanBoxHistogramTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.root = Path(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name: str, data: bytes) -> Path:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    def test_nested_boxes_are_counted_with_depth_and_size(self) -> None:
+        histogram = scan_box_histogram.scan_file(self.write("movie.mp4", movie()))
+
+        self.assertEqual([], histogram.errors)
+        self.assertEqual([1, 1008, {0: 1}], histogram.boxes["mdat"])
+        self.assertEqual({5: 1}, histogram.boxes["stsd"][2])
+        self.assertEqual({6: 1}, histogram.boxes["avc1"][2])
+        self.assertEqual({7: 1}, histogram.boxes["avcC"][2])
+        self.assertEqual({5: 1}, histogram.boxes["data"][2])
+        self.assertIn("\xa9nam", histogram.boxes)
+
+    def test_audio_entry_layout_follows_stsd_version(self) -> None:
+        def audio_track(stsd_version: int, entry_header: bytes) -> bytes:
+            entry = box(b"mp4a", entry_header + full_box(b"esds", bytes(8)))
+            stsd = box(b"stsd", bytes([stsd_version]) + bytes(3) + struct.pack(">I", 1) + entry)
+            return box(b"trak", box(b"mdia", box(b"minf", box(b"stbl", stsd))))
+
+        version_1 = bytes(8) + struct.pack(">H", 1) + bytes(18)
+        iso = audio_track(1, version_1)  # ISO AudioSampleEntryV1: 28 bytes
+        quicktime = audio_track(0, version_1 + bytes(16))  # SoundDescriptionV1: 44 bytes
+        path = self.write("audio.mp4", box(b"moov", iso + quicktime))
+        histogram = scan_box_histogram.scan_file(path)
+
+        self.assertEqual([], histogram.errors)
+        self.assertEqual([2, 40, {7: 2}], histogram.boxes["esds"])
+
+    def test_large_size_and_open_ended_boxes(self) -> None:
+        large = struct.pack(">I4sQ", 1, b"mdat", 24) + bytes(8)
+        open_ended = struct.pack(">I4s", 0, b"mdat") + bytes(100)
+        histogram = scan_box_histogram.scan_file(self.write("a.mp4", large + open_ended))
+
+        self.assertEqual([], histogram.errors)
+        self.assertEqual([2, 24 + 108, {0: 2}], histogram.boxes["mdat"])
+
+    def test_fragments_are_walked_past_the_in_memory_limit(self) -> None:
+        fragment = box(b"moof", full_box(b"mfhd", bytes(4)) + box(b"traf", full_box(b"tfhd", bytes(4))))
+        data = box(b"styp", b"msdh" + bytes(4)) + (fragment + box(b"mdat", bytes(64))) * 3
+        original = scan_box_histogram.IN_MEMORY_LIMIT
+        scan_box_histogram.IN_MEMORY_LIMIT = 0
+        try:
+            histogram = scan_box_histogram.scan_file(self.write("seg.m4s", data))
+        finally:
+            scan_box_histogram.IN_MEMORY_LIMIT = original
+
+        self.assertEqual([], histogram.errors)
+        self.assertEqual({2: 3}, histogram.boxes["tfhd"][2])
+        self.assertEqual(3, histogram.boxes["moof"][0])
+
+    def test_truncated_box_is_reported_and_scan_continues(self) -> None:
+        truncated = box(b"ftyp", bytes(8)) + struct.pack(">I4s", 500, b"moov") + bytes(10)
+        self.write("bad.mp4", truncated)
+        self.write("good.mov", movie())
+        files = list(scan_box_histogram.iter_media_files([self.root]))
+        histogram = scan_box_histogram.scan_corpus(files, jobs=1)
+
+        self.assertEqual(2, histogram.files)
+        self.assertEqual(1, len(histogram.errors))
+        self.assertIn("'moov' size 500", histogram.errors[0])
+        self.assertEqual(2, histogram.boxes["ftyp"][0])
+
+    def test_directory_walk_filters_suffixes_and_prunes(self) -> None:
+        self.write("b/clip.MP4", movie())
+        self.write("a/notes.txt", b"")
+        self.write(".git/objects/clip.mp4", movie())
+        files = list(scan_box_histogram.iter_media_files([self.root]))
+
+        self.assertEqual([self.root / "b" / "clip.MP4"], files)
+
+    @unittest.skipUnless(
+        multiprocessing.get_start_method() == "fork", "parallel scan test requires fork"
+    )
+    def test_parallel_scan_matches_serial_scan(self) -> None:
+        files = [self.write(f"clip{index}.mp4", movie()) for index in range(6)]
+        serial = scan_box_histogram.scan_corpus(files, jobs=1)
+        parallel = scan_box_histogram.scan_corpus(files, jobs=3)
+
+        self.assertEqual(serial.boxes, parallel.boxes)
+        self.assertEqual(6, parallel.files)
+
+    def test_outputs_join_catalog_and_feed_frequency_loader(self) -> None:
+        histogram = scan_box_histogram.scan_file(self.write("movie.mp4", movie()))
+        rows = scan_box_histogram.histogram_rows(histogram, {"moov": "Movie Box"})
+        by_code = {row["fourcc"]: row for row in rows}
+
+        self.assertEqual("Movie Box", by_code["moov"]["name"])
+        self.assertFalse(by_code["avcC"]["in_catalog"])
+
+        document = json.loads(scan_box_histogram.render_json(histogram, rows))
+        self.assertEqual(histogram.bytes, document["summary"]["bytes"])
+        records = list(csv.DictReader(scan_box_histogram.render_csv(rows).splitlines()))
+        self.assertEqual({"fourcc", "count"}, {"fourcc", "count"} & set(records[0]))
+        self.assertEqual("7", next(r for r in records if r["fourcc"] == "avcC")["max_depth"])
+
+
+if __name__ == "__main__":
+    unittest.main()
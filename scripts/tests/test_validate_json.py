@@ -1,13 +1,19 @@
 import importlib.util
 import io
+import json
+import multiprocessing
+import subprocess
+import sys
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 MODULE_PATH = Path(__file__).resolve().parents[1] / "validate_json.py"
-spec = importlib.util.spec_from_file_location("scripts.validate_json", MODULE_PATH)
+sys.path.insert(0, str(MODULE_PATH.parent))
+spec = importlib.util.spec_from_file_location("validate_json", MODULE_PATH)
 validate_json = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = validate_json
 spec.loader.exec_module(validate_json)
 
 
@@ -45,6 +51,62 @@ class ValidateColonSpacingTests(unittest.TestCase):
         self.assertIn("expected a single space after ':'", buffer.getvalue())
 
 
+class ScanJsonTests(unittest.TestCase):
+    def test_syntax_errors_report_exact_position(self) -> None:
+        cases = {
+            '{\n  "a": 1,\n  "b": [1, 2,]\n}\n': (3, 14, "Expecting value"),
+            '{\n  "a" 1\n}': (2, 7, "Expecting ':' delimiter"),
+            '[\n  "unterminated\n]': (2, 16, "Invalid control character at"),
+            '{"a": 1} x': (1, 10, "Extra data"),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                diagnostics = validate_json.scan_json(text)
+                self.assertEqual(
+                    [(d.line, d.column, d.message) for d in diagnostics if d.kind == "syntax"],
+                    [expected],
+                )
+
+    def test_string_errors_match_json_module(self) -> None:
+        cases = [
+            '["x',
+            '["x\\',
+            '{"a\\',
+            '["a\tb"]',
+            '["\\q"]',
+            '["\\u12"]',
+            '["\\u0041',
+            '["\\ud800\\u12"]',
+            '["\\ud800\\x"]',
+        ]
+        for text in cases:
+            with self.subTest(text=text):
+                with self.assertRaises(json.JSONDecodeError) as context:
+                    json.loads(text)
+                error = context.exception
+                diagnostics = validate_json.scan_json(text)
+                self.assertEqual(
+                    [(d.line, d.column, d.message) for d in diagnostics if d.kind == "syntax"],
+                    [(error.lineno, error.colno, error.msg)],
+                )
+
+    def test_formatting_issues_are_reported_in_one_pass(self) -> None:
+        text = '{\n   "a": 1,\n  "b" :2\n}\n'
+
+        diagnostics = validate_json.scan_json(text)
+
+        self.assertEqual(
+            [(d.kind, d.line, d.column) for d in diagnostics],
+            [("indentation", 2, 1), ("colon", 3, 7)],
+        )
+        self.assertIn("inconsistent spacing before ':'", diagnostics[1].message)
+
+    def test_nested_documents_and_constants_pass(self) -> None:
+        text = '{\n  "a": [{"b": [NaN, -1.5e3, "\\u00e9"]}, {}, []],\n  "c": null\n}\n'
+
+        self.assertEqual(validate_json.scan_json(text), [])
+
+
 class ValidateFileTests(unittest.TestCase):
     def test_boolean_array_file_passes_validation(self) -> None:
         text = "[\n  true,\n  false\n]\n"
@@ -61,5 +123,114 @@ class ValidateFileTests(unittest.TestCase):
         self.assertEqual(buffer.getvalue(), "")
 
 
+class DiscoveryTests(unittest.TestCase):
+    def make_tree(self, root: Path) -> None:
+        for relative in ("a/one.json", "a/two.jsonc", "b/three.json", "a/notes.txt"):
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("{}\n", encoding="utf-8")
+        for relative in ("node_modules/dep.json", "a/.build/out.json", "build/gen.json"):
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("{", encoding="utf-8")
+
+    def test_walk_prunes_build_directories(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self.make_tree(root)
+            files = validate_json.iter_json_files([root / "b", root, root / "a" / "one.json"], root)
+
+            self.assertEqual(
+                [path.relative_to(root).as_posix() for path in files],
+                ["a/one.json", "a/two.jsonc", "b/three.json"],
+            )
+
+    def test_git_listing_skips_ignored_files(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            self.make_tree(root)
+            (root / "out").mkdir()
+            (root / "out" / "report.json").write_text("{", encoding="utf-8")
+            (root / ".gitignore").write_text("out/\n", encoding="utf-8")
+            try:
+                subprocess.run(["git", "init", "-q", str(root)], check=True)
+            except (OSError, subprocess.CalledProcessError):
+                self.skipTest("git is unavailable")
+
+            files = validate_json._git_json_files([root], root)
+
+        self.assertIsNotNone(files)
+        names = sorted(path.relative_to(root).as_posix() for path in files)
+        self.assertNotIn("out/report.json", names)
+        self.assertIn("a/one.json", names)
+
+
+class ValidateFilesTests(unittest.TestCase):
+    def write_files(self, root: Path) -> list[Path]:
+        files = []
+        for index in range(6):
+            path = root / f"f{index}.json"
+            path.write_text('{"key":1}' if index % 2 else "{}\n", encoding="utf-8")
+            files.append(path)
+        return files
+
+    def run_validation(self, files: list[Path], jobs: int, cache=None) -> tuple[bool, str]:
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            result = validate_json.validate_files(files, jobs, cache)
+        return result, buffer.getvalue()
+
+    def test_output_follows_input_order(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            files = self.write_files(Path(tmpdir))
+            result, output = self.run_validation(files, 1)
+
+        self.assertFalse(result)
+        self.assertEqual(
+            [line.split(":")[0] for line in output.splitlines()],
+            [str(files[1]), str(files[3]), str(files[5])],
+        )
+
+    @unittest.skipUnless(
+        multiprocessing.get_start_method() == "fork", "worker processes need fork"
+    )
+    def test_parallel_output_matches_serial_output(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            files = self.write_files(Path(tmpdir))
+            serial = self.run_validation(files, 1)
+            parallel = self.run_validation(files, 3)
+
+        self.assertEqual(parallel, serial)
+
+    def test_cached_results_skip_unchanged_files(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            files = self.write_files(root)
+            cache_dir = root / "cache"
+            open_cache = lambda: validate_json.ResultCache.for_validator(  # noqa: E731
+                "validate_json", [MODULE_PATH], cache_dir=cache_dir
+            )
+            first = self.run_validation(files, 1, open_cache())
+
+            scanned = []
+            original = validate_json._diagnose
+
+            def spy(path: Path):
+                scanned.append(path)
+                return original(path)
+
+            files[1].write_text('{"key": 2}\n', encoding="utf-8")
+            validate_json._diagnose = spy
+            try:
+                result, output = self.run_validation(files, 1, open_cache())
+            finally:
+                validate_json._diagnose = original
+
+        self.assertEqual(scanned, [files[1]])
+        self.assertFalse(first[0])
+        self.assertFalse(result)
+        self.assertEqual(output, first[1].replace(first[1].splitlines()[0] + "\n", ""))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,124 @@
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "validate_mp4ra_minimal.py"
+sys.path.insert(0, str(MODULE_PATH.parent))
+spec = importlib.util.spec_from_file_location("validate_mp4ra_minimal", MODULE_PATH)
+validate_mp4ra_minimal = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = validate_mp4ra_minimal
+spec.loader.exec_module(validate_mp4ra_minimal)
+
+BOXES = [
+    {"name": "Movie", "specification": "ISO", "summary": "Movie container", "type": "moov"},
+    {"name": "Track", "specification": "ISO", "summary": "Track container", "type": "trak"},
+    {"name": "Free", "specification": "ISO", "summary": "Free space", "type": "free"},
+]
+
+
+class StreamingValidationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, name: str, content) -> Path:
+        path = self.root / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        elif isinstance(content, str):
+            path.write_text(content, encoding="utf-8")
+        else:
+            path.write_text(json.dumps(content, indent=2) + "\n", encoding="utf-8")
+        return path
+
+    def check(self, path: Path, chunk_size: int = 7) -> list[str]:
+        original = validate_mp4ra_minimal.CHUNK_SIZE
+        validate_mp4ra_minimal.CHUNK_SIZE = chunk_size
+        try:
+            return validate_mp4ra_minimal.check_catalog(path)[0]
+        finally:
+            validate_mp4ra_minimal.CHUNK_SIZE = original
+
+    def test_valid_catalog_passes_at_any_chunk_size(self) -> None:
+        path = self.write("catalog.json", {"boxes": BOXES, "metadata": {"recordCount": 3}})
+        for chunk_size in (1, 7, 1 << 16):
+            self.assertEqual(self.check(path, chunk_size), [])
+
+    def test_syntax_errors_match_json_module(self) -> None:
+        text = json.dumps({"boxes": BOXES}, indent=2).replace('"trak"', '"trak" "x"')
+        path = self.write("catalog.json", text)
+        with self.assertRaises(json.JSONDecodeError) as context:
+            json.loads(text)
+
+        self.assertEqual(self.check(path, 5), [f"JSON parse error: {context.exception}"])
+
+    def test_entry_and_layout_errors_are_reported(self) -> None:
+        boxes = BOXES + [{"type": "moov"}, {"type": "toolong", "version": "1"}, 7]
+        text = json.dumps({"boxes": boxes}, indent=2).replace('\n      "name"', '\n     "name"', 1)
+        path = self.write("catalog.json", text)
+
+        self.assertEqual(
+            self.check(path),
+            [
+                "Line 4: indentation must be in multiples of two spaces (found 5)",
+                "Duplicate type identifier detected: moov",
+                "[index: 4] type must be a FourCC (4 printable ASCII characters) or the literal 'uuid'",
+                "[index: 4] version must be an integer",
+                "[index: 5] Box entry must be an object",
+            ],
+        )
+
+    def test_malformed_file_reports_layout_but_not_entries(self) -> None:
+        boxes = [{"type": "toolong"}] + BOXES
+        lines = json.dumps({"boxes": boxes}, indent=2).split("\n")
+        lines[6] = lines[6] + " ]"  # syntax error near the top
+        lines[-4] = " " + lines[-4]  # odd indentation after the error
+        path = self.write("catalog.json", "\n".join(lines) + "\n")
+        with self.assertRaises(json.JSONDecodeError) as context:
+            json.loads(path.read_text(encoding="utf-8"))
+
+        for chunk_size in (1, 7, 4096, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    self.check(path, chunk_size),
+                    [
+                        f"Line {len(lines) - 3}: indentation must be in multiples of two spaces"
+                        " (found 7)",
+                        f"JSON parse error: {context.exception}",
+                    ],
+                )
+
+    def test_encoding_error_after_syntax_error_wins(self) -> None:
+        path = self.write("catalog.json", b'{"boxes": [}\n\t"\xff"')
+
+        self.assertEqual(
+            self.check(path, 4), ["File is not valid UTF-8: invalid start byte at byte 15"]
+        )
+
+    def test_encoding_problems_are_reported(self) -> None:
+        bom = self.write("bom.json", b"\xef\xbb\xbf" + json.dumps({"boxes": []}).encode())
+        self.assertEqual(self.check(bom), ["File must not contain a UTF-8 BOM"])
+
+        invalid = self.write("invalid.json", b'{"boxes": ["\xff"]}')
+        self.assertEqual(self.check(invalid), ["File is not valid UTF-8: invalid start byte at byte 12"])
+
+    def test_against_reports_and_validates_only_changed_boxes(self) -> None:
+        old = self.write("old.json", {"boxes": [*BOXES, {"type": "skip"}]})
+        changed = [dict(BOXES[0], summary="Movie box"), BOXES[1], {"type": "mdat", "name": ""}]
+        new = self.write("new.json", {"boxes": [*changed, {"type": "skip"}]})
+
+        baseline = validate_mp4ra_minimal.load_box_index(old)
+        errors, changes = validate_mp4ra_minimal.check_catalog(new, baseline)
+
+        self.assertEqual(changes.added, ["mdat"])
+        self.assertEqual(changes.removed, ["free"])
+        self.assertEqual(changes.modified, [("moov", ["summary"])])
+        self.assertEqual(errors, ["[index: 2] name must be a non-empty string when present"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import hashlib
+import importlib.util
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "validation_cache.py"
+spec = importlib.util.spec_from_file_location("validation_cache", MODULE_PATH)
+validation_cache = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = validation_cache
+spec.loader.exec_module(validation_cache)
+
+
+def git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(root), *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+class BlobIdTests(unittest.TestCase):
+    def test_blob_id_matches_git(self) -> None:
+        data = b'{"key": 1}\n'
+        expected = hashlib.sha1(b"blob 11\0" + data).hexdigest()
+        self.assertEqual(validation_cache.blob_id(data), expected)
+
+    def test_tracked_modified_and_untracked_files(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            try:
+                git(root, "init", "-q")
+            except (OSError, subprocess.CalledProcessError):
+                self.skipTest("git is not available")
+            clean, modified, untracked = root / "a.json", root / "b.json", root / "c.json"
+            clean.write_text("{}\n", encoding="utf-8")
+            modified.write_text("[]\n", encoding="utf-8")
+            git(root, "add", "a.json", "b.json")
+            modified.write_text("[1]\n", encoding="utf-8")
+            untracked.write_text("null\n", encoding="utf-8")
+
+            ids = validation_cache.blob_ids([clean, modified, untracked, root / "gone"], root)
+
+            self.assertEqual(ids[clean], git(root, "rev-parse", ":a.json"))
+            self.assertEqual(ids[modified], git(root, "hash-object", "b.json"))
+            self.assertEqual(ids[untracked], git(root, "hash-object", "c.json"))
+            self.assertNotIn(root / "gone", ids)
+
+
+class ResultCacheTests(unittest.TestCase):
+    def test_results_persist_per_namespace(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            source = cache_dir / "validator.py"
+            source.write_text("VERSION = 1\n", encoding="utf-8")
+            open_cache = lambda config=None: validation_cache.ResultCache.for_validator(  # noqa: E731
+                "demo", [source], config=config, cache_dir=cache_dir
+            )
+
+            cache = open_cache()
+            cache.store("abc", ["problem"])
+            cache.save()
+
+            self.assertEqual(open_cache().lookup("abc"), ["problem"])
+            self.assertIsNone(open_cache({"strict": True}).lookup("abc"))
+            source.write_text("VERSION = 2\n", encoding="utf-8")
+            self.assertIsNone(open_cache().lookup("abc"))
+
+    def test_save_evicts_entries_unused_in_the_run(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "demo.json"
+            cache = validation_cache.ResultCache(path, "ns")
+            cache.store("old", [])
+            cache.store("kept", ["problem"])
+            cache.save()
+
+            cache = validation_cache.ResultCache(path, "ns")
+            self.assertEqual(cache.lookup("kept"), ["problem"])
+            cache.store("new", [])
+            cache.save()
+
+            cache = validation_cache.ResultCache(path, "ns")
+            self.assertEqual(set(cache.results), {"kept", "new"})
+            self.assertEqual(cache.lookup("kept"), ["problem"])
+            cache.save()
+
+            self.assertEqual(set(validation_cache.ResultCache(path, "ns").results), {"kept"})
+
+    def test_corrupt_or_disabled_cache_never_hits(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "demo.json"
+            path.write_text("not json", encoding="utf-8")
+            self.assertIsNone(validation_cache.ResultCache(path, "ns").lookup("abc"))
+
+            disabled = validation_cache.ResultCache.disabled()
+            disabled.store("abc", [])
+            disabled.save()
+            self.assertIsNone(disabled.lookup("abc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,104 +8,447 @@ repository. Instead of reformatting the files, the script checks that:
 * Each file can be parsed as JSON.
 * Indentation is done with two-space multiples (no tabs).
 * Spacing around object key colons is consistent within the file.
+
+All three checks run in a single pass of a streaming tokenizer that reports
+exact line and column positions and never builds the decoded object tree.
+Results are cached per git blob id (see ``validation_cache.py``), so only
+files that changed since the previous run are scanned again.
 """
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from directory_walk import iter_files
+from validation_cache import ResultCache, blob_ids
 
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
-def iter_json_files(paths: Iterable[Path]) -> Iterable[Path]:
-    for path in paths:
-        if path.is_file() and path.suffix in {".json", ".jsonc"}:
-            yield path
-        elif path.is_dir():
-            for candidate in path.rglob("*.json"):
-                yield candidate
-            for candidate in path.rglob("*.jsonc"):
-                yield candidate
+JSON_SUFFIXES = {".json", ".jsonc"}
 
 
-def validate_file(path: Path) -> bool:
-    text = path.read_text(encoding="utf-8")
-    try:
-        json.loads(text)
-    except json.JSONDecodeError as exc:  # pragma: no cover - executed in CI
-        print(f"{path}: JSON parsing failed: {exc}")
-        return False
-
-    indentation_ok = _validate_indentation(path, text)
-    colon_style_ok = _validate_colon_spacing(path, text)
-    return indentation_ok and colon_style_ok
+def _git_json_files(directories: list[Path], root: Path) -> Optional[list[Path]]:
+    """Return tracked and unignored JSON files under ``directories`` via git.
 
+    Returns ``None`` when git is unavailable or a directory lies outside the
+    work tree, so the caller can fall back to walking the file system.
+    """
 
-def _validate_indentation(path: Path, text: str) -> bool:
-    success = True
-    for line_no, line in enumerate(text.splitlines(), 1):
-        stripped = line.lstrip(" 	")
-        leading = line[: len(line) - len(stripped)]
+    try:
+        pathspecs = [str(directory.resolve().relative_to(root)) for directory in directories]
+    except ValueError:
+        return None
+    command = ["git", "-C", str(root), "ls-files", "-z", "--cached", "--others"]
+    command += ["--exclude-standard", "--", *pathspecs]
+    try:
+        result = subprocess.run(command, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    files = []
+    for name in result.stdout.decode("utf-8", "surrogateescape").split("\0"):
+        if os.path.splitext(name)[1] in JSON_SUFFIXES:
+            path = root / name
+            if path.is_file():  # skip tracked files deleted from the work tree
+                files.append(path)
+    return files
+
+
+def iter_json_files(paths: Iterable[Path], root: Path = ROOT) -> list[Path]:
+    """Return the JSON files named by ``paths``, sorted and de-duplicated.
+
+    Files are taken as given. Directories are listed with one ``git ls-files``
+    call, which skips ignored build output, or walked with ``os.scandir`` when
+    git cannot answer.
+    """
+
+    files: set[Path] = set()
+    directories = []
+    for path in paths:
+        if path.is_file() and path.suffix in JSON_SUFFIXES:
+            files.add(path)
+        elif path.is_dir():
+            directories.append(path)
+    if directories:
+        listed = _git_json_files(directories, root)
+        if listed is None:
+            listed = [
+                file for directory in directories for file in iter_files(directory, JSON_SUFFIXES)
+            ]
+        files.update(listed)
+    return sorted(files)
+
+
+class Diagnostic(NamedTuple):
+    """A formatting or syntax problem at a 1-based line and column."""
+
+    kind: str  # "syntax", "indentation" or "colon"
+    line: int
+    column: int
+    message: str
+
+
+class _SyntaxError(Exception):
+    def __init__(self, diagnostic: Diagnostic) -> None:
+        super().__init__(diagnostic.message)
+        self.diagnostic = diagnostic
+
+
+_WS = r"[ \t\n\r]*"
+_STRING = r'"(?:[^"\\\x00-\x1f]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*"'
+_NUMBER = r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?"
+# ``json.loads`` accepts NaN and Infinity, so the scanner does too.
+_CONSTANT = r"true|false|null|NaN|-?Infinity"
+
+WHITESPACE = re.compile(_WS)
+STRING = re.compile(_STRING)
+NUMBER = re.compile(_NUMBER)
+CONSTANT = re.compile(_CONSTANT)
+# Each token pattern consumes the whitespace in front of it as group 1.
+VALUE_TOKEN = re.compile(rf"({_WS})(?:([{{\[])|(\])|{_STRING}|{_NUMBER}|{_CONSTANT})")
+KEY_TOKEN = re.compile(rf"({_WS})(?:(\}})|{_STRING}({_WS}):({_WS}))")
+SEPARATOR_TOKEN = re.compile(rf"({_WS})([,\]}}])")
+CLOSERS = {"{": "}", "[": "]"}
+
+
+class _Scanner:
+    """Single-pass JSON tokenizer that records formatting diagnostics.
+
+    Tokens are matched in place and discarded, so no Python object tree is
+    built. Indentation is checked whenever a token starts a line, and the
+    whitespace around each object key's colon is compared against the first
+    key in the file. The token patterns only cover valid input; on a failed
+    match the slower per-character helpers work out the exact error.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+        self.line = 1
+        self.line_start = 0
+        self.diagnostics: list[Diagnostic] = []
+        self.colon_style: tuple[str, str, int, int] | None = None
+        self.colon_failed = False
+
+    def run(self) -> None:
+        text = self.text
+        if text.startswith("\ufeff"):
+            self.fail("Unexpected UTF-8 BOM")
+        stack: list[str] = []
+        pos = 0
+        expect_value = True
+        after_open = False  # an empty array may close right after "["
+        while True:
+            if expect_value:
+                match = VALUE_TOKEN.match(text, pos)
+                if match is None:
+                    self.whitespace(pos)
+                    self.scalar()  # raises with the precise error
+                token = match.end(1)
+                if token != pos:
+                    self.whitespace(pos, token)
+                pos = match.end()
+                opener = match.group(2)
+                if opener == "[":
+                    stack.append(opener)
+                    after_open = True
+                    continue
+                if opener == "{":
+                    pos, closed = self.key(pos, allow_close=True)
+                    if not closed:
+                        stack.append(opener)
+                        continue
+                elif match.group(3) and not after_open:
+                    self.pos = token
+                    self.fail("Expecting value")
+                elif match.group(3):
+                    stack.pop()
+                after_open = False
+                expect_value = False
+                continue
+
+            if not stack:
+                break
+            match = SEPARATOR_TOKEN.match(text, pos)
+            token = match.end(1) if match else WHITESPACE.match(text, pos).end()
+            if token != pos:
+                self.whitespace(pos, token)
+            separator = match.group(2) if match else None
+            if separator != "," and separator != CLOSERS[stack[-1]]:
+                self.pos = token
+                self.fail("Expecting ',' delimiter")
+            pos = match.end()
+            if separator != ",":
+                stack.pop()
+                continue
+            if stack[-1] == "{":
+                pos, _ = self.key(pos, allow_close=False)
+            expect_value = True
+
+        self.whitespace(pos)
+        if self.pos != len(text):
+            self.fail("Extra data")
+
+    def whitespace(self, start: int, end: Optional[int] = None) -> None:
+        """Consume whitespace from ``start``, tracking lines and indentation."""
+
+        text = self.text
+        if end is None:
+            end = WHITESPACE.match(text, start).end()
+        self.pos = end
+        if end == start:
+            return
+        segment = text[start:end]
+        if "\r" in segment:
+            self.line += segment.count("\n") + segment.count("\r") - segment.count("\r\n")
+            self.line_start = start + max(segment.rfind("\n"), segment.rfind("\r")) + 1
+        elif "\n" in segment:
+            self.line += segment.count("\n")
+            self.line_start = start + segment.rfind("\n") + 1
+        elif start != self.line_start:
+            return
+        if end < len(text):
+            self.check_indentation(text[self.line_start : end])
+
+    def check_indentation(self, indent: str) -> None:
+        if "\t" in indent:
+            self.report(
+                "indentation",
+                indent.index("\t") + 1,
+                "indentation uses tabs instead of spaces",
+            )
+        elif len(indent) % 2:
+            self.report("indentation", 1, "indentation is not a multiple of two spaces")
+
+    def key(self, pos: int, *, allow_close: bool) -> tuple[int, bool]:
+        """Consume an object key and its colon starting at ``pos``.
+
+        Returns the position after the colon, or after the closing brace when
+        ``allow_close`` is set and the object is empty, plus whether the object
+        was closed.
+        """
+
+        match = KEY_TOKEN.match(self.text, pos)
+        if match is None or (match.group(2) and not allow_close):
+            self.whitespace(pos)
+            if match is not None:
+                self.fail("Expecting property name enclosed in double quotes")
+            self.key_error()
+        token = match.end(1)
+        if token != pos:
+            self.whitespace(pos, token)
+        if match.group(2):
+            return match.end(), True
+        before, after = match.group(3, 4)
+        colon = match.end(3)
+        if before.strip(" \t"):
+            self.whitespace(match.start(3), colon)
+        line, column = self.line, colon - self.line_start + 1
+        if after.strip(" \t"):
+            self.whitespace(colon + 1, match.end())
+        self.check_colon(before, after, line, column)
+        return match.end(), False
+
+    def key_error(self) -> None:
+        if not self.text.startswith('"', self.pos):
+            self.fail("Expecting property name enclosed in double quotes")
+        self.string()
+        self.whitespace(self.pos)
+        self.fail("Expecting ':' delimiter")
+
+    def check_colon(self, before: str, after: str, line: int, column: int) -> None:
+        if self.colon_failed or (before + after).strip(" \t"):
+            return  # stop after the first mismatch; ignore keys split across lines
+        if self.colon_style is None:
+            self.colon_style = (before, after, line, column)
+            return
+        expected_before, expected_after, _, _ = self.colon_style
+        if before != expected_before:
+            message = f"inconsistent spacing before ':' (found {before!r} vs {expected_before!r})"
+        elif after != expected_after:
+            message = f"inconsistent spacing after ':' (found {after!r} vs {expected_after!r})"
+        else:
+            return
+        self.colon_failed = True
+        self.diagnostics.append(Diagnostic("colon", line, column, message))
+
+    def finish_colon_style(self) -> None:
+        if self.colon_failed or self.colon_style is None:
+            return
+        before, after, line, column = self.colon_style
+        if after != " ":
+            message = f"expected a single space after ':' but found {after!r}"
+        elif before not in {"", " "}:
+            message = f"unexpected spacing before ':' ({before!r})"
+        else:
+            return
+        self.diagnostics.append(Diagnostic("colon", line, column, message))
+
+    def string(self) -> None:
+        match = STRING.match(self.text, self.pos)
+        if match is None:
+            self.fail_string()
+        self.pos = match.end()
+
+    def fail_string(self) -> None:
+        start = self.pos
+        cursor = start + 1
+        while cursor < len(self.text):
+            char = self.text[cursor]
+            if char == '"':
+                break
+            if char < " ":
+                self.pos = cursor
+                self.fail("Invalid control character at")
+            if char == "\\":
+                escape = self.text[cursor : cursor + 6]
+                if len(escape) == 1:
+                    break  # a backslash at the end of input leaves the string open
+                # json also rejects a \uXXXX escape that ends the input.
+                truncated = escape[1] == "u" and cursor + 6 >= len(self.text)
+                if truncated or not re.match(r'\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})', escape):
+                    # Positions follow ``json``: the "u" of a bad \uXXXX escape,
+                    # the backslash of any other bad escape.
+                    if escape[1] == "u":
+                        self.pos = cursor + 1
+                        self.fail("Invalid \\uXXXX escape")
+                    self.pos = cursor
+                    self.fail("Invalid \\escape")
+                cursor += 6 if escape[1] == "u" else 2
+                continue
+            cursor += 1
+        self.pos = start
+        self.fail("Unterminated string starting at")
+
+    def scalar(self) -> None:
+        if self.text.startswith('"', self.pos):
+            self.string()
+            return
+        match = CONSTANT.match(self.text, self.pos) or NUMBER.match(self.text, self.pos)
+        if match is None:
+            self.fail("Expecting value")
+        self.pos = match.end()
+
+    def report(self, kind: str, column: int, message: str) -> None:
+        self.diagnostics.append(Diagnostic(kind, self.line, column, message))
+
+    def fail(self, message: str) -> None:
+        column = self.pos - self.line_start + 1
+        raise _SyntaxError(Diagnostic("syntax", self.line, column, message))
+
+
+def scan_json(text: str) -> list[Diagnostic]:
+    """Check syntax, indentation and colon spacing of ``text`` in one pass.
+
+    Scanning stops at the first syntax error, which is reported after any
+    formatting problems found before it.
+    """
+
+    scanner = _Scanner(text)
+    try:
+        scanner.run()
+    except _SyntaxError as exc:
+        scanner.diagnostics.append(exc.diagnostic)
+        return scanner.diagnostics
+    scanner.finish_colon_style()
+    return scanner.diagnostics
+
+
+def _format(path: Path, diagnostics: Iterable[Diagnostic]) -> list[str]:
+    lines = []
+    for diagnostic in diagnostics:
+        if diagnostic.kind == "encoding":
+            lines.append(f"{path}: file is not valid UTF-8: {diagnostic.message}")
+            continue
+        prefix = "JSON parsing failed: " if diagnostic.kind == "syntax" else ""
+        lines.append(f"{path}:{diagnostic.line}:{diagnostic.column}: {prefix}{diagnostic.message}")
+    return lines
 
-        if not stripped:
-            continue  # ignore empty lines
 
-        if "\t" in leading:
-            print(f"{path}:{line_no}: indentation uses tabs instead of spaces")
-            success = False
-            continue
+def _report(path: Path, diagnostics: Iterable[Diagnostic]) -> bool:
+    lines = _format(path, diagnostics)
+    for line in lines:
+        print(line)
+    return not lines
 
-        if len(leading) % 2 != 0:
-            print(f"{path}:{line_no}: indentation is not a multiple of two spaces")
-            success = False
 
-    return success
+def _diagnose(path: Path) -> list[Diagnostic]:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError as exc:
+        return [Diagnostic("encoding", 0, 0, str(exc))]
+    return scan_json(text)
 
 
-COLON_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"(\s*):(\s*)')
+def check_file(path: Path) -> list[str]:
+    """Return the diagnostics for ``path`` as printable lines (empty when valid)."""
 
+    return _format(path, _diagnose(path))
 
-def _validate_colon_spacing(path: Path, text: str) -> bool:
-    before_style: str | None = None
-    after_style: str | None = None
-    success = True
 
-    for match in COLON_PATTERN.finditer(text):
-        before, after = match.groups()
-        if "\n" in before or "\n" in after:
-            continue  # Ignore multi-line constructs (should not occur in style)
+def validate_file(path: Path) -> bool:
+    lines = check_file(path)
+    for line in lines:
+        print(line)
+    return not lines
 
-        if before_style is None:
-            before_style = before
-        elif before != before_style:
-            print(
-                f"{path}: inconsistent spacing before ':' (found {before!r} vs {before_style!r})"
-            )
-            success = False
-            break
-
-        if after_style is None:
-            after_style = after
-        elif after != after_style:
-            print(
-                f"{path}: inconsistent spacing after ':' (found {after!r} vs {after_style!r})"
-            )
-            success = False
-            break
 
-    if success and after_style not in {None, " "}:
-        print(f"{path}: expected a single space after ':' but found {after_style!r}")
-        success = False
+def _validate_indentation(path: Path, text: str) -> bool:
+    return _report(path, (d for d in scan_json(text) if d.kind == "indentation"))
 
-    if success and before_style not in {None, "", " "}:
-        print(f"{path}: unexpected spacing before ':' ({before_style!r})")
-        success = False
 
+def _validate_colon_spacing(path: Path, text: str) -> bool:
+    return _report(path, (d for d in scan_json(text) if d.kind == "colon"))
+
+
+def validate_files(
+    files: list[Path], jobs: Optional[int] = None, cache: Optional[ResultCache] = None
+) -> bool:
+    """Validate ``files`` on ``jobs`` worker processes, printing in input order.
+
+    Files whose blob id has a result in ``cache`` are not read again; only the
+    remaining files are sent to the workers.
+    """
+
+    cache = cache or ResultCache.disabled()
+    keys = blob_ids(files) if cache.enabled else {}
+    hits: dict[Path, list[Diagnostic]] = {}
+    for path in files:
+        cached = cache.lookup(keys.get(path))
+        if cached is not None:
+            hits[path] = [Diagnostic(*item) for item in cached]
+    pending = [path for path in files if path not in hits]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(pending) < 2:
+        computed: Iterator[list[Diagnostic]] = map(_diagnose, pending)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(pending)))
+        chunksize = max(1, len(pending) // (jobs * 4))
+        computed = executor.map(_diagnose, pending, chunksize=chunksize)
+    success = True
+    try:
+        for path in files:
+            diagnostics = hits.get(path)
+            if diagnostics is None:
+                diagnostics = next(computed)
+                cache.store(keys.get(path), [list(item) for item in diagnostics])
+            lines = _format(path, diagnostics)
+            for line in lines:
+                print(line)
+            success &= not lines
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        cache.save()
     return success
 
 
@@ -114,17 +457,34 @@ def main(argv: list[str]) -> int:
     parser.add_argument(
         "paths",
         nargs="*",
-        default=[ROOT / "Sources", ROOT / "Tests"],
+        default=[ROOT / "Sources", ROOT / "Tests", ROOT / "FoundationUI"],
+        type=Path,
+        help="Directories or files to validate (default: Sources, Tests and FoundationUI).",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker process count (default: CPU count; 1 validates in-process).",
+    )
+    parser.add_argument(
+        "--cache-dir",
         type=Path,
-        help="Directories or files to validate (default: Sources and Tests).",
+        default=None,
+        help="Directory for the result cache (default: .git/validation-cache).",
     )
+    parser.add_argument("--no-cache", action="store_true", help="Revalidate every file.")
     args = parser.parse_args(argv)
 
-    success = True
-    for path in iter_json_files(args.paths):
-        success &= validate_file(path)
-
-    return 0 if success else 1
+    files = iter_json_files(args.paths)
+    if args.no_cache:
+        cache = ResultCache.disabled()
+    else:
+        cache = ResultCache.for_validator(
+            "validate_json", [Path(__file__)], cache_dir=args.cache_dir
+        )
+    return 0 if validate_files(files, args.jobs, cache) else 1
 
 
 if __name__ == "__main__":  # pragma: no cover - script entry point
@@ -1,12 +1,37 @@
 #!/usr/bin/env python3
-"""Minimal validator for MP4RABoxes.json."""
+"""Minimal validator for MP4RABoxes.json.
+
+The catalog is checked in a single streaming pass: bytes are decoded
+incrementally, line layout is checked as each chunk arrives, and box entries
+are decoded and validated one at a time, so only one chunk and one entry are
+held in memory.
+
+With ``--against <old catalog>`` the validator also reports which boxes were
+added, removed or modified relative to a previous version, and limits the
+per-entry checks to the added and modified boxes. File-level checks
+(encoding, line endings, indentation, top-level structure and duplicate
+types) always cover the whole file.
+
+A file that is not valid UTF-8 only reports the BOM check and the decoding
+error. A file that is not valid JSON reports the line-layout findings for the
+whole file and the parse error, but no entry errors from the part that did
+parse.
+
+The result of a plain run is cached per git blob id (see
+``validation_cache.py``), so an unchanged catalog is not parsed again.
+"""
 from __future__ import annotations
 
+import argparse
+import codecs
 import json
 import re
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from validation_cache import ResultCache, blob_ids
 
 DEFAULT_CATALOG_PATH = Path("Sources/ISOInspectorKit/Resources/MP4RABoxes.json")
 
@@ -15,142 +40,476 @@ UUID_DASHED_RE = re.compile(
     r"^[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}$"
 )
 BOM_UTF8 = b"\xef\xbb\xbf"
+CHUNK_SIZE = 64 * 1024
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+# Matches the indentation of a line indented by an odd number of spaces.
+ODD_INDENT_RE = re.compile(r"^(?:  )* (?! )", re.MULTILINE)
+STRING_FIELDS = ("name", "summary", "specification", "category")
+
+
+class CatalogError(Exception):
+    """Raised when the catalog cannot be decoded; scanning stops there."""
+
+
+class EncodingError(CatalogError):
+    """Raised when the catalog bytes are not valid UTF-8."""
+
+
+@dataclass
+class LayoutCheck:
+    """Encoding and line-layout findings collected while the file streams by."""
+
+    bom: bool = False
+    carriage_return: bool = False
+    tab: bool = False
+    indentation: List[str] = field(default_factory=list)
+    line_number: int = 1
+    partial: str = ""
+
+    def feed(self, text: str) -> None:
+        self.carriage_return = self.carriage_return or "\r" in text
+        self.tab = self.tab or "\t" in text
+        text = self.partial + text
+        cut = text.rfind("\n") + 1
+        self._check_lines(text[:cut])
+        self.partial = text[cut:]
+
+    def finish(self) -> None:
+        self._check_lines(self.partial)
+        self.partial = ""
+
+    def _check_lines(self, block: str) -> None:
+        line_number = self.line_number
+        position = 0
+        for match in ODD_INDENT_RE.finditer(block):
+            line_number += block.count("\n", position, match.start())
+            position = match.start()
+            self.indentation.append(
+                f"Line {line_number}: indentation must be in multiples of two spaces"
+                f" (found {len(match.group())})"
+            )
+        self.line_number += block.count("\n")
+
+    def errors(self) -> List[str]:
+        errors = []
+        if self.bom:
+            errors.append("File must not contain a UTF-8 BOM")
+        if self.carriage_return:
+            errors.append("File must use LF (\n) line endings")
+        if self.tab:
+            errors.append("File must not contain tab characters; use two-space indentation")
+        return errors + self.indentation
+
+
+@dataclass
+class CatalogChanges:
+    """Box-level differences between two catalog versions, keyed by type."""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[Tuple[str, List[str]]] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.modified)
+
+
+def iter_text(path: Path, layout: Optional[LayoutCheck] = None) -> Iterator[str]:
+    """Yield decoded chunks of ``path``, feeding each one to ``layout``."""
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    offset = 0
+    with path.open("rb") as handle:
+        for raw in iter(lambda: handle.read(CHUNK_SIZE), b""):
+            if offset == 0 and raw.startswith(BOM_UTF8):
+                if layout is not None:
+                    layout.bom = True
+                raw = raw[len(BOM_UTF8):]
+                offset = len(BOM_UTF8)
+            pending = len(decoder.getstate()[0])
+            try:
+                text = decoder.decode(raw)
+            except UnicodeDecodeError as exc:
+                raise EncodingError(
+                    f"File is not valid UTF-8: {exc.reason} at byte {offset - pending + exc.start}"
+                ) from exc
+            offset += len(raw)
+            if layout is not None:
+                layout.feed(text)
+            yield text
+    try:
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise EncodingError(f"File is not valid UTF-8: {exc.reason} at end of file") from exc
+    if layout is not None:
+        layout.finish()
+
+
+class JsonStream:
+    """Pull JSON tokens and values from a stream of text chunks.
+
+    Consumed text is dropped whenever more is read, while line and column
+    bookkeeping keeps error positions relative to the whole document.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self.chunks = chunks
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.dropped = 0
+        self.dropped_lines = 0
+        self.last_newline = -1
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.eof = True
+            return False
+        consumed = self.buffer[: self.pos]
+        newlines = consumed.count("\n")
+        if newlines:
+            self.dropped_lines += newlines
+            self.last_newline = self.dropped + consumed.rindex("\n")
+        self.dropped += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message: str, pos: Optional[int] = None) -> CatalogError:
+        pos = self.pos if pos is None else pos
+        newlines = self.buffer.count("\n", 0, pos)
+        if newlines:
+            line = self.dropped_lines + newlines + 1
+            column = pos - self.buffer.rindex("\n", 0, pos)
+        else:
+            line = self.dropped_lines + 1
+            column = self.dropped + pos - self.last_newline
+        return CatalogError(
+            f"JSON parse error: {message}: line {line} column {column} (char {self.dropped + pos})"
+        )
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+
+        if self.buffer[self.pos : self.pos + 1] not in " \t\n\r":
+            return self.buffer[self.pos]
+        while True:
+            self.pos = WHITESPACE_RE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, allowed: str, message: str) -> str:
+        char = self.peek()
+        if not char or char not in allowed:
+            raise self.error(message)
+        self.pos += 1
+        return char
+
+    def value(self) -> object:
+        if not self.peek():
+            raise self.error("Expecting value")
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if self.fill():
+                    continue
+                raise self.error(exc.msg, exc.pos) from None
+            # A number or literal that ends with the buffer may continue in
+            # the next chunk.
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+    def finish(self) -> None:
+        if self.peek():
+            raise self.error("Extra data")
+
+
+def iter_catalog(chunks: Iterator[str]) -> Iterator[Tuple[str, object, object]]:
+    """Yield ``(kind, key, value)`` events for a streamed catalog.
+
+    A ``boxes`` array yields ``("boxes", None, None)`` followed by
+    ``("box", index, entry)`` for every element, and every other top-level
+    member yields ``("member", name, value)``. A top-level value that is not
+    an object yields ``("document", None, value)`` and a ``boxes`` member that
+    is not an array yields ``("invalid-boxes", None, value)``.
+    """
+
+    stream = JsonStream(chunks)
+    if stream.peek() != "{":
+        document = stream.value()
+        stream.finish()
+        yield "document", None, document
+        return
 
+    stream.pos += 1
+    if stream.peek() == "}":
+        stream.pos += 1
+    else:
+        while True:
+            if stream.peek() != '"':
+                raise stream.error("Expecting property name enclosed in double quotes")
+            name = stream.value()
+            stream.expect(":", "Expecting ':' delimiter")
+            if name == "boxes" and stream.peek() == "[":
+                stream.pos += 1
+                yield "boxes", None, None
+                if stream.peek() == "]":
+                    stream.pos += 1
+                else:
+                    index = 0
+                    while True:
+                        yield "box", index, stream.value()
+                        index += 1
+                        if stream.expect(",]", "Expecting ',' delimiter") == "]":
+                            break
+            elif name == "boxes":
+                yield "invalid-boxes", None, stream.value()
+            else:
+                yield "member", name, stream.value()
+            if stream.expect(",}", "Expecting ',' delimiter") == "}":
+                break
+    stream.finish()
+
+
+def validate_provenance(provenance: object, errors: List[str]) -> None:
+    if not isinstance(provenance, dict):
+        errors.append("provenance must be an object if present")
+        return
 
-def validate_utf8(path: Path, errors: List[str]) -> str | None:
-    if not path.exists():
-        errors.append(f"File not found: {path}")
-        return None
+    fetched_at = provenance.get("fetchedAt")
+    if fetched_at is not None and (not isinstance(fetched_at, str) or not fetched_at.strip()):
+        errors.append("provenance.fetchedAt must be a non-empty string when provided")
 
-    raw = path.read_bytes()
-    if raw.startswith(BOM_UTF8):
-        errors.append("File must not contain a UTF-8 BOM")
-    try:
-        text = raw.decode("utf-8")
-    except UnicodeDecodeError as exc:
-        errors.append(f"File is not valid UTF-8: {exc}")
-        return None
+    sources = provenance.get("sources")
+    if sources is not None:
+        if not isinstance(sources, list) or not sources or not all(
+            isinstance(item, str) and item.strip() for item in sources
+        ):
+            errors.append("provenance.sources must be a non-empty array of strings when provided")
 
-    if "\r" in text:
-        errors.append("File must use LF (\n) line endings")
 
-    if "\t" in text:
-        errors.append("File must not contain tab characters; use two-space indentation")
+def box_identifier(entry: object) -> Optional[str]:
+    """Return the ``type`` of a box entry, or ``None`` when it has none."""
 
-    for idx, line in enumerate(text.splitlines(), start=1):
-        stripped = line.lstrip(" ")
-        indent_len = len(line) - len(stripped)
-        if indent_len and indent_len % 2 != 0:
-            errors.append(
-                f"Line {idx}: indentation must be in multiples of two spaces (found {indent_len})"
-            )
-    return text
+    if isinstance(entry, dict):
+        identifier = entry.get("type")
+        if isinstance(identifier, str) and identifier:
+            return identifier
+    return None
 
 
-def validate_structure(data: object, errors: List[str]) -> None:
-    if not isinstance(data, dict):
-        errors.append("Top-level JSON structure must be an object")
-        return
+def validate_entry(
+    index: int, entry: object, errors: List[str], identifier: Optional[str] = None
+) -> None:
+    """Check one box entry's fields; identifier uniqueness is checked by the caller."""
 
-    provenance = data.get("provenance")
-    if provenance is not None:
-        if not isinstance(provenance, dict):
-            errors.append("provenance must be an object if present")
-        else:
-            fetched_at = provenance.get("fetchedAt")
-            if fetched_at is not None and (
-                not isinstance(fetched_at, str) or not fetched_at.strip()
-            ):
-                errors.append("provenance.fetchedAt must be a non-empty string when provided")
-
-            sources = provenance.get("sources")
-            if sources is not None:
-                if not isinstance(sources, list) or not sources or not all(
-                    isinstance(item, str) and item.strip() for item in sources
-                ):
-                    errors.append(
-                        "provenance.sources must be a non-empty array of strings when provided"
-                    )
-
-    boxes = data.get("boxes")
-    if not isinstance(boxes, list):
-        errors.append("boxes must be an array of box entries")
+    context = f"[index: {index}]"
+    if not isinstance(entry, dict):
+        errors.append(f"{context} Box entry must be an object")
         return
 
-    seen_identifiers: set[str] = set()
-
-    for index, entry in enumerate(boxes):
-        context = f"[index: {index}]"
-        if not isinstance(entry, dict):
-            errors.append(f"{context} Box entry must be an object")
-            continue
+    identifier = identifier or box_identifier(entry)
+    if identifier is None:
+        errors.append(f"{context} type must be a non-empty string")
+        return
 
-        identifier = entry.get("type")
-        if not isinstance(identifier, str) or not identifier:
-            errors.append(f"{context} type must be a non-empty string")
-            continue
-
-        if identifier in seen_identifiers:
-            errors.append(f"Duplicate type identifier detected: {identifier}")
-            continue
-        seen_identifiers.add(identifier)
-
-        if len(identifier) == 4 and FOURCC_RE.match(identifier):
-            pass
-        elif identifier == "uuid":
-            uuid_value = entry.get("uuid")
-            if not isinstance(uuid_value, str) or not UUID_DASHED_RE.match(uuid_value):
-                errors.append(
-                    f"{context} uuid entries must include a UUID field in dashed hexadecimal form"
-                )
-        else:
+    if len(identifier) == 4 and FOURCC_RE.match(identifier):
+        pass
+    elif identifier == "uuid":
+        uuid_value = entry.get("uuid")
+        if not isinstance(uuid_value, str) or not UUID_DASHED_RE.match(uuid_value):
             errors.append(
-                f"{context} type must be a FourCC (4 printable ASCII characters) or the literal 'uuid'"
+                f"{context} uuid entries must include a UUID field in dashed hexadecimal form"
             )
+    else:
+        errors.append(
+            f"{context} type must be a FourCC (4 printable ASCII characters) or the literal 'uuid'"
+        )
 
-        for field in ("name", "summary", "specification"):
-            if field in entry:
-                value = entry[field]
-                if not isinstance(value, str) or not value.strip():
-                    errors.append(f"{context} {field} must be a non-empty string when present")
-
-        if "category" in entry:
-            value = entry["category"]
+    for name in STRING_FIELDS:
+        if name in entry:
+            value = entry[name]
             if not isinstance(value, str) or not value.strip():
-                errors.append(f"{context} category must be a non-empty string when present")
+                errors.append(f"{context} {name} must be a non-empty string when present")
 
-        if "flags" in entry and not isinstance(entry["flags"], str):
-            errors.append(f"{context} flags must be stored as a string")
+    if "flags" in entry and not isinstance(entry["flags"], str):
+        errors.append(f"{context} flags must be stored as a string")
 
-        if "version" in entry and not isinstance(entry["version"], int):
-            errors.append(f"{context} version must be an integer")
+    if "version" in entry and not isinstance(entry["version"], int):
+        errors.append(f"{context} version must be an integer")
 
 
+def load_box_index(path: Path) -> Dict[str, dict]:
+    """Stream the catalog at ``path`` into a ``{type: entry}`` map.
 
-def load_json(text: str, errors: List[str]) -> object | None:
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:
-        errors.append(f"JSON parse error: {exc}")
-        return None
+    Raises ``CatalogError`` when the file cannot be read or decoded.
+    """
+
+    if not path.exists():
+        raise CatalogError(f"File not found: {path}")
+    boxes: Dict[str, dict] = {}
+    for kind, _, value in iter_catalog(iter_text(path)):
+        identifier = box_identifier(value) if kind == "box" else None
+        if identifier is not None:
+            boxes.setdefault(identifier, value)
+    return boxes
 
 
-def main(argv: List[str]) -> int:
-    if len(argv) == 1:
-        path = DEFAULT_CATALOG_PATH
-    elif len(argv) == 2:
-        path = Path(argv[1])
-    else:
-        print("Usage: validate_mp4ra_minimal.py [path-to-MP4RABoxes.json]", file=sys.stderr)
-        return 2
+def encoding_errors(layout: LayoutCheck, exc: EncodingError) -> List[str]:
+    return (["File must not contain a UTF-8 BOM"] if layout.bom else []) + [str(exc)]
+
+
+def check_catalog(
+    path: Path, baseline: Optional[Dict[str, dict]] = None
+) -> Tuple[List[str], Optional[CatalogChanges]]:
+    """Validate the catalog at ``path`` in one streaming pass.
+
+    When ``baseline`` (a ``{type: entry}`` map of the previous catalog) is
+    given, entry checks only run on added and modified boxes and the box-level
+    changes are returned alongside the errors.
+    """
+
+    if not path.exists():
+        return [f"File not found: {path}"], None
 
     errors: List[str] = []
+    layout = LayoutCheck()
+    chunks = iter_text(path, layout)
+    changes = CatalogChanges() if baseline is not None else None
+    seen_identifiers: Set[str] = set()
+    has_boxes = False
+    is_object = True
+    try:
+        for kind, key, value in iter_catalog(chunks):
+            if kind == "document":
+                is_object = False
+                errors.append("Top-level JSON structure must be an object")
+            elif kind == "boxes":
+                has_boxes = True
+            elif kind == "invalid-boxes":
+                has_boxes = True
+                errors.append("boxes must be an array of box entries")
+            elif kind == "member":
+                if key == "provenance" and value is not None:
+                    validate_provenance(value, errors)
+            else:
+                identifier = box_identifier(value)
+                if identifier is not None:
+                    if identifier in seen_identifiers:
+                        errors.append(f"Duplicate type identifier detected: {identifier}")
+                        continue
+                    seen_identifiers.add(identifier)
+                if changes is not None and identifier is not None:
+                    previous = baseline.get(identifier)
+                    if previous is None:
+                        changes.added.append(identifier)
+                    elif previous != value:
+                        fields = sorted(
+                            name
+                            for name in previous.keys() | value.keys()
+                            if previous.get(name) != value.get(name)
+                        )
+                        changes.modified.append((identifier, fields))
+                    else:
+                        continue
+                validate_entry(key, value, errors, identifier)
+        if is_object and not has_boxes:
+            errors.append("boxes must be an array of box entries")
+    except EncodingError as exc:
+        return encoding_errors(layout, exc), None
+    except CatalogError as exc:
+        # Entries of a document that does not parse are not diagnosed, but the
+        # rest of the file still goes through the line-layout checks.
+        try:
+            for _ in chunks:
+                pass
+        except EncodingError as encoding_exc:
+            return encoding_errors(layout, encoding_exc), None
+        return layout.errors() + [str(exc)], None
+    if changes is not None:
+        changes.removed = sorted(baseline.keys() - seen_identifiers)
+    return layout.errors() + errors, changes
+
+
+def validate_catalog(path: Path, cache: ResultCache | None = None) -> List[str]:
+    """Return the validation errors for the catalog at ``path``."""
+
+    cache = cache or ResultCache.disabled()
+    key = blob_ids([path]).get(path) if cache.enabled else None
+    cached = cache.lookup(key)
+    if cached is not None:
+        return cached
+
+    errors, _ = check_catalog(path)
+    cache.store(key, errors)
+    cache.save()
+    return errors
+
+
+def print_changes(changes: CatalogChanges, against: Path) -> None:
+    if changes.empty:
+        print(f"No box changes against {against}")
+        return
+    print(
+        f"Changes against {against}: {len(changes.added)} added, "
+        f"{len(changes.removed)} removed, {len(changes.modified)} modified"
+    )
+    for identifier in changes.added:
+        print(f" + {identifier}")
+    for identifier in changes.removed:
+        print(f" - {identifier}")
+    for identifier, fields in changes.modified:
+        print(f" ~ {identifier} ({', '.join(fields)})")
 
-    text = validate_utf8(path, errors)
-    data = load_json(text, errors) if text is not None else None
 
-    if data is not None:
-        validate_structure(data, errors)
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog=Path(argv[0]).name, description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "path",
+        nargs="?",
+        type=Path,
+        default=DEFAULT_CATALOG_PATH,
+        help=f"Catalog to validate (default: {DEFAULT_CATALOG_PATH}).",
+    )
+    parser.add_argument(
+        "--against",
+        type=Path,
+        default=None,
+        help="Previous catalog; report changed boxes and validate only those entries.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the result cache (default: .git/validation-cache).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always revalidate the catalog.")
+    args = parser.parse_args(argv[1:])
+
+    if args.against is not None:
+        try:
+            baseline = load_box_index(args.against)
+        except CatalogError as exc:
+            print(f"Cannot read {args.against}: {exc}", file=sys.stderr)
+            return 2
+        errors, changes = check_catalog(args.path, baseline)
+        if changes is not None:
+            print_changes(changes, args.against)
+    else:
+        if args.no_cache:
+            cache = ResultCache.disabled()
+        else:
+            cache = ResultCache.for_validator(
+                "validate_mp4ra_minimal", [Path(__file__)], cache_dir=args.cache_dir
+            )
+        errors = validate_catalog(args.path, cache)
 
     if errors:
         print("Validation FAILED:")
@@ -0,0 +1,214 @@
+"""Incremental result cache shared by the repository validators.
+
+``validate_json.py``, ``check_yaml.py`` and ``validate_mp4ra_minimal.py`` store
+their per-file results here so repeated pre-commit and CI runs only revalidate
+files whose content changed.
+
+Results are keyed by the file's git blob id. Tracked files that are unchanged
+in the work tree take the id straight from the index; modified and untracked
+files are hashed the same way git does (SHA-1 of ``blob <size>\\0<content>``),
+so a cached result stays valid once the file is committed.
+
+Each validator keeps its own cache file under ``.git/validation-cache/``. The
+entries live in a namespace derived from the validator's source code and
+configuration, so editing a validator or changing its options invalidates its
+results without any manual version bump. Saving keeps only the entries looked
+up or stored during the run, so blobs that are no longer validated drop out
+instead of accumulating forever.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE_VERSION = 1
+CACHE_DIRNAME = "validation-cache"
+
+
+def default_cache_dir(root: Path = ROOT) -> Optional[Path]:
+    """Return ``<git-dir>/validation-cache`` for ``root``, or ``None`` outside git."""
+
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), "rev-parse", "--absolute-git-dir"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return Path(result.stdout.strip()) / CACHE_DIRNAME
+
+
+def blob_id(data: bytes) -> str:
+    """Return the git blob id of ``data``."""
+
+    hasher = hashlib.sha1(b"blob %d\0" % len(data))
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def _git_lines(root: Path, *args: str) -> Optional[list[str]]:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), *args], capture_output=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [line for line in result.stdout.decode("utf-8", "surrogateescape").split("\0") if line]
+
+
+def _clean_index_ids(root: Path) -> dict[str, str]:
+    """Return ``{relative path: blob id}`` for tracked files unchanged on disk.
+
+    ``git diff-files`` compares the work tree with the index using cached stat
+    data, so a merely touched file is reported as modified and simply gets
+    hashed; a stale entry is never returned.
+    """
+
+    staged = _git_lines(root, "ls-files", "-s", "-z")
+    modified = _git_lines(root, "diff-files", "--name-only", "-z")
+    if staged is None or modified is None:
+        return {}
+    dirty = set(modified)
+    ids = {}
+    for record in staged:
+        info, _, name = record.partition("\t")
+        _, object_id, stage = info.split(" ")
+        if stage == "0" and name not in dirty:
+            ids[name] = object_id
+    return ids
+
+
+def blob_ids(paths: Iterable[Path], root: Path = ROOT) -> dict[Path, str]:
+    """Return the blob id of every readable file in ``paths``.
+
+    Missing or unreadable files are left out, so callers always revalidate
+    (and report) them.
+    """
+
+    paths = list(paths)
+    root = root.resolve()
+    index = _clean_index_ids(root) if paths else {}
+    ids = {}
+    for path in paths:
+        try:
+            relative = path.resolve().relative_to(root).as_posix()
+        except ValueError:
+            relative = None
+        if relative in index:
+            ids[path] = index[relative]
+            continue
+        try:
+            ids[path] = blob_id(path.read_bytes())
+        except OSError:
+            continue
+    return ids
+
+
+def _digest_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class ResultCache:
+    """Per-validator map of blob id to a JSON-serialisable result.
+
+    Only the current namespace is kept on disk; results from an older
+    validator version or a different configuration, and results for blobs not
+    touched by this run, are discarded on save.
+    """
+
+    def __init__(self, path: Optional[Path], namespace: str) -> None:
+        self.path = path
+        self.namespace = namespace
+        self.results: dict[str, object] = {}
+        self.used: set[str] = set()
+        self.dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            if data.get("version") == CACHE_VERSION and data.get("namespace") == namespace:
+                self.results = data.get("results", {})
+
+    @classmethod
+    def for_validator(
+        cls,
+        name: str,
+        sources: Iterable[Path],
+        config: object = None,
+        cache_dir: Optional[Path] = None,
+    ) -> "ResultCache":
+        """Open the cache for validator ``name``.
+
+        ``sources`` are the files whose code decides the result (the validator
+        script itself plus any helpers); ``config`` is any JSON-serialisable
+        description of the options that affect it. When ``cache_dir`` is
+        ``None`` the cache lives under the repository's git directory, and is
+        disabled outside a git checkout.
+        """
+
+        fingerprint = {
+            "python": list(sys.version_info[:2]),
+            "sources": [_digest_file(Path(source)) for source in (*sources, __file__)],
+            "config": config,
+        }
+        namespace = hashlib.sha256(
+            json.dumps(fingerprint, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        path = cache_dir / f"{name}.json" if cache_dir is not None else None
+        return cls(path, namespace)
+
+    @classmethod
+    def disabled(cls) -> "ResultCache":
+        """Return a cache that never hits and never writes."""
+
+        return cls(None, "")
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def lookup(self, key: Optional[str]) -> Optional[object]:
+        if key is None or not self.enabled:
+            return None
+        self.used.add(key)
+        return self.results.get(key)
+
+    def store(self, key: Optional[str], result: object) -> None:
+        if key is None or not self.enabled:
+            return
+        self.used.add(key)
+        if self.results.get(key) != result:
+            self.results[key] = result
+            self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        results = {key: value for key, value in self.results.items() if key in self.used}
+        if not self.dirty and len(results) == len(self.results):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(
+                json.dumps(
+                    {"version": CACHE_VERSION, "namespace": self.namespace, "results": results}
+                ),
+                encoding="utf-8",
+            )
+            temp_path.replace(self.path)
+        except OSError:
+            return  # a read-only checkout simply runs uncached next time
+        self.results = results
+        self.dirty = False